@@ -874,6 +874,45 @@ def login() -> None:
                 sys.exit(1)
 
 
+# =============================================================================
+# Browser Server Command
+# =============================================================================
+
+@main.command("browser-server")
+@click.option(
+    "--port", "-p",
+    default=9222,
+    type=int,
+    help="Remote debugging port (default: 9222)"
+)
+@click.option(
+    "--headless",
+    is_flag=True,
+    help="Start the browser without a window"
+)
+def browser_server(port: int, headless: bool) -> None:
+    """
+    Start a long-lived browser that NotebookLM commands attach to.
+
+    The browser uses the saved login profile and keeps running after
+    this command exits. Set NOTEBOOKLM_CDP_ENDPOINT to the printed
+    endpoint so upload/download-video skip launching their own browser.
+    """
+    from .nblm_bot import launch_cdp_server
+
+    logger = get_logger()
+
+    try:
+        endpoint = launch_cdp_server(port=port, headless=headless)
+    except Exception as e:
+        logger.exception("Browser server failed to start")
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✅ Browser listening at {endpoint}")
+    click.echo(f"   export NOTEBOOKLM_CDP_ENDPOINT={endpoint}")
+
+
 # =============================================================================
 # Publish Command (Phase 3)
 # =============================================================================
@@ -1079,53 +1118,65 @@ def publish_douyin(
         
     click.echo(f"🚀 Publishing {len(papers)} videos to Douyin...")
     
-    with DouyinBot(headless=not headful) as bot:
-        # Check login first (only once at the beginning)
-        if not bot.is_logged_in():
-            click.echo("❌ Not logged into Douyin. Please run 'apd douyin-login' first.", err=True)
-            sys.exit(1)
+    # Collect publishable videos first; the bot then publishes them in one session
+    total_papers = len(papers)
+    batch = []
+    videos = []
+    for paper in papers:
+        if not paper.video_path:
+            click.echo(f"⏭️  Skipping {paper.paper_id}: No video path found.")
+            continue
             
-        success_count = 0
-        total_papers = len(papers)
+        video_path = Path(paper.video_path)
+        if not video_path.exists():
+            click.echo(f"❌ Skipping {paper.paper_id}: Video file not found at {video_path}")
+            continue
         
-        for idx, paper in enumerate(papers, 1):
-            click.echo(f"\n{'='*50}")
-            click.echo(f"📹 Processing video {idx}/{total_papers}")
-            
-            if not paper.video_path:
-                click.echo(f"⏭️  Skipping {paper.paper_id}: No video path found.")
-                continue
-                
-            video_path = Path(paper.video_path)
-            if not video_path.exists():
-                click.echo(f"❌ Skipping {paper.paper_id}: Video file not found at {video_path}")
-                continue
-                
-            click.echo(f"📤 Uploading {paper.paper_id}: {paper.title}")
-            
-            # Construct description - use summary if available, otherwise fallback to template
-            if paper.summary:
-                description = f"{paper.summary}\n\narXiv: {paper.paper_id}"
-            else:
-                description = f"arXiv: {paper.paper_id}\n{paper.title}\n\nAutomated digest generated by Auto-Paper-Digest."
-            tags = ["AI", "Research", "Arxiv", "MachineLearning"]
+        # Construct description - use summary if available, otherwise fallback to template
+        if paper.summary:
+            description = f"{paper.summary}\n\narXiv: {paper.paper_id}"
+        else:
+            description = f"arXiv: {paper.paper_id}\n{paper.title}\n\nAutomated digest generated by Auto-Paper-Digest."
+        tags = ["AI", "Research", "Arxiv", "MachineLearning"]
+        
+        batch.append(paper)
+        # Douyin title limit is 30 chars
+        videos.append((video_path, paper.title[:30], description, tags))
+    
+    # Report each video as the bot reaches it, so the semi-automatic pauses
+    # show which paper is on screen
+    def on_start(idx: int) -> None:
+        paper = batch[idx]
+        click.echo(f"\n{'='*50}")
+        click.echo(f"📹 Processing video {idx + 1}/{len(batch)}")
+        click.echo(f"📤 Uploading {paper.paper_id}: {paper.title}")
+    
+    def on_result(idx: int, ok: bool) -> None:
+        if ok:
+            click.echo(f"✅ Successfully published {batch[idx].paper_id}!")
+        else:
+            click.echo(f"❌ Failed to publish {batch[idx].paper_id}.")
+    
+    success_count = 0
+    if videos:
+        with DouyinBot(headless=not headful) as bot:
+            # Check login first (only once at the beginning)
+            if not bot.is_logged_in():
+                click.echo("❌ Not logged into Douyin. Please run 'apd douyin-login' first.", err=True)
+                sys.exit(1)
             
-            # Skip login check since we already verified at the start
-            if bot.publish_video(
-                video_path=video_path,
-                title=paper.title[:30],  # Douyin title limit is 30 chars
-                description=description,
-                tags=tags,
-                skip_login_check=True,  # Skip login check for batch publishing
-                auto_publish=auto_publish  # Use the --auto-publish flag
-            ):
-                click.echo(f"✅ Successfully published {paper.paper_id}!")
-                success_count += 1
-            else:
-                click.echo(f"❌ Failed to publish {paper.paper_id}.")
-                
-        click.echo()
-        click.echo(f"🎉 Douyin publish complete: {success_count}/{total_papers} successful.")
+            # Skip per-video login checks since we already verified at the start
+            results = bot.publish_many(
+                videos,
+                skip_login_check=True,
+                auto_publish=auto_publish,
+                on_start=on_start,
+                on_result=on_result
+            )
+        success_count = sum(results)
+    
+    click.echo()
+    click.echo(f"🎉 Douyin publish complete: {success_count}/{total_papers} successful.")
 
 
 # =============================================================================
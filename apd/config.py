@@ -21,6 +21,8 @@ VIDEO_DIR = DATA_DIR / "videos"
 SLIDES_DIR = DATA_DIR / "slides"
 DIGEST_DIR = DATA_DIR / "digests"
 PROFILE_DIR = DATA_DIR / "profiles"
+PAGE_CACHE_DIR = DATA_DIR / "page_cache"  # gzipped HTTP page cache
+ASSET_CACHE_DIR = DATA_DIR / "asset_cache"  # NotebookLM static JS/CSS
 
 # Database
 DB_PATH = DATA_DIR / "apd.db"
@@ -43,6 +45,16 @@ ARXIV_PDF_URL = "https://export.arxiv.org/pdf/{paper_id}.pdf"
 
 # NotebookLM
 NOTEBOOKLM_URL = "https://notebooklm.google.com"
+# 可选：连接已在运行的 Chromium（见 apd.nblm_bot.launch_cdp_server），如 http://127.0.0.1:9222
+NOTEBOOKLM_CDP_ENDPOINT = os.getenv("NOTEBOOKLM_CDP_ENDPOINT") or None
+# 调试模式：失败时保存截图/trace（默认关闭，避免正常流程中的截图编码与写盘）
+NOTEBOOKLM_DEBUG = os.getenv("NOTEBOOKLM_DEBUG", "false").lower() == "true"
+# 不加载图片/字体/媒体，减少每个页面的流量与渲染开销（界面异常时可设为 false）
+NOTEBOOKLM_BLOCK_RESOURCES = os.getenv("NOTEBOOKLM_BLOCK_RESOURCES", "true").lower() == "true"
+# 缓存 gstatic 上带版本号的静态 JS/CSS，重复运行时不再下载
+NOTEBOOKLM_ASSET_CACHE = os.getenv("NOTEBOOKLM_ASSET_CACHE", "true").lower() == "true"
+# 同时处理的论文数（每篇一个标签页）：PDF 解析/视频生成在服务端进行，可并行等待
+NOTEBOOKLM_CONCURRENCY = max(1, int(os.getenv("NOTEBOOKLM_CONCURRENCY", "3")))
 
 # GitHub Trending
 GITHUB_TRENDING_URL = "https://github.com/trending"
@@ -195,6 +207,11 @@ class DeduplicationConfig:
     # 性能配置
     ENABLE_SEMANTIC_DEDUP = os.getenv("ENABLE_SEMANTIC_DEDUP", "true").lower() == "true"
     BATCH_SIZE = int(os.getenv("DEDUP_BATCH_SIZE", "100"))  # 批处理大小
+    # 论文数达到该值时用MinHash-LSH分桶，只比较候选对（需安装datasketch）
+    LSH_MIN_PAPERS = int(os.getenv("DEDUP_LSH_MIN_PAPERS", "1000"))
+    # 摘要数达到该值时用FAISS近邻索引（int8量化）代替N×N相似度矩阵（需安装faiss-cpu）
+    SEMANTIC_ANN_MIN_PAPERS = int(os.getenv("DEDUP_ANN_MIN_PAPERS", "1000"))
+    SEMANTIC_TOP_K = int(os.getenv("DEDUP_SEMANTIC_TOP_K", "10"))  # 每篇检索的近邻数
 
 
 # =============================================================================
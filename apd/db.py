@@ -4,13 +4,18 @@ Database module for Auto Paper Digest.
 Provides SQLite-based paper tracking with status management.
 """
 
+import atexit
+import json
 import re
 import sqlite3
+import threading
+import weakref
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Callable, Iterator, Optional
 
 from .config import DB_PATH, Status
 from .utils import get_logger, now_iso
@@ -60,7 +65,9 @@ def _build_week_id_clause(week_id: str) -> tuple[str, list]:
     Build SQL clause for week_id matching.
     
     If week_id is in week format (YYYY-WW), matches both the week format
-    and all daily dates within that week.
+    and all daily dates within that week. The ids are bound as a single
+    JSON array so the SQL text stays constant across weeks and the
+    prepared statement can be reused from the connection's cache.
     
     Args:
         week_id: Week or date identifier
@@ -72,18 +79,36 @@ def _build_week_id_clause(week_id: str) -> tuple[str, list]:
         # Match both week format and all daily dates in that week
         dates = _get_dates_for_week(week_id)
         all_ids = [week_id] + dates
-        placeholders = ",".join("?" * len(all_ids))
-        return f"week_id IN ({placeholders})", all_ids
+        return "week_id IN (SELECT value FROM json_each(?))", [json.dumps(all_ids)]
     else:
         # Just match the exact value
         return "week_id = ?", [week_id]
 
 
+def week_id_prefix_clause(prefix: str) -> tuple[str, list]:
+    """
+    Build SQL clause matching every week_id that starts with prefix.
+
+    "2026-02" matches the week itself and all dates 2026-02-DD. GLOB (not
+    LIKE) keeps the match case-sensitive, so SQLite can serve it from the
+    week_id indexes as a range scan.
+
+    Args:
+        prefix: Leading part of a week or date identifier
+
+    Returns:
+        Tuple of (SQL clause, parameters list)
+    """
+    # 转义 GLOB 通配符，前缀按字面匹配
+    escaped = re.sub(r"([*?\[])", r"[\1]", prefix)
+    return "week_id GLOB ?", [f"{escaped}*"]
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Represents a paper/content record in the database."""
     paper_id: str
@@ -94,7 +119,7 @@ class Paper:
     hf_url: Optional[str] = None
     pdf_url: Optional[str] = None
     pdf_path: Optional[str] = None
-    pdf_sha256: Optional[str] = None
+    pdf_sha256: Optional[bytes] = None           # 32字节原始SHA256摘要
     notebooklm_note_name: Optional[str] = None
     video_path: Optional[str] = None
     slides_path: Optional[str] = None
@@ -150,273 +175,432 @@ class Paper:
     updated_at: Optional[str] = None
 
 
+@lru_cache(maxsize=None)
+def _compile_paper_converter(columns: tuple[str, ...]) -> Callable[[sqlite3.Row], Paper]:
+    """
+    Generate a specialized row -> Paper function for a column layout.
+
+    The generated code assigns each slot straight from its column index,
+    skipping the keyword parsing of the dataclass __init__. Fields missing
+    from the layout get their dataclass default; unknown columns are ignored.
+
+    Args:
+        columns: Column names in cursor order
+
+    Returns:
+        Function converting one row with that layout into a Paper
+    """
+    index = {name: i for i, name in enumerate(columns)}
+    namespace: dict = {"Paper": Paper}
+    lines = ["def from_row(r):", "    p = Paper.__new__(Paper)"]
+
+    for f in fields(Paper):
+        if f.name in index:
+            lines.append(f"    p.{f.name} = r[{index[f.name]}]")
+        elif f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            lines.append(f"    p.{f.name} = _default_{f.name}")
+        else:
+            raise ValueError(f"Column missing for required Paper field: {f.name}")
+
+    lines.append("    return p")
+    exec("\n".join(lines), namespace)
+    return namespace["from_row"]
+
+
+def paper_converter(cursor: sqlite3.Cursor) -> Callable[[sqlite3.Row], Paper]:
+    """
+    Get the row -> Paper converter for the cursor's current result set.
+
+    Args:
+        cursor: Cursor that has executed a SELECT over papers columns
+
+    Returns:
+        Function converting one result row into a Paper
+    """
+    return _compile_paper_converter(tuple(d[0] for d in cursor.description))
+
+
+# Explicit papers projection in Paper field order, so rows convert
+# positionally without going through the cursor description.
+_PAPER_COLUMNS = tuple(f.name for f in fields(Paper))
+_PAPER_SELECT = ", ".join(_PAPER_COLUMNS)
+_row_to_paper = _compile_paper_converter(_PAPER_COLUMNS)
+
+
 # =============================================================================
 # Database Management
 # =============================================================================
 
+# Applied once when a connection is opened. WAL + synchronous=NORMAL turns
+# each commit into a WAL append instead of a full fsync of the database.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",    # 64 MB
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open and configure a new SQLite connection to DB_PATH."""
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # A larger statement cache keeps the per-column UPDATE/SELECT variants prepared
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Thread-local connection pool: each thread keeps one open connection so
+# the page cache and prepared-statement cache stay warm across calls.
+# 线程结束时 threading.local 释放持有者，finalizer 随之关闭连接，
+# 避免线程池的工作线程留下越来越多的连接。
+_local = threading.local()
+_pool_lock = threading.Lock()
+_pool: list[sqlite3.Connection] = []
+_pool_generation = 0
+
+
+class _ThreadConnection:
+    """One thread's pooled connection; closed when the thread goes away."""
+
+    __slots__ = ("conn", "generation", "path", "depth", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.generation = _pool_generation
+        self.path = DB_PATH
+        self.depth = 0
+        weakref.finalize(self, _discard_connection, conn)
+
+
+def _discard_connection(conn: sqlite3.Connection) -> None:
+    """Drop a connection from the pool and close it."""
+    with _pool_lock:
+        if conn in _pool:
+            _pool.remove(conn)
+    conn.close()
+
+
+def _thread_connection() -> _ThreadConnection:
+    """Get this thread's connection holder, opening the connection on first use."""
+    holder = getattr(_local, "holder", None)
+    if holder is None or holder.generation != _pool_generation or holder.path != DB_PATH:
+        conn = _open_connection()
+        with _pool_lock:
+            _pool.append(conn)
+        holder = _local.holder = _ThreadConnection(conn)
+    return holder
+
+
+def _pooled_connection() -> sqlite3.Connection:
+    """Get this thread's connection, opening it on first use."""
+    return _thread_connection().conn
+
+
+def close_connections() -> None:
+    """Close all pooled connections; the next get_connection() reopens."""
+    global _pool_generation
+
+    with _pool_lock:
+        for conn in _pool:
+            conn.close()
+        _pool.clear()
+        _pool_generation += 1
+    _local.holder = None
+
+
+atexit.register(close_connections)
+
+
 @contextmanager
 def get_connection() -> Iterator[sqlite3.Connection]:
     """
     Context manager for database connections.
     
+    Hands out the calling thread's pooled connection. Only the outermost
+    context commits or rolls back, so nested calls share one transaction.
+    
     Yields:
         SQLite connection with row factory enabled
     """
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    holder = _thread_connection()
+    conn = holder.conn
+    holder.depth += 1
     try:
         yield conn
-        conn.commit()
+        if holder.depth == 1:
+            conn.commit()
     except Exception:
-        conn.rollback()
+        if holder.depth == 1:
+            conn.rollback()
         raise
     finally:
-        conn.close()
+        holder.depth -= 1
 
 
-def init_db() -> None:
-    """Initialize the database schema."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Create papers table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS papers (
-                paper_id TEXT PRIMARY KEY,
-                week_id TEXT NOT NULL,
-                title TEXT,
-                hf_url TEXT,
-                pdf_url TEXT,
-                pdf_path TEXT,
-                pdf_sha256 TEXT,
-                notebooklm_note_name TEXT,
-                video_path TEXT,
-                slides_path TEXT,
-                summary TEXT,
-                status TEXT DEFAULT 'NEW',
-                retry_count INTEGER DEFAULT 0,
-                last_error TEXT,
-                updated_at TEXT
-            )
-        """)
-        
-        # Add slides_path column if it doesn't exist (migration for existing databases)
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN slides_path TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Add summary column if it doesn't exist (migration for existing databases)
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN summary TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-
-        # === 新增字段迁移 ===
+# Bump when the papers table layout changes; older databases are rebuilt
+# by _migrate_database() instead of being patched column by column.
+SCHEMA_VERSION = 1
 
-        # 内容类型和源
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN content_type TEXT DEFAULT 'PAPER'")
-        except sqlite3.OperationalError:
-            pass
-
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN source_url TEXT")
-        except sqlite3.OperationalError:
-            pass
 
-        # GitHub 相关字段
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN github_stars INTEGER")
-        except sqlite3.OperationalError:
-            pass
-
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN github_language TEXT")
-        except sqlite3.OperationalError:
-            pass
-
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN github_description TEXT")
-        except sqlite3.OperationalError:
-            pass
+def _create_schema(cursor: sqlite3.Cursor) -> None:
+    """
+    Create all tables and indexes in their current layout.
 
-        # 新闻相关字段
+    Args:
+        cursor: Cursor on the target database
+    """
+    # Create papers table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS papers (
+            paper_id TEXT PRIMARY KEY,
+            week_id TEXT NOT NULL,
+            title TEXT,
+            hf_url TEXT,
+            pdf_url TEXT,
+            pdf_path TEXT,
+            pdf_sha256 BLOB,
+            notebooklm_note_name TEXT,
+            video_path TEXT,
+            slides_path TEXT,
+            summary TEXT,
+            -- 内容类型和源
+            content_type TEXT DEFAULT 'PAPER',
+            source_url TEXT,
+            -- GitHub 相关字段
+            github_stars INTEGER,
+            github_language TEXT,
+            github_description TEXT,
+            -- 新闻相关字段
+            news_source TEXT,
+            news_url TEXT,
+            -- 发布状态字段
+            bilibili_published INTEGER DEFAULT 0,
+            douyin_published INTEGER DEFAULT 0,
+            xiaohongshu_published INTEGER DEFAULT 0,
+            xiaohongshu_note_id TEXT,
+            xiaohongshu_url TEXT,
+            -- 质量控制字段
+            quality_score REAL DEFAULT 0.0,
+            citation_score REAL DEFAULT 0.0,
+            venue_score REAL DEFAULT 0.0,
+            recency_score REAL DEFAULT 0.0,
+            quality_reasons TEXT,
+            filtered_out INTEGER DEFAULT 0,
+            filter_reason TEXT,
+            evaluated_at TEXT,
+            -- 去重字段
+            title_hash TEXT,
+            arxiv_id_normalized TEXT,
+            duplicate_of TEXT,
+            -- 推荐系统字段
+            embedding TEXT,
+            keywords TEXT,
+            view_count INTEGER DEFAULT 0,
+            favorite_count INTEGER DEFAULT 0,
+            share_count INTEGER DEFAULT 0,
+            recommendation_score REAL,
+            -- 状态字段
+            status TEXT DEFAULT 'NEW',
+            retry_count INTEGER DEFAULT 0,
+            last_error TEXT,
+            updated_at TEXT
+        )
+    """)
+
+    # 创建去重关系表
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS duplicate_groups (
+            group_id TEXT PRIMARY KEY,
+            canonical_paper_id TEXT NOT NULL,
+            duplicate_paper_ids TEXT NOT NULL,
+            similarity_scores TEXT,
+            detection_method TEXT,
+            merge_status TEXT DEFAULT 'pending',
+            created_at TEXT,
+            FOREIGN KEY (canonical_paper_id) REFERENCES papers(paper_id)
+        )
+    """)
+
+    # 创建用户交互表
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS user_interactions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            paper_id TEXT NOT NULL,
+            action_type TEXT NOT NULL,
+            interaction_score REAL DEFAULT 1.0,
+            created_at TEXT NOT NULL,
+            FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+        )
+    """)
+
+    # 创建推荐记录表
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS recommendations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id TEXT NOT NULL,
+            paper_id TEXT NOT NULL,
+            strategy TEXT NOT NULL,
+            score REAL NOT NULL,
+            reason TEXT,
+            created_at TEXT NOT NULL,
+            clicked INTEGER DEFAULT 0,
+            FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
+        )
+    """)
+
+    # 创建用户偏好表
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS user_preferences (
+            user_id TEXT PRIMARY KEY,
+            preferred_topics TEXT,
+            preferred_authors TEXT,
+            min_quality_score REAL DEFAULT 60.0,
+            min_citations INTEGER DEFAULT 0,
+            exclude_keywords TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+    # Create indexes for common queries
+    # week_id lookups are served by the (week_id, ...) composite indexes below
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_papers_status
+        ON papers(status)
+    """)
+    # (week_id, status) 前缀已由下面的复合索引覆盖，旧索引只会拖慢写入
+    cursor.execute("DROP INDEX IF EXISTS idx_papers_week_status")
+    # get_papers_for_processing: week_id = ? AND status IN (...) AND retry_count < ?
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_papers_week_status_retry
+        ON papers(week_id, status, retry_count)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_papers_pdf_sha256
+        ON papers(pdf_sha256)
+    """)
+    # Covering index: paper_id/pdf_path lookups by week+status never touch the table
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_papers_week_status_cover
+        ON papers(week_id, status, paper_id, pdf_path)
+    """)
+    # list_papers_by_quality: filtered_out = 0 ORDER BY quality_score DESC, updated_at DESC
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_papers_quality
+        ON papers(filtered_out, quality_score DESC, updated_at DESC)
+    """)
+
+    # 创建推荐系统索引
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_user_interactions_user
+        ON user_interactions(user_id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_user_interactions_paper
+        ON user_interactions(paper_id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_user_interactions_time
+        ON user_interactions(created_at)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_recommendations_user
+        ON recommendations(user_id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_recommendations_paper
+        ON recommendations(paper_id)
+    """)
+
+
+def _unhex_sha256(value):
+    """Convert a legacy hex pdf_sha256 to its 32-byte digest (SQL function)."""
+    if isinstance(value, str):
         try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN news_source TEXT")
-        except sqlite3.OperationalError:
-            pass
+            return bytes.fromhex(value)
+        except ValueError:
+            return value
+    return value
 
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN news_url TEXT")
-        except sqlite3.OperationalError:
-            pass
 
-        # 发布状态字段
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN bilibili_published INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass
+def _migrate_database() -> None:
+    """
+    Rebuild an unversioned database into the current schema.
 
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN douyin_published INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass
+    Instead of one ALTER TABLE per missing column, the current schema is
+    created in a fresh file, the old database is ATTACHed, rows are copied
+    in one sequential INSERT ... SELECT per table, and the new file
+    atomically replaces the old one.
+    """
+    tmp_path = DB_PATH.with_name(DB_PATH.name + ".migrating")
+    tmp_path.unlink(missing_ok=True)
 
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN xiaohongshu_published INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.create_function("apd_unhex", 1, _unhex_sha256, deterministic=True)
+        cursor = conn.cursor()
+        _create_schema(cursor)
+        cursor.execute("ATTACH DATABASE ? AS old", (str(DB_PATH),))
+
+        cursor.execute("SELECT name FROM old.sqlite_master WHERE type = 'table'")
+        old_tables = {row[0] for row in cursor.fetchall()}
+
+        for table in ("papers", "duplicate_groups", "user_interactions",
+                      "recommendations", "user_preferences"):
+            if table not in old_tables:
+                continue
+
+            cursor.execute(f"PRAGMA main.table_info({table})")
+            new_columns = [row[1] for row in cursor.fetchall()]
+            cursor.execute(f"PRAGMA old.table_info({table})")
+            old_columns = {row[1] for row in cursor.fetchall()}
+            columns = [c for c in new_columns if c in old_columns]
+
+            select_list = [
+                "apd_unhex(pdf_sha256)" if table == "papers" and c == "pdf_sha256" else c
+                for c in columns
+            ]
+            cursor.execute(
+                f"INSERT INTO main.{table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(select_list)} FROM old.{table}"
+            )
 
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN xiaohongshu_note_id TEXT")
-        except sqlite3.OperationalError:
-            pass
+        conn.commit()
+        cursor.execute("DETACH DATABASE old")
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    except Exception:
+        conn.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    conn.close()
 
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN xiaohongshu_url TEXT")
-        except sqlite3.OperationalError:
-            pass
-
-        # 质量控制字段迁移
-        quality_fields = [
-            ("quality_score", "REAL DEFAULT 0.0"),
-            ("citation_score", "REAL DEFAULT 0.0"),
-            ("venue_score", "REAL DEFAULT 0.0"),
-            ("recency_score", "REAL DEFAULT 0.0"),
-            ("quality_reasons", "TEXT"),
-            ("filtered_out", "INTEGER DEFAULT 0"),
-            ("filter_reason", "TEXT"),
-            ("evaluated_at", "TEXT"),
-        ]
-
-        for field_name, field_type in quality_fields:
-            try:
-                cursor.execute(f"ALTER TABLE papers ADD COLUMN {field_name} {field_type}")
-            except sqlite3.OperationalError:
-                pass  # Column already exists
-
-        # 去重字段迁移
-        dedup_fields = [
-            ("title_hash", "TEXT"),
-            ("arxiv_id_normalized", "TEXT"),
-            ("duplicate_of", "TEXT"),
-        ]
-
-        for field_name, field_type in dedup_fields:
-            try:
-                cursor.execute(f"ALTER TABLE papers ADD COLUMN {field_name} {field_type}")
-            except sqlite3.OperationalError:
-                pass  # Column already exists
-
-        # 创建去重关系表
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS duplicate_groups (
-                group_id TEXT PRIMARY KEY,
-                canonical_paper_id TEXT NOT NULL,
-                duplicate_paper_ids TEXT NOT NULL,
-                similarity_scores TEXT,
-                detection_method TEXT,
-                merge_status TEXT DEFAULT 'pending',
-                created_at TEXT,
-                FOREIGN KEY (canonical_paper_id) REFERENCES papers(paper_id)
-            )
-        """)
-
-        # 推荐系统字段迁移
-        recommendation_fields = [
-            ("embedding", "TEXT"),
-            ("keywords", "TEXT"),
-            ("view_count", "INTEGER DEFAULT 0"),
-            ("favorite_count", "INTEGER DEFAULT 0"),
-            ("share_count", "INTEGER DEFAULT 0"),
-            ("recommendation_score", "REAL"),
-        ]
-
-        for field_name, field_type in recommendation_fields:
-            try:
-                cursor.execute(f"ALTER TABLE papers ADD COLUMN {field_name} {field_type}")
-            except sqlite3.OperationalError:
-                pass  # Column already exists
-
-        # 创建用户交互表
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_interactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                paper_id TEXT NOT NULL,
-                action_type TEXT NOT NULL,
-                interaction_score REAL DEFAULT 1.0,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
-            )
-        """)
+    tmp_path.replace(DB_PATH)
 
-        # 创建推荐记录表
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS recommendations (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id TEXT NOT NULL,
-                paper_id TEXT NOT NULL,
-                strategy TEXT NOT NULL,
-                score REAL NOT NULL,
-                reason TEXT,
-                created_at TEXT NOT NULL,
-                clicked INTEGER DEFAULT 0,
-                FOREIGN KEY (paper_id) REFERENCES papers(paper_id)
-            )
-        """)
 
-        # 创建用户偏好表
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_preferences (
-                user_id TEXT PRIMARY KEY,
-                preferred_topics TEXT,
-                preferred_authors TEXT,
-                min_quality_score REAL DEFAULT 60.0,
-                min_citations INTEGER DEFAULT 0,
-                exclude_keywords TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-        """)
+def init_db() -> None:
+    """Initialize the database schema, migrating older databases if needed."""
+    with get_connection() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        has_papers = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'papers'"
+        ).fetchone() is not None
 
-        # Create indexes for common queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_papers_week
-            ON papers(week_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_papers_status
-            ON papers(status)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_papers_week_status
-            ON papers(week_id, status)
-        """)
+    if has_papers and version < SCHEMA_VERSION:
+        logger.info(f"Migrating database schema to version {SCHEMA_VERSION}")
+        # The database file is replaced, so no pooled connection may outlive it
+        close_connections()
+        _migrate_database()
 
-        # 创建推荐系统索引
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_interactions_user
-            ON user_interactions(user_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_interactions_paper
-            ON user_interactions(paper_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_interactions_time
-            ON user_interactions(created_at)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_recommendations_user
-            ON recommendations(user_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_recommendations_paper
-            ON recommendations(paper_id)
-        """)
+    with get_connection() as conn:
+        _create_schema(conn.cursor())
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
         logger.debug("Database initialized")
 
@@ -437,14 +621,93 @@ def get_paper(paper_id: str) -> Optional[Paper]:
     """
     with get_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM papers WHERE paper_id = ?", (paper_id,))
+        cursor.execute(f"SELECT {_PAPER_SELECT} FROM papers WHERE paper_id = ?", (paper_id,))
         row = cursor.fetchone()
         
         if row:
-            return Paper(**dict(row))
+            return _row_to_paper(row)
         return None
 
 
+def get_papers_bulk(paper_ids: list[str]) -> dict[str, str]:
+    """
+    Look up which of the given papers already exist, in one query.
+
+    The ids are bound as a single JSON array, so the statement text is the
+    same for any number of ids and never hits SQLite's variable limit.
+
+    Args:
+        paper_ids: Paper IDs to look up
+
+    Returns:
+        Dict mapping each stored paper_id to its current week_id
+    """
+    if not paper_ids:
+        return {}
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT paper_id, week_id FROM papers "
+            "WHERE paper_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(paper_ids)),),
+        )
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+
+# Columns upsert_paper may set, in parameter order. A None argument leaves
+# the stored value untouched (COALESCE), so one fixed statement serves
+# every call and stays in the connection's prepared-statement cache.
+_UPSERT_FIELDS = (
+    "title", "hf_url", "pdf_url", "pdf_path", "pdf_sha256",
+    "notebooklm_note_name", "video_path", "slides_path", "summary",
+    "status", "last_error",
+    "content_type", "source_url", "github_stars", "github_language",
+    "github_description", "news_source", "news_url",
+    "bilibili_published", "douyin_published",
+    "quality_score", "citation_score", "venue_score", "recency_score",
+    "quality_reasons", "filtered_out", "filter_reason", "evaluated_at",
+    "title_hash", "arxiv_id_normalized", "duplicate_of",
+)
+
+_UPSERT_UPDATE_SQL = (
+    "UPDATE papers SET "
+    + ", ".join(f"{field} = COALESCE(?, {field})" for field in _UPSERT_FIELDS)
+    + ", updated_at = ? WHERE paper_id = ?"
+)
+
+_UPSERT_INSERT_SQL = (
+    "INSERT INTO papers (paper_id, week_id, retry_count, updated_at, "
+    + ", ".join(_UPSERT_FIELDS)
+    + ") VALUES (?, ?, 0, ?, "
+    + ", ".join("?" * len(_UPSERT_FIELDS))
+    + ")"
+)
+
+# Single-statement upsert: insert with defaults, or COALESCE-update the
+# existing row, and hand the resulting row back in the same round-trip.
+_UPSERT_NO_RETURNING_SQL = (
+    _UPSERT_INSERT_SQL
+    + " ON CONFLICT(paper_id) DO UPDATE SET "
+    + ", ".join(f"{field} = COALESCE(?, papers.{field})" for field in _UPSERT_FIELDS)
+    + ", updated_at = excluded.updated_at"
+)
+_UPSERT_SQL = f"{_UPSERT_NO_RETURNING_SQL} RETURNING {_PAPER_SELECT}"
+
+# UPSERT needs SQLite 3.24, RETURNING needs 3.35
+_HAS_UPSERT = sqlite3.sqlite_version_info >= (3, 24, 0)
+_HAS_UPSERT_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Column defaults applied on INSERT when the argument is None
+_UPSERT_INSERT_DEFAULTS = {
+    "status": Status.NEW,
+    "content_type": "PAPER",
+    "bilibili_published": 0,
+    "douyin_published": 0,
+    "filtered_out": 0,
+}
+
+
 def upsert_paper(
     paper_id: str,
     week_id: str,
@@ -452,7 +715,7 @@ def upsert_paper(
     hf_url: Optional[str] = None,
     pdf_url: Optional[str] = None,
     pdf_path: Optional[str] = None,
-    pdf_sha256: Optional[str] = None,
+    pdf_sha256: Optional[bytes] = None,
     notebooklm_note_name: Optional[str] = None,
     video_path: Optional[str] = None,
     slides_path: Optional[str] = None,
@@ -497,153 +760,103 @@ def upsert_paper(
     Returns:
         The updated Paper object
     """
-    existing = get_paper(paper_id)
     now = now_iso()
-
+    values = (
+        title, hf_url, pdf_url, pdf_path, pdf_sha256,
+        notebooklm_note_name, video_path, slides_path, summary,
+        status, last_error,
+        content_type, source_url, github_stars, github_language,
+        github_description, news_source, news_url,
+        bilibili_published, douyin_published,
+        quality_score, citation_score, venue_score, recency_score,
+        quality_reasons, filtered_out, filter_reason, evaluated_at,
+        title_hash, arxiv_id_normalized, duplicate_of,
+    )
+
+    insert_values = tuple(
+        _UPSERT_INSERT_DEFAULTS.get(field) if value is None else value
+        for field, value in zip(_UPSERT_FIELDS, values)
+    )
     with get_connection() as conn:
         cursor = conn.cursor()
 
-        if existing:
-            # Build UPDATE query dynamically for non-None fields
-            updates = []
-            values = []
-
-            if title is not None:
-                updates.append("title = ?")
-                values.append(title)
-            if hf_url is not None:
-                updates.append("hf_url = ?")
-                values.append(hf_url)
-            if pdf_url is not None:
-                updates.append("pdf_url = ?")
-                values.append(pdf_url)
-            if pdf_path is not None:
-                updates.append("pdf_path = ?")
-                values.append(pdf_path)
-            if pdf_sha256 is not None:
-                updates.append("pdf_sha256 = ?")
-                values.append(pdf_sha256)
-            if notebooklm_note_name is not None:
-                updates.append("notebooklm_note_name = ?")
-                values.append(notebooklm_note_name)
-            if video_path is not None:
-                updates.append("video_path = ?")
-                values.append(video_path)
-            if slides_path is not None:
-                updates.append("slides_path = ?")
-                values.append(slides_path)
-            if summary is not None:
-                updates.append("summary = ?")
-                values.append(summary)
-            if status is not None:
-                updates.append("status = ?")
-                values.append(status)
-            if last_error is not None:
-                updates.append("last_error = ?")
-                values.append(last_error)
-
-            # 新增字段更新
-            if content_type is not None:
-                updates.append("content_type = ?")
-                values.append(content_type)
-            if source_url is not None:
-                updates.append("source_url = ?")
-                values.append(source_url)
-            if github_stars is not None:
-                updates.append("github_stars = ?")
-                values.append(github_stars)
-            if github_language is not None:
-                updates.append("github_language = ?")
-                values.append(github_language)
-            if github_description is not None:
-                updates.append("github_description = ?")
-                values.append(github_description)
-            if news_source is not None:
-                updates.append("news_source = ?")
-                values.append(news_source)
-            if news_url is not None:
-                updates.append("news_url = ?")
-                values.append(news_url)
-            if bilibili_published is not None:
-                updates.append("bilibili_published = ?")
-                values.append(bilibili_published)
-            if douyin_published is not None:
-                updates.append("douyin_published = ?")
-                values.append(douyin_published)
-
-            # 质量控制字段更新
-            if quality_score is not None:
-                updates.append("quality_score = ?")
-                values.append(quality_score)
-            if citation_score is not None:
-                updates.append("citation_score = ?")
-                values.append(citation_score)
-            if venue_score is not None:
-                updates.append("venue_score = ?")
-                values.append(venue_score)
-            if recency_score is not None:
-                updates.append("recency_score = ?")
-                values.append(recency_score)
-            if quality_reasons is not None:
-                updates.append("quality_reasons = ?")
-                values.append(quality_reasons)
-            if filtered_out is not None:
-                updates.append("filtered_out = ?")
-                values.append(filtered_out)
-            if filter_reason is not None:
-                updates.append("filter_reason = ?")
-                values.append(filter_reason)
-            if evaluated_at is not None:
-                updates.append("evaluated_at = ?")
-                values.append(evaluated_at)
-
-            # 去重字段更新
-            if title_hash is not None:
-                updates.append("title_hash = ?")
-                values.append(title_hash)
-            if arxiv_id_normalized is not None:
-                updates.append("arxiv_id_normalized = ?")
-                values.append(arxiv_id_normalized)
-            if duplicate_of is not None:
-                updates.append("duplicate_of = ?")
-                values.append(duplicate_of)
-
-            updates.append("updated_at = ?")
-            values.append(now)
-            values.append(paper_id)
-
-            if updates:
-                query = f"UPDATE papers SET {', '.join(updates)} WHERE paper_id = ?"
-                cursor.execute(query, values)
-
-            logger.debug(f"Updated paper: {paper_id}")
+        if _HAS_UPSERT_RETURNING:
+            cursor.execute(_UPSERT_SQL, (paper_id, week_id, now, *insert_values, *values))
+            row = cursor.fetchone()
+            logger.debug(f"Upserted paper: {paper_id}")
         else:
-            # INSERT new record
-            cursor.execute("""
-                INSERT INTO papers (
-                    paper_id, week_id, title, hf_url, pdf_url, pdf_path,
-                    pdf_sha256, notebooklm_note_name, video_path, slides_path, summary, status,
-                    retry_count, last_error, updated_at,
-                    content_type, source_url, github_stars, github_language, github_description,
-                    news_source, news_url, bilibili_published, douyin_published,
-                    quality_score, citation_score, venue_score, recency_score, quality_reasons,
-                    filtered_out, filter_reason, evaluated_at,
-                    title_hash, arxiv_id_normalized, duplicate_of
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                paper_id, week_id, title, hf_url, pdf_url, pdf_path,
-                pdf_sha256, notebooklm_note_name, video_path, slides_path, summary,
-                status or Status.NEW, 0, last_error, now,
-                content_type or "PAPER", source_url, github_stars, github_language, github_description,
-                news_source, news_url, bilibili_published or 0, douyin_published or 0,
-                quality_score, citation_score, venue_score, recency_score, quality_reasons,
-                filtered_out or 0, filter_reason, evaluated_at,
-                title_hash, arxiv_id_normalized, duplicate_of
-            ))
-            logger.debug(f"Inserted paper: {paper_id}")
-
-    return get_paper(paper_id)  # type: ignore
+            # 无 RETURNING：先 UPDATE，rowcount 为 0 再 INSERT（省去存在性查询），最后取回一次
+            cursor.execute(_UPSERT_UPDATE_SQL, (*values, now, paper_id))
+            if cursor.rowcount:
+                logger.debug(f"Updated paper: {paper_id}")
+            else:
+                cursor.execute(_UPSERT_INSERT_SQL, (paper_id, week_id, now, *insert_values))
+                logger.debug(f"Inserted paper: {paper_id}")
+            cursor.execute(f"SELECT {_PAPER_SELECT} FROM papers WHERE paper_id = ?", (paper_id,))
+            row = cursor.fetchone()
+
+    return _row_to_paper(row)
+
+
+def upsert_papers_bulk(rows: list[dict]) -> int:
+    """
+    Insert or update many paper/content records in one transaction.
+
+    Each dict takes the same keys as upsert_paper's arguments and follows
+    the same rules: paper_id and week_id are required, None or missing
+    fields leave stored values untouched.
+
+    Args:
+        rows: Records to upsert
+
+    Returns:
+        Number of records written
+    """
+    allowed = {"paper_id", "week_id", *_UPSERT_FIELDS}
+    for row in rows:
+        unknown = row.keys() - allowed
+        if unknown:
+            raise TypeError(f"Unknown paper fields: {', '.join(sorted(unknown))}")
+
+    if not rows:
+        return 0
+
+    if not _HAS_UPSERT:
+        # 无 UPSERT：逐条写入，外层 get_connection() 让所有调用共用一次提交
+        with get_connection() as conn:
+            if not conn.in_transaction and _local.holder.depth == 1:
+                conn.execute("BEGIN IMMEDIATE")
+            for row in rows:
+                upsert_paper(**row)
+        return len(rows)
+
+    now = now_iso()
+
+    def params():
+        for row in rows:
+            values = [row.get(field) for field in _UPSERT_FIELDS]
+            insert_values = [
+                _UPSERT_INSERT_DEFAULTS.get(field) if value is None else value
+                for field, value in zip(_UPSERT_FIELDS, values)
+            ]
+            yield (row["paper_id"], row["week_id"], now, *insert_values, *values)
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        # 外层 get_connection() 已开启事务时直接并入，否则提前拿写锁
+        if not conn.in_transaction and _local.holder.depth == 1:
+            cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(_UPSERT_NO_RETURNING_SQL, params())
 
+    logger.debug(f"Upserted {len(rows)} papers")
+    return len(rows)
+
+
+_UPDATE_STATUS_SQL = """
+    UPDATE papers
+    SET status = ?, last_error = ?, retry_count = retry_count + ?, updated_at = ?
+    WHERE paper_id = ?
+"""
 
 
 def update_status(
@@ -664,32 +877,116 @@ def update_status(
     Returns:
         Updated Paper object or None if not found
     """
+    now = now_iso()
+    params = (status, error, 1 if increment_retry else 0, now, paper_id)
+
     with get_connection() as conn:
         cursor = conn.cursor()
-        now = now_iso()
-        
-        if increment_retry:
-            cursor.execute("""
-                UPDATE papers 
-                SET status = ?, last_error = ?, retry_count = retry_count + 1, updated_at = ?
-                WHERE paper_id = ?
-            """, (status, error, now, paper_id))
-        else:
-            cursor.execute("""
-                UPDATE papers 
-                SET status = ?, last_error = ?, updated_at = ?
-                WHERE paper_id = ?
-            """, (status, error, now, paper_id))
-        
+
+        if _HAS_UPSERT_RETURNING:
+            # 单次往返：UPDATE 的同时取回更新后的行
+            cursor.execute(_UPDATE_STATUS_SQL + f" RETURNING {_PAPER_SELECT}", params)
+            row = cursor.fetchone()
+            if row is None:
+                logger.warning(f"Paper not found for status update: {paper_id}")
+                return None
+            logger.debug(f"Updated status for {paper_id}: {status}")
+            return _row_to_paper(row)
+
+        cursor.execute(_UPDATE_STATUS_SQL, params)
         if cursor.rowcount == 0:
             logger.warning(f"Paper not found for status update: {paper_id}")
             return None
-            
+
         logger.debug(f"Updated status for {paper_id}: {status}")
-    
+
     return get_paper(paper_id)
 
 
+@lru_cache(maxsize=None)
+def _list_papers_sql(week_clause: Optional[str], has_status: bool, has_limit: bool) -> str:
+    """
+    Build (once per filter combination) the list_papers query text.
+
+    week_clause comes from _build_week_id_clause, which only ever returns
+    two distinct strings, so the cache stays tiny and every call reuses
+    the same SQL text (and thus the connection's prepared statement).
+    """
+    query = f"SELECT {_PAPER_SELECT} FROM papers WHERE 1=1"
+    if week_clause:
+        query += f" AND {week_clause}"
+    if has_status:
+        query += " AND status = ?"
+    query += " ORDER BY updated_at DESC"
+    if has_limit:
+        query += " LIMIT ?"
+    return query
+
+
+@lru_cache(maxsize=None)
+def _count_papers_sql(week_clause: Optional[str], has_status: bool) -> str:
+    """Build (once per filter combination) the count_papers query text."""
+    query = "SELECT COUNT(*) FROM papers"
+    conditions = []
+    if week_clause:
+        conditions.append(week_clause)
+    if has_status:
+        conditions.append("status = ?")
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return query
+
+
+_FETCH_ARRAYSIZE = 256
+
+
+def _iter_rows(query: str, params: list) -> Iterator[Paper]:
+    """
+    Execute a read-only query and yield Paper objects in fetchmany batches.
+
+    Uses the thread's pooled connection directly instead of get_connection():
+    a suspended generator must not hold the outer-transaction depth, or
+    writes made by the caller inside the loop would never commit.
+    """
+    cursor = _pooled_connection().cursor()
+    cursor.arraysize = _FETCH_ARRAYSIZE
+    try:
+        cursor.execute(query, params)
+        while rows := cursor.fetchmany():
+            yield from map(_row_to_paper, rows)
+    finally:
+        cursor.close()
+
+
+def iter_papers(
+    week_id: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: Optional[int] = None
+) -> Iterator[Paper]:
+    """
+    Iterate papers with optional filtering, one row batch at a time.
+    
+    Args:
+        week_id: Filter by week
+        status: Filter by status
+        limit: Maximum number of results
+        
+    Yields:
+        Paper objects ordered by updated_at DESC
+    """
+    params: list = []
+    week_clause = None
+    if week_id:
+        week_clause, clause_params = _build_week_id_clause(week_id)
+        params.extend(clause_params)
+    if status:
+        params.append(status)
+    if limit:
+        params.append(limit)
+
+    yield from _iter_rows(_list_papers_sql(week_clause, bool(status), bool(limit)), params)
+
+
 def list_papers(
     week_id: Optional[str] = None,
     status: Optional[str] = None,
@@ -706,30 +1003,7 @@ def list_papers(
     Returns:
         List of Paper objects
     """
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        query = "SELECT * FROM papers WHERE 1=1"
-        params: list = []
-        
-        if week_id:
-            clause, clause_params = _build_week_id_clause(week_id)
-            query += f" AND {clause}"
-            params.extend(clause_params)
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-            
-        query += " ORDER BY updated_at DESC"
-        
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        
-        return [Paper(**dict(row)) for row in rows]
+    return list(iter_papers(week_id, status, limit))
 
 
 def count_papers(week_id: Optional[str] = None, status: Optional[str] = None) -> int:
@@ -746,56 +1020,57 @@ def count_papers(week_id: Optional[str] = None, status: Optional[str] = None) ->
     with get_connection() as conn:
         cursor = conn.cursor()
 
-        query = "SELECT COUNT(*) FROM papers WHERE 1=1"
         params: list = []
-
+        week_clause = None
         if week_id:
-            clause, clause_params = _build_week_id_clause(week_id)
-            query += f" AND {clause}"
+            week_clause, clause_params = _build_week_id_clause(week_id)
             params.extend(clause_params)
         if status:
-            query += " AND status = ?"
             params.append(status)
 
-        cursor.execute(query, params)
+        cursor.execute(_count_papers_sql(week_clause, bool(status)), params)
         return cursor.fetchone()[0]
 
 
-def list_papers_by_quality(
+def iter_papers_by_quality(
     week_id: Optional[str] = None,
     min_quality_score: float = 0.0,
     include_filtered: bool = True,
     limit: Optional[int] = None
-) -> list[Paper]:
-    """列出符合质量要求的内容"""
-    with get_connection() as conn:
-        cursor = conn.cursor()
+) -> Iterator[Paper]:
+    """按质量分从高到低逐批产出符合要求的内容"""
+    query = f"SELECT {_PAPER_SELECT} FROM papers WHERE 1=1"
+    params: list = []
 
-        query = "SELECT * FROM papers WHERE 1=1"
-        params: list = []
+    if min_quality_score > 0:
+        query += " AND (quality_score >= ? OR quality_score IS NULL)"
+        params.append(min_quality_score)
 
-        if min_quality_score > 0:
-            query += " AND (quality_score >= ? OR quality_score IS NULL)"
-            params.append(min_quality_score)
+    if not include_filtered:
+        query += " AND filtered_out = 0"
 
-        if not include_filtered:
-            query += " AND filtered_out = 0"
+    if week_id:
+        clause, clause_params = _build_week_id_clause(week_id)
+        query += f" AND {clause}"
+        params.extend(clause_params)
 
-        if week_id:
-            clause, clause_params = _build_week_id_clause(week_id)
-            query += f" AND {clause}"
-            params.extend(clause_params)
+    query += " ORDER BY quality_score DESC, updated_at DESC"
 
-        query += " ORDER BY quality_score DESC, updated_at DESC"
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
 
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
+    yield from _iter_rows(query, params)
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
 
-        return [Paper(**dict(row)) for row in rows]
+def list_papers_by_quality(
+    week_id: Optional[str] = None,
+    min_quality_score: float = 0.0,
+    include_filtered: bool = True,
+    limit: Optional[int] = None
+) -> list[Paper]:
+    """列出符合质量要求的内容"""
+    return list(iter_papers_by_quality(week_id, min_quality_score, include_filtered, limit))
 
 
 # =============================================================================
@@ -811,8 +1086,6 @@ def save_duplicate_group(
     created_at: str
 ) -> None:
     """保存重复组到数据库"""
-    import json
-
     with get_connection() as conn:
         cursor = conn.cursor()
 
@@ -838,8 +1111,6 @@ def get_duplicate_groups(
     limit: Optional[int] = None
 ) -> list[dict]:
     """获取重复组列表"""
-    import json
-
     with get_connection() as conn:
         cursor = conn.cursor()
 
@@ -893,7 +1164,7 @@ def get_non_duplicate_papers(
     with get_connection() as conn:
         cursor = conn.cursor()
 
-        query = "SELECT * FROM papers WHERE duplicate_of IS NULL"
+        query = f"SELECT {_PAPER_SELECT} FROM papers WHERE duplicate_of IS NULL"
         params = []
 
         if week_id:
@@ -910,7 +1181,7 @@ def get_non_duplicate_papers(
         cursor.execute(query, params)
         rows = cursor.fetchall()
 
-        return [Paper(**dict(row)) for row in rows]
+        return [_row_to_paper(row) for row in rows]
 
 
 def get_papers_for_processing(
@@ -948,7 +1219,7 @@ def get_papers_for_processing(
         
         status_placeholders = ",".join("?" * len(needed_statuses))
         query = f"""
-            SELECT * FROM papers 
+            SELECT {_PAPER_SELECT} FROM papers
             WHERE {week_clause}
             AND status IN ({status_placeholders})
             AND retry_count < ?
@@ -964,4 +1235,4 @@ def get_papers_for_processing(
         cursor.execute(query, params)
         rows = cursor.fetchall()
         
-        return [Paper(**dict(row)) for row in rows]
+        return [_row_to_paper(row) for row in rows]
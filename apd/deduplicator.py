@@ -8,16 +8,75 @@
 """
 
 import re
+import sys
 import hashlib
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Dict, List, Tuple
 from difflib import SequenceMatcher
 
+from .config import DeduplicationConfig
+from .utils import now_iso
+
 logger = logging.getLogger(__name__)
 
+# arXiv ID模式（arxiv.org/abs|pdf 与 export.arxiv.org/pdf）
+_ARXIV_ID_RE = re.compile(r'(?:arxiv\.org/(?:abs|pdf)|export\.arxiv\.org/pdf)/(\d{4}\.\d{4,5})')
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+
+# 检测方法（驻留字符串：相同对象的 == 比较直接走指针相等的快速路径）
+METHOD_EXACT_URL = sys.intern('exact_url')
+METHOD_TITLE = sys.intern('title_similarity')
+METHOD_SEMANTIC = sys.intern('semantic_similarity')
+
+
+@lru_cache(maxsize=1)
+def _jaccard_kernel():
+    """
+    编译（仅一次）并行Jaccard矩阵内核；numba不可用时返回None
+
+    内核输入为CSR布局的排序词ID数组（offsets, tokens），
+    对每一对做有序归并求交集，输出N×N float32矩阵。
+    任一方词集为空时记为1.0（不剪枝，与_combine_title_similarity一致）。
+    """
+    try:
+        import numpy as np
+        from numba import njit, prange
+    except ImportError:
+        return None
 
-@dataclass
+    @njit(parallel=True, cache=True)
+    def jaccard_matrix(offsets, tokens, n):
+        out = np.ones((n, n), dtype=np.float32)
+        for i in prange(n):
+            a_start, a_end = offsets[i], offsets[i + 1]
+            for j in range(i + 1, n):
+                b_start, b_end = offsets[j], offsets[j + 1]
+                len_a = a_end - a_start
+                len_b = b_end - b_start
+                if len_a == 0 or len_b == 0:
+                    continue
+                p, q, inter = a_start, b_start, 0
+                while p < a_end and q < b_end:
+                    if tokens[p] == tokens[q]:
+                        inter += 1
+                        p += 1
+                        q += 1
+                    elif tokens[p] < tokens[q]:
+                        p += 1
+                    else:
+                        q += 1
+                value = inter / (len_a + len_b - inter)
+                out[i, j] = value
+                out[j, i] = value
+        return out
+
+    return jaccard_matrix
+
+
+@dataclass(slots=True)
 class DuplicateGroup:
     """重复组"""
     group_id: str
@@ -28,7 +87,7 @@ class DuplicateGroup:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DeduplicationResult:
     """去重结果"""
     total_papers: int
@@ -45,7 +104,6 @@ class Deduplicator:
 
     def __init__(self, config=None):
         if config is None:
-            from .config import DeduplicationConfig
             config = DeduplicationConfig
 
         self.config = config
@@ -55,9 +113,9 @@ class Deduplicator:
         """延迟加载Sentence-BERT模型"""
         if self.sentence_model is None:
             try:
-                from sentence_transformers import SentenceTransformer
+                from .embeddings import get_embedding_model
                 logger.info(f"Loading embedding model: {self.config.EMBEDDING_MODEL}")
-                self.sentence_model = SentenceTransformer(self.config.EMBEDDING_MODEL)
+                self.sentence_model = get_embedding_model(self.config.EMBEDDING_MODEL)
                 logger.info("Model loaded successfully")
             except ImportError:
                 logger.error("sentence-transformers not installed. Semantic similarity disabled.")
@@ -82,15 +140,9 @@ class Deduplicator:
             return None
 
         # 匹配arXiv ID模式
-        patterns = [
-            r'arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})',
-            r'export\.arxiv\.org/pdf/(\d{4}\.\d{4,5})',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = _ARXIV_ID_RE.search(url)
+        if match:
+            return match.group(1)
 
         return None
 
@@ -109,7 +161,7 @@ class Deduplicator:
         title = title.lower()
 
         # 移除特殊字符，保留字母数字和空格
-        title = re.sub(r'[^a-z0-9\s]', ' ', title)
+        title = _NON_ALNUM_RE.sub(' ', title)
 
         # 移除多余空格
         title = ' '.join(title.split())
@@ -117,9 +169,9 @@ class Deduplicator:
         return title
 
     def compute_title_hash(self, title: str) -> str:
-        """计算标题哈希值（用于快速查找）"""
+        """计算标题哈希值（用于快速查找；非加密指纹，blake2b比md5更快，长度仍为32位十六进制）"""
         normalized = self.normalize_title(title)
-        return hashlib.md5(normalized.encode('utf-8')).hexdigest()
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
 
     def compute_title_similarity(self, title1: str, title2: str) -> float:
         """
@@ -141,10 +193,30 @@ class Deduplicator:
         # 方法1: SequenceMatcher（基于编辑距离）
         seq_ratio = SequenceMatcher(None, t1, t2).ratio()
 
-        # 方法2: Jaccard相似度（基于词集合）
-        words1 = set(t1.split())
-        words2 = set(t2.split())
+        return self._combine_title_similarity(
+            t1, t2, seq_ratio, frozenset(t1.split()), frozenset(t2.split())
+        )
 
+    def _combine_title_similarity(
+        self,
+        t1: str,
+        t2: str,
+        seq_ratio: float,
+        words1: frozenset,
+        words2: frozenset
+    ) -> float:
+        """
+        将编辑距离相似度与Jaccard相似度加权合并
+
+        Args:
+            t1, t2: 标准化后的标题
+            seq_ratio: 编辑距离相似度 0.0-1.0
+            words1, words2: 标题的词集合
+        """
+        if t1 == t2:
+            return 1.0
+
+        # 方法2: Jaccard相似度（基于词集合）
         if not words1 or not words2:
             return seq_ratio
 
@@ -157,6 +229,93 @@ class Deduplicator:
 
         return similarity
 
+    def _build_title_ratio_matrix(self, norm_titles: List[str]):
+        """
+        用rapidfuzz一次性计算所有标题对的编辑距离相似度矩阵，仅用于剪枝
+
+        fuzz.ratio基于最长公共子序列，SequenceMatcher的匹配块也是公共子序列，
+        因此矩阵值是SequenceMatcher.ratio的上界：低于下界的对可安全跳过，
+        留下的对仍用SequenceMatcher计算，保证各路径判定一致。
+
+        Args:
+            norm_titles: 标准化后的标题列表
+
+        Returns:
+            N×N float32矩阵（0-100）；rapidfuzz不可用时返回None
+        """
+        try:
+            import numpy as np
+            from rapidfuzz import fuzz, process
+        except ImportError:
+            return None
+
+        return process.cdist(
+            norm_titles, norm_titles,
+            scorer=fuzz.ratio,
+            dtype=np.float32,
+            workers=-1
+        )
+
+    def _build_jaccard_matrix(self, token_sets: List[frozenset]):
+        """
+        rapidfuzz不可用时的回退：用numba并行计算所有标题对的Jaccard矩阵
+
+        加权相似度 <= 0.6 + 0.4*jaccard，据此可在调用SequenceMatcher前剪枝。
+
+        Args:
+            token_sets: 标准化标题的词集合列表
+
+        Returns:
+            N×N float32矩阵；numba不可用时返回None
+        """
+        kernel = _jaccard_kernel()
+        if kernel is None:
+            return None
+
+        import numpy as np
+
+        vocab: Dict[str, int] = {}
+        offsets = np.zeros(len(token_sets) + 1, dtype=np.int64)
+        ids: List[int] = []
+        for idx, words in enumerate(token_sets):
+            ids.extend(sorted(vocab.setdefault(word, len(vocab)) for word in words))
+            offsets[idx + 1] = len(ids)
+
+        return kernel(offsets, np.asarray(ids, dtype=np.int32), len(token_sets))
+
+    def _lsh_title_candidates(self, norm_titles: List[str]) -> Optional[List[set]]:
+        """
+        用MinHash-LSH对标题分桶，返回每篇论文的候选相似论文下标
+
+        加权相似度 = 0.6*seq + 0.4*jaccard，达到阈值要求
+        jaccard >= (阈值 - 0.6) / 0.4，LSH阈值据此设定（留出概率召回余量）。
+
+        Args:
+            norm_titles: 标准化后的标题列表
+
+        Returns:
+            每篇论文的候选下标集合；datasketch不可用或阈值过低时返回None
+        """
+        jaccard_floor = (self.config.TITLE_SIMILARITY_THRESHOLD - 0.6) / 0.4
+        if jaccard_floor <= 0:
+            return None
+
+        try:
+            from datasketch import MinHash, MinHashLSH
+        except ImportError:
+            return None
+
+        lsh = MinHashLSH(threshold=max(jaccard_floor * 0.8, 0.1), num_perm=64)
+        minhashes = []
+        for idx, title in enumerate(norm_titles):
+            m = MinHash(num_perm=64)
+            for token in set(title.split()):
+                m.update(token.encode('utf-8'))
+            minhashes.append(m)
+            lsh.insert(idx, m)
+
+        return [set(lsh.query(m)) for m in minhashes]
+
     def compute_semantic_similarity(self, text1: str, text2: str) -> float:
         """
         计算语义相似度（使用Sentence-BERT）
@@ -193,6 +352,73 @@ class Deduplicator:
             logger.error(f"Error computing semantic similarity: {e}")
             return 0.0
 
+    def _encode_abstracts(self, abstracts: List[str]):
+        """
+        批量编码摘要（只编码一次）
+
+        Args:
+            abstracts: 摘要列表
+
+        Returns:
+            L2归一化的N×d embedding矩阵；模型不可用时返回None
+        """
+        if self.sentence_model is None:
+            self._load_sentence_model()
+
+        if self.sentence_model is None:
+            return None
+
+        try:
+            return self.sentence_model.encode(
+                abstracts,
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+        except Exception as e:
+            logger.error(f"Error encoding abstracts: {e}")
+            return None
+
+    def _semantic_neighbors(self, embeddings) -> Optional[List[Dict[int, float]]]:
+        """
+        用FAISS近邻索引（int8标量量化 + HNSW）查找语义相似的摘要对
+
+        只检索每篇的top-k近邻，避免N×N相似度矩阵。
+
+        Args:
+            embeddings: L2归一化的N×d embedding矩阵
+
+        Returns:
+            每行达到阈值的近邻 {行号: 相似度}（对称）；faiss不可用时返回None
+        """
+        try:
+            import faiss
+            import numpy as np
+        except ImportError:
+            return None
+
+        vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+        index = faiss.IndexHNSWSQ(
+            vectors.shape[1], faiss.ScalarQuantizer.QT_8bit, 32, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(vectors)
+        index.add(vectors)
+        k = min(self.config.SEMANTIC_TOP_K + 1, len(vectors))  # +1: 自身
+        distances, indices = index.search(vectors, k)
+
+        neighbors: List[Dict[int, float]] = [{} for _ in range(len(vectors))]
+        threshold = self.config.ABSTRACT_SIMILARITY_THRESHOLD
+        for row, (scores, rows) in enumerate(zip(distances, indices)):
+            for score, other in zip(scores, rows):
+                if other < 0 or other == row or score < threshold:
+                    continue
+                score = min(float(score), 1.0)  # int8量化误差可能略超1
+                neighbors[row][other] = max(score, neighbors[row].get(other, score))
+                neighbors[other][row] = max(score, neighbors[other].get(row, score))
+
+        return neighbors
+
     def find_duplicates(
         self,
         papers: List[dict],
@@ -208,15 +434,78 @@ class Deduplicator:
         Returns:
             DeduplicationResult对象
         """
-        from .utils import now_iso
-
         duplicate_groups = []
         processed_ids = set()
 
         logger.info(f"Starting deduplication for {len(papers)} papers")
 
-        for i, paper1 in enumerate(papers):
-            paper1_id = paper1.get('paper_id')
+        # 循环前一次性预计算每篇论文的比较特征（SoA），内层循环只做比较
+        paper_ids = [p.get('paper_id') for p in papers]
+        has_title = [bool(p.get('title')) for p in papers]
+        norm_titles = [self.normalize_title(p.get('title', '')) for p in papers]
+        token_sets = [frozenset(t.split()) for t in norm_titles]
+        arxiv_ids = [self.normalize_arxiv_id(p.get('pdf_url', '')) for p in papers]
+        abstracts = [p.get('abstract') or '' for p in papers]
+
+        # Level 1: URL精确匹配——按arXiv ID一次分桶，O(N)
+        by_arxiv: Dict[str, List[int]] = {}
+        for idx, arxiv_id in enumerate(arxiv_ids):
+            if arxiv_id:
+                by_arxiv.setdefault(arxiv_id, []).append(idx)
+
+        for bucket in by_arxiv.values():
+            if len(bucket) < 2:
+                continue
+            canonical_id = paper_ids[bucket[0]]
+            duplicates = [paper_ids[idx] for idx in bucket[1:]]
+            for dup_id in duplicates:
+                logger.info(f"Found exact URL match: {canonical_id} <-> {dup_id}")
+            duplicate_groups.append(DuplicateGroup(
+                group_id=f"dup_{hashlib.md5(canonical_id.encode()).hexdigest()[:8]}",
+                canonical_paper_id=canonical_id,
+                duplicate_paper_ids=duplicates,
+                similarity_scores={dup_id: 1.0 for dup_id in duplicates},
+                detection_method=METHOD_EXACT_URL,
+                created_at=now_iso()
+            ))
+            processed_ids.add(canonical_id)
+            processed_ids.update(duplicates)
+
+        # 论文较多时用LSH分桶，只比较候选对，避免N²比较
+        title_candidates = None
+        if len(papers) >= self.config.LSH_MIN_PAPERS:
+            title_candidates = self._lsh_title_candidates(norm_titles)
+
+        # 一次性计算所有标题对的编辑距离相似度上界，用于剪枝（rapidfuzz可用且未分桶时）
+        ratio_matrix = None
+        jaccard_matrix = None
+        if title_candidates is None:
+            ratio_matrix = self._build_title_ratio_matrix(norm_titles)
+            if ratio_matrix is None:
+                jaccard_matrix = self._build_jaccard_matrix(token_sets)
+
+        # 所有摘要只编码一次；论文较多时用近邻索引，否则一次矩阵乘法得到全部余弦相似度
+        semantic_rows: Dict[int, int] = {}
+        semantic_matrix = None
+        semantic_neighbors = None
+        if use_semantic:
+            with_abstract = [idx for idx, abstract in enumerate(abstracts) if abstract]
+            if len(with_abstract) > 1:
+                embeddings = self._encode_abstracts([abstracts[idx] for idx in with_abstract])
+                if embeddings is not None:
+                    semantic_rows = {idx: row for row, idx in enumerate(with_abstract)}
+                    if len(with_abstract) >= self.config.SEMANTIC_ANN_MIN_PAPERS:
+                        semantic_neighbors = self._semantic_neighbors(embeddings)
+                    if semantic_neighbors is None:
+                        # 已L2归一化，内积即余弦相似度
+                        semantic_matrix = embeddings @ embeddings.T
+        # 加权相似度 = 0.6*seq + 0.4*jaccard <= 0.6*seq + 0.4，低于此界的对可直接跳过（留float32误差余量）
+        min_ratio = (self.config.TITLE_SIMILARITY_THRESHOLD - 0.4) / 0.6 * 100 - 1e-4
+        # 同理 <= 0.6 + 0.4*jaccard（留float32误差余量）
+        min_jaccard = (self.config.TITLE_SIMILARITY_THRESHOLD - 0.6) / 0.4 - 1e-6
+
+        for i in range(len(papers)):
+            paper1_id = paper_ids[i]
 
             # 跳过已处理的
             if paper1_id in processed_ids:
@@ -227,34 +516,48 @@ class Deduplicator:
             detection_method = None
 
             # 与后续论文比较
-            for j in range(i + 1, len(papers)):
-                paper2 = papers[j]
-                paper2_id = paper2.get('paper_id')
-
-                if paper2_id in processed_ids:
-                    continue
+            if title_candidates is None:
+                candidates = range(i + 1, len(papers))
+            else:
+                candidate_set = set(title_candidates[i])
+                if use_semantic and abstracts[i]:
+                    if semantic_neighbors is not None:
+                        candidate_set.update(
+                            with_abstract[row] for row in semantic_neighbors[semantic_rows[i]]
+                        )
+                    elif semantic_matrix is not None:
+                        hits = semantic_matrix[semantic_rows[i]] >= self.config.ABSTRACT_SIMILARITY_THRESHOLD
+                        candidate_set.update(with_abstract[row] for row in hits.nonzero()[0])
+                    else:
+                        candidate_set.update(with_abstract)
+                candidates = sorted(j for j in candidate_set if j > i)
 
-                # Level 1: URL精确匹配
-                arxiv1 = self.normalize_arxiv_id(paper1.get('pdf_url', ''))
-                arxiv2 = self.normalize_arxiv_id(paper2.get('pdf_url', ''))
+            for j in candidates:
+                paper2_id = paper_ids[j]
 
-                if arxiv1 and arxiv2 and arxiv1 == arxiv2:
-                    duplicates.append(paper2_id)
-                    scores[paper2_id] = 1.0
-                    detection_method = 'exact_url'
-                    logger.info(f"Found exact URL match: {paper1_id} <-> {paper2_id}")
+                if paper2_id in processed_ids:
                     continue
 
                 # Level 2: 标题相似度
-                title_sim = self.compute_title_similarity(
-                    paper1.get('title', ''),
-                    paper2.get('title', '')
-                )
+                if not has_title[i] or not has_title[j]:
+                    title_sim = 0.0
+                elif ratio_matrix is not None and ratio_matrix[i, j] < min_ratio:
+                    title_sim = 0.0
+                elif jaccard_matrix is not None and jaccard_matrix[i, j] < min_jaccard:
+                    title_sim = 0.0
+                else:
+                    if norm_titles[i] == norm_titles[j]:
+                        seq_ratio = 1.0
+                    else:
+                        seq_ratio = SequenceMatcher(None, norm_titles[i], norm_titles[j]).ratio()
+                    title_sim = self._combine_title_similarity(
+                        norm_titles[i], norm_titles[j], seq_ratio, token_sets[i], token_sets[j]
+                    )
 
                 if title_sim >= self.config.TITLE_SIMILARITY_THRESHOLD:
                     duplicates.append(paper2_id)
                     scores[paper2_id] = title_sim
-                    detection_method = 'title_similarity'
+                    detection_method = METHOD_TITLE
                     logger.info(
                         f"Found title similarity match: {paper1_id} <-> {paper2_id} "
                         f"(score: {title_sim:.2f})"
@@ -262,16 +565,18 @@ class Deduplicator:
                     continue
 
                 # Level 3: 语义相似度（可选）
-                if use_semantic and paper1.get('abstract') and paper2.get('abstract'):
-                    semantic_sim = self.compute_semantic_similarity(
-                        paper1.get('abstract', ''),
-                        paper2.get('abstract', '')
-                    )
+                if use_semantic and abstracts[i] and abstracts[j]:
+                    if semantic_neighbors is not None:
+                        semantic_sim = semantic_neighbors[semantic_rows[i]].get(semantic_rows[j], 0.0)
+                    elif semantic_matrix is not None:
+                        semantic_sim = float(semantic_matrix[semantic_rows[i], semantic_rows[j]])
+                    else:
+                        semantic_sim = self.compute_semantic_similarity(abstracts[i], abstracts[j])
 
                     if semantic_sim >= self.config.ABSTRACT_SIMILARITY_THRESHOLD:
                         duplicates.append(paper2_id)
                         scores[paper2_id] = semantic_sim
-                        detection_method = 'semantic_similarity'
+                        detection_method = METHOD_SEMANTIC
                         logger.info(
                             f"Found semantic similarity match: {paper1_id} <-> {paper2_id} "
                             f"(score: {semantic_sim:.2f})"
@@ -362,6 +667,7 @@ class Deduplicator:
 
     def get_deduplication_stats(self, result: DeduplicationResult) -> dict:
         """获取去重统计信息"""
+        method_counts = Counter(g.detection_method for g in result.duplicate_groups)
         return {
             'total_papers': result.total_papers,
             'unique_papers': result.unique_papers,
@@ -369,8 +675,8 @@ class Deduplicator:
             'duplicates_removed': result.duplicates_removed,
             'deduplication_rate': result.duplicates_removed / result.total_papers if result.total_papers > 0 else 0,
             'detection_methods': {
-                'exact_url': sum(1 for g in result.duplicate_groups if g.detection_method == 'exact_url'),
-                'title_similarity': sum(1 for g in result.duplicate_groups if g.detection_method == 'title_similarity'),
-                'semantic_similarity': sum(1 for g in result.duplicate_groups if g.detection_method == 'semantic_similarity'),
+                'exact_url': method_counts[METHOD_EXACT_URL],
+                'title_similarity': method_counts[METHOD_TITLE],
+                'semantic_similarity': method_counts[METHOD_SEMANTIC],
             }
         }
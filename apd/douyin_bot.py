@@ -4,8 +4,10 @@ Douyin Automation Bot for paper overview publishing.
 
 import json
 import platform
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from playwright.sync_api import BrowserContext, Playwright, sync_playwright
 
@@ -18,6 +20,168 @@ logger = get_logger()
 DOUYIN_AUTH_PATH = DATA_DIR / ".douyin_auth.json"
 CREATOR_HOME_URL = "https://creator.douyin.com/"
 UPLOAD_URL = "https://creator.douyin.com/creator-micro/content/upload"
+# Session files younger than this skip the creator-home login check in publish_video
+SESSION_TRUST_SECONDS = 7 * 24 * 3600
+
+# Popup buttons dismissed by DouyinBot.dismiss_popups (exact text match)
+POPUP_BUTTON_TEXTS = [
+    '我知道了',  # Common "Got it" button - also for video preview feature popover
+    '一律不允许',  # "Never allow" for location
+    '仅这次访问时允许',  # "Allow this time"
+    '关闭',  # "Close"
+    '取消',  # "Cancel"
+    '跳过',  # "Skip"
+    '知道了',  # Another "Got it"
+    '暂不开启',  # "Not now"
+    '稍后再说',  # "Later"
+]
+# semi-button primary buttons (common in popovers) are clicked on substring match
+POPUP_PRIMARY_KEYWORDS = ['知道', '确定', '好的']
+
+# Walk the text nodes once, click every visible popup button and return the clicked texts.
+# A label matches the element directly holding that text (like Playwright's text="...");
+# comparing raw text nodes against a Set avoids computing innerText for every element.
+_DISMISS_POPUPS_JS = """
+([labels, keywords]) => {
+    const visible = (el) => {
+        if (!el.getClientRects().length) return false;
+        const style = window.getComputedStyle(el);
+        return style.visibility !== 'hidden' && style.display !== 'none';
+    };
+    const textOf = (el) => (el.innerText || el.textContent || '').trim();
+    const labelSet = new Set(labels);
+    const clicked = [];
+    const seen = new Set();
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        const text = walker.currentNode.data.trim();
+        if (!labelSet.has(text)) continue;
+        const el = walker.currentNode.parentElement;
+        if (!el || seen.has(el) || !visible(el)) continue;
+        seen.add(el);
+        el.click();
+        clicked.push(text);
+    }
+    for (const el of document.querySelectorAll('button.semi-button.semi-button-primary')) {
+        const text = textOf(el);
+        if (!text || !keywords.some((k) => text.includes(k)) || !visible(el)) continue;
+        el.click();
+        clicked.push(text);
+    }
+    return clicked;
+}
+"""
+
+# Upload finished processing: redirected to the post page or title field present
+_UPLOAD_READY_JS = """
+() => location.href.includes('post')
+    || !!document.querySelector('input[placeholder*="填写作品标题"]')
+    || Array.from(document.querySelectorAll('body *')).some(
+        (el) => el.children.length === 0 && (el.textContent || '').trim() === '填写作品标题'
+    )
+"""
+
+# Title input candidates, most specific first
+TITLE_INPUT_SELECTORS = [
+    'input.semi-input[placeholder*="填写作品标题"]',  # Primary selector - the actual input
+    'input[placeholder*="填写作品标题"]',
+    'input.semi-input.semi-input-default',
+    'div[data-placeholder="填写作品标题，为作品获得更多流量"]',
+    'div.zone-container input',
+    'div.title-input',
+    'div[class*="title"] div[contenteditable="true"]',
+    'div.notranslate[contenteditable="true"]',
+]
+
+# Return {el, selector} for the first visible match of the selectors (in order), or {el: null}
+_FIRST_VISIBLE_JS = """
+(selectors) => {
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (el.getClientRects().length && window.getComputedStyle(el).visibility !== 'hidden') {
+                return {el, selector};
+            }
+        }
+    }
+    return {el: null, selector: null};
+}
+"""
+
+# Insert text at the caret of the focused editor (falls back to the topic editor)
+# as one editing command; the resulting input event keeps Douyin's editor state in sync.
+_INSERT_TEXT_JS = """
+(text) => {
+    let el = document.activeElement;
+    if (!el || el === document.body) {
+        el = document.querySelector('div[data-placeholder*="添加话题"], div[contenteditable="true"]');
+        if (!el) return false;
+        el.focus();
+    }
+    return document.execCommand('insertText', false, text);
+}
+"""
+
+# Publish button candidates in priority order: (CSS selector, must contain "发布")
+PUBLISH_BUTTON_SELECTORS = [
+    ['button[class*="primary-"]', True],  # Primary styled button
+    ['button.button-dhlUZE.primary-cECiOJ', False],  # Specific class from browser inspection
+    ['button', True],
+    ['button.primary', True],
+    ['div[class*="publish"] button', False],
+    ['button[class*="primary"]', False],
+]
+
+# Return {el, selector} for the first visible candidate, or {el: null}
+_FIND_PUBLISH_BUTTON_JS = """
+(candidates) => {
+    const visible = (el) => el.getClientRects().length > 0
+        && window.getComputedStyle(el).visibility !== 'hidden';
+    for (const [selector, needsText] of candidates) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (!visible(el)) continue;
+            if (needsText && !(el.innerText || el.textContent || '').includes('发布')) continue;
+            return {el, selector};
+        }
+    }
+    // Last resort: any button with "发布" text, visible or not (enabled ones first)
+    const fallback = Array.from(document.querySelectorAll('button'))
+        .filter((el) => (el.textContent || '').includes('发布'));
+    const el = fallback.find((b) => !b.disabled) || fallback[0];
+    return el ? {el, selector: 'button (any)'} : {el: null, selector: null};
+}
+"""
+
+
+@lru_cache(maxsize=1)
+def _read_storage_state(path: str, mtime_ns: int) -> dict:
+    """Parse a saved session file (cached per path + modification time)."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _load_storage_state() -> Optional[dict]:
+    """
+    Get the saved Douyin session as a dict, or None if there is none.
+
+    Playwright accepts the dict directly, so repeated start() calls (batch and
+    parallel publishing) parse the file once until it changes on disk.
+    """
+    try:
+        mtime_ns = DOUYIN_AUTH_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _read_storage_state(str(DOUYIN_AUTH_PATH), mtime_ns)
+
+
+# Resource types aborted in headless mode (the uploaded video itself is a local file)
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+
+def _block_heavy_resources(route):
+    """Playwright route handler: abort images/media/fonts, pass everything else."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
 
 
 class DouyinBot:
@@ -43,22 +207,29 @@ class DouyinBot:
         """Start the browser and context."""
         self.playwright = sync_playwright().start()
         
-        # Grant geolocation permission to avoid the popup
-        self.browser = self.playwright.chromium.launch(headless=self.headless)
+        # Headless runs never look at the page, so skip images altogether
+        launch_args = ["--blink-settings=imagesEnabled=false"] if self.headless else []
+        self.browser = self.playwright.chromium.launch(headless=self.headless, args=launch_args)
         
         # Load session if exists
-        if DOUYIN_AUTH_PATH.exists():
+        storage_state = _load_storage_state()
+        if storage_state is not None:
             logger.info(f"Loading Douyin session from {DOUYIN_AUTH_PATH}")
             self.context = self.browser.new_context(
-                storage_state=str(DOUYIN_AUTH_PATH),
+                storage_state=storage_state,
                 permissions=["geolocation"],  # Auto-grant location permission
             )
         else:
             logger.info("No Douyin session found, starting fresh")
             self.context = self.browser.new_context(
+                # Grant geolocation permission to avoid the popup
                 permissions=["geolocation"],
             )
             
+        if self.headless:
+            # Images/media/fonts aren't needed to drive the upload form
+            self.context.route("**/*", _block_heavy_resources)
+            
         self.page = self.context.new_page()
 
     def stop(self):
@@ -67,60 +238,42 @@ class DouyinBot:
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
+        self.browser = None
+        self.playwright = None
+        self.context = None
+        self.page = None
 
     def dismiss_popups(self):
         """
         Dismiss common popups that appear on Douyin Creator Studio.
         These include location permission, video preview info, co-creation center, etc.
         """
-        popup_buttons = [
-            '我知道了',  # Common "Got it" button - also for video preview feature popover
-            '一律不允许',  # "Never allow" for location
-            '仅这次访问时允许',  # "Allow this time"
-            '关闭',  # "Close"
-            '取消',  # "Cancel"
-            '跳过',  # "Skip"
-            '知道了',  # Another "Got it"
-            '暂不开启',  # "Not now"
-            '稍后再说',  # "Later"
-        ]
-        
-        # Try multiple times to catch all popups
+        # Try multiple times to catch popups that appear after dismissing others;
+        # each pass is a single page.evaluate round-trip, and a pass that clicks
+        # nothing ends the sweep
+        any_clicked = False
         for _ in range(3):
-            for btn_text in popup_buttons:
-                try:
-                    btns = self.page.locator(f'text="{btn_text}"')
-                    count = btns.count()
-                    for i in range(count):
-                        btn = btns.nth(i)
-                        if btn.is_visible(timeout=200):
-                            logger.info(f"Dismissing popup: clicking '{btn_text}'")
-                            btn.click()
-                            self.page.wait_for_timeout(300)
-                except:
-                    pass
-            
-            # Try to click semi-button primary buttons (common in popovers)
             try:
-                semi_btns = self.page.locator('button.semi-button.semi-button-primary')
-                count = semi_btns.count()
-                for i in range(count):
-                    btn = semi_btns.nth(i)
-                    if btn.is_visible(timeout=200):
-                        btn_text = btn.text_content()
-                        if btn_text and ('知道' in btn_text or '确定' in btn_text or '好的' in btn_text):
-                            logger.info(f"Dismissing semi-button popup: '{btn_text}'")
-                            btn.click()
-                            self.page.wait_for_timeout(300)
-            except:
-                pass
-            
-            # Also try to close any modal dialogs by pressing Escape
-            try:
-                self.page.keyboard.press("Escape")
+                clicked = self.page.evaluate(
+                    _DISMISS_POPUPS_JS, [POPUP_BUTTON_TEXTS, POPUP_PRIMARY_KEYWORDS]
+                )
+            except Exception:
+                break
+            if not clicked:
+                break
+            any_clicked = True
+            for btn_text in clicked:
+                logger.info(f"Dismissing popup: clicking '{btn_text}'")
+            self.page.wait_for_timeout(300)
+        
+        # Also try to close any modal dialogs by pressing Escape; only pause for
+        # the close animation when something was actually dismissed
+        try:
+            self.page.keyboard.press("Escape")
+            if any_clicked:
                 self.page.wait_for_timeout(200)
-            except:
-                pass
+        except:
+            pass
 
     def login(self):
         """
@@ -131,7 +284,8 @@ class DouyinBot:
             raise ValueError("Douyin login requires headful mode. Please run with --headful.")
             
         logger.info(f"Navigating to {CREATOR_HOME_URL} for manual login...")
-        self.page.goto(CREATOR_HOME_URL)
+        # Don't wait for every tracker/image to load; wait_for_selector below gates readiness
+        self.page.goto(CREATOR_HOME_URL, wait_until="commit")
         
         logger.info("Please complete the login manually in the browser...")
         
@@ -147,6 +301,7 @@ class DouyinBot:
             # Save session
             DOUYIN_AUTH_PATH.parent.mkdir(parents=True, exist_ok=True)
             self.context.storage_state(path=str(DOUYIN_AUTH_PATH))
+            _read_storage_state.cache_clear()
             logger.info(f"Session saved to {DOUYIN_AUTH_PATH}")
             return True
         except Exception as e:
@@ -155,7 +310,8 @@ class DouyinBot:
 
     def is_logged_in(self) -> bool:
         """Check if we are logged into Douyin."""
-        self.page.goto(CREATOR_HOME_URL)
+        # domcontentloaded (not load): dismiss_popups only needs the DOM, not every asset
+        self.page.goto(CREATOR_HOME_URL, wait_until="domcontentloaded")
         self.dismiss_popups()  # Dismiss any popups first
         try:
             # Check for "发布视频" or a profile element
@@ -164,6 +320,32 @@ class DouyinBot:
         except:
             return False
 
+    def _quick_login_check(self) -> bool:
+        """Treat a session saved within SESSION_TRUST_SECONDS as logged in (no navigation)."""
+        try:
+            age = time.time() - DOUYIN_AUTH_PATH.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return age < SESSION_TRUST_SECONDS
+
+    def _upload_file(self, video_path: Path) -> bool:
+        """Open the upload page and hand the video to its file input."""
+        logger.info(f"Navigating to upload page: {UPLOAD_URL}")
+        self.page.goto(UPLOAD_URL, wait_until="domcontentloaded")
+        
+        # Wait for page to load and dismiss any popups
+        self.page.wait_for_timeout(2000)
+        self.dismiss_popups()
+        
+        logger.info(f"Uploading video: {video_path}")
+        try:
+            self.page.wait_for_selector('input[type="file"]', timeout=10000)
+            self.page.set_input_files('input[type="file"]', str(video_path))
+            return True
+        except Exception as e:
+            logger.error(f"Could not find file input: {e}")
+            return False
+
     def publish_video(
         self,
         video_path: Path,
@@ -187,47 +369,34 @@ class DouyinBot:
         Returns:
             True if video info filled successfully, False otherwise
         """
-        if not skip_login_check and not self.is_logged_in():
+        # A fresh session file is trusted without visiting the creator home page;
+        # the upload page itself tells us if the session turned out to be stale
+        assumed_login = not skip_login_check and self._quick_login_check()
+        if not skip_login_check and not assumed_login and not self.is_logged_in():
             logger.error("Not logged into Douyin. Run 'apd douyin-login' first.")
             return False
             
-        logger.info(f"Navigating to upload page: {UPLOAD_URL}")
-        self.page.goto(UPLOAD_URL)
-        
-        # Wait for page to load and dismiss any popups
-        self.page.wait_for_timeout(2000)
-        self.dismiss_popups()
-        
         # 1. Upload video
         # Douyin uses a hidden input[type=file]
-        logger.info(f"Uploading video: {video_path}")
-        try:
-            self.page.wait_for_selector('input[type="file"]', timeout=10000)
-            self.page.set_input_files('input[type="file"]', str(video_path))
-        except Exception as e:
-            logger.error(f"Could not find file input: {e}")
-            return False
+        if not self._upload_file(video_path):
+            if not assumed_login:
+                return False
+            if not self.is_logged_in():
+                logger.error("Not logged into Douyin. Run 'apd douyin-login' first.")
+                return False
+            if not self._upload_file(video_path):
+                return False
         
         # 2. Wait for upload to complete - this redirects to the edit page
         logger.info("Waiting for upload to process...")
         
-        # Keep dismissing popups while waiting
-        for _ in range(30):  # Wait up to 30 seconds
-            self.dismiss_popups()
-            self.page.wait_for_timeout(1000)
-            
-            # Check if we're on the post page now (URL contains "post")
-            if "post" in self.page.url:
-                logger.info("Detected redirect to post page.")
-                break
-                
-            # Check if title field is visible
-            try:
-                if self.page.locator('text="填写作品标题"').is_visible():
-                    logger.info("Title field found.")
-                    break
-            except:
-                pass
+        # Returns as soon as we're redirected to the post page or the title field shows up
+        self.dismiss_popups()
+        try:
+            self.page.wait_for_function(_UPLOAD_READY_JS, timeout=30000, polling=500)  # Wait up to 30 seconds
+            logger.info(f"Upload processed, now on {self.page.url}")
+        except Exception:
+            logger.warning("Upload did not finish processing within 30s, continuing anyway")
         
         # Final popup dismissal
         self.page.wait_for_timeout(1000)
@@ -237,41 +406,27 @@ class DouyinBot:
         logger.info(f"Filling title: {title}")
         title_filled = False
         try:
-            # The title input is an input element with class semi-input
-            # Try multiple selectors to find the title input (prioritize the correct one)
-            title_selectors = [
-                'input.semi-input[placeholder*="填写作品标题"]',  # Primary selector - the actual input
-                'input[placeholder*="填写作品标题"]',
-                'input.semi-input.semi-input-default',
-                'div[data-placeholder="填写作品标题，为作品获得更多流量"]',
-                'div.zone-container input',
-                'div.title-input', 
-                'div[class*="title"] div[contenteditable="true"]',
-                'div.notranslate[contenteditable="true"]',
-            ]
-            
-            for selector in title_selectors:
+            # The title input is an input element with class semi-input;
+            # find the first visible candidate (in priority order) in one DOM pass
+            found = self.page.evaluate_handle(_FIRST_VISIBLE_JS, TITLE_INPUT_SELECTORS)
+            title_input = found.get_property("el").as_element()
+            if title_input:
+                selector = found.get_property("selector").json_value()
                 try:
-                    title_input = self.page.locator(selector).first
-                    if title_input.is_visible(timeout=1000):
-                        logger.info(f"Found title input with selector: {selector}")
-                        title_input.click()
-                        self.page.wait_for_timeout(300)
-                        # Clear any existing content first (use Meta+a for macOS, Control+a for others)
-                        select_all_key = "Meta+a" if platform.system() == "Darwin" else "Control+a"
-                        self.page.keyboard.press(select_all_key)
-                        self.page.wait_for_timeout(100)
-                        # For input elements, we can use fill() which is more reliable
-                        if selector.startswith('input'):
-                            title_input.fill(title)
-                        else:
-                            self.page.keyboard.type(title)
-                        title_filled = True
-                        logger.info(f"Title filled successfully: {title}")
-                        break
+                    logger.info(f"Found title input with selector: {selector}")
+                    title_input.click()
+                    # Clear any existing content first (use Meta+a for macOS, Control+a for others)
+                    select_all_key = "Meta+a" if platform.system() == "Darwin" else "Control+a"
+                    self.page.keyboard.press(select_all_key)
+                    # For input elements, we can use fill() which is more reliable
+                    if selector.startswith('input'):
+                        title_input.fill(title)
+                    else:
+                        self.page.keyboard.type(title)
+                    title_filled = True
+                    logger.info(f"Title filled successfully: {title}")
                 except Exception as e:
                     logger.debug(f"Selector {selector} failed: {e}")
-                    continue
             
             if not title_filled:
                 # Try clicking directly on the placeholder text
@@ -279,7 +434,6 @@ class DouyinBot:
                 placeholder = self.page.locator('text="填写作品标题，为作品获得更多流量"').first
                 if placeholder.is_visible(timeout=2000):
                     placeholder.click()
-                    self.page.wait_for_timeout(300)
                     self.page.keyboard.type(title)
                     title_filled = True
                     logger.info(f"Title filled via placeholder click: {title}")
@@ -322,10 +476,18 @@ class DouyinBot:
         logger.info("Filling tags...")
         if tags:
             try:
-                # Tags are added after description in the same area
-                for tag in tags:
-                    self.page.keyboard.type(f"#{tag} ")
-                    self.page.wait_for_timeout(500)
+                # Tags are added after description in the same area, inserted
+                # in one editing command instead of typed key by key
+                tag_text = "".join(f"#{tag} " for tag in tags)
+                if not self.page.evaluate(_INSERT_TEXT_JS, tag_text):
+                    self.page.keyboard.type(tag_text)
+                # Hashtag suggestions close once the trailing space commits the tag
+                try:
+                    self.page.locator('.semi-autocomplete-option').first.wait_for(
+                        state="hidden", timeout=1000
+                    )
+                except Exception:
+                    pass
             except Exception as e:
                 logger.warning(f"Could not fill tags: {e}")
 
@@ -339,10 +501,7 @@ class DouyinBot:
             if transcoding.is_visible():
                 logger.info("Video is still transcoding, waiting...")
                 # Wait up to 60 seconds for transcoding
-                for _ in range(12):
-                    self.page.wait_for_timeout(5000)
-                    if not transcoding.is_visible():
-                        break
+                transcoding.first.wait_for(state="hidden", timeout=60000)
         except:
             pass
         
@@ -363,57 +522,30 @@ class DouyinBot:
             self.dismiss_popups()
 
             try:
-                # Try multiple selectors for the publish button (prioritize more specific ones)
-                publish_selectors = [
-                    'button[class*="primary-"]:has-text("发布")',  # Primary styled button
-                    'button.button-dhlUZE.primary-cECiOJ',  # Specific class from browser inspection
-                    'button:has-text("发布")',
-                    'button.primary:has-text("发布")',
-                    'div[class*="publish"] button',
-                    'button[class*="primary"]',
-                ]
-
-                for selector in publish_selectors:
-                    try:
-                        publish_btn = self.page.locator(selector).first
-
-                        # Wait for it to be visible
-                        if publish_btn.is_visible(timeout=3000):
-                            # Scroll the button into view
-                            publish_btn.scroll_into_view_if_needed()
-                            self.page.wait_for_timeout(300)
-
-                            # Wait for button to be enabled
-                            max_wait = 30  # Wait up to 30 seconds
-                            for i in range(max_wait):
-                                if not publish_btn.is_disabled():
-                                    break
-                                logger.info(f"Publish button is disabled, waiting... ({i+1}/{max_wait}s)")
-                                self.page.wait_for_timeout(1000)
-
-                            # Click the button
-                            publish_btn.click()
-                            publish_clicked = True
-                            logger.info(f"Publish button clicked using selector: {selector}")
-                            break
-                    except Exception as e:
-                        logger.debug(f"Selector {selector} failed: {e}")
-                        continue
-
-                if not publish_clicked:
-                    # Last resort: try to find any button with "发布" text
-                    logger.info("Trying to find any button with 发布 text...")
-                    all_buttons = self.page.locator('button').all()
-                    for btn in all_buttons:
-                        try:
-                            btn_text = btn.text_content()
-                            if btn_text and '发布' in btn_text:
-                                btn.click()
-                                publish_clicked = True
-                            logger.info(f"Clicked button with text: {btn_text}")
+                # Find the publish button in one DOM pass (selectors in priority order)
+                found = self.page.evaluate_handle(_FIND_PUBLISH_BUTTON_JS, PUBLISH_BUTTON_SELECTORS)
+                publish_btn = found.get_property("el").as_element()
+
+                if publish_btn:
+                    selector = found.get_property("selector").json_value()
+                    logger.info(f"Found publish button using selector: {selector}")
+
+                    # Scroll the button into view
+                    publish_btn.scroll_into_view_if_needed()
+                    self.page.wait_for_timeout(300)
+
+                    # Wait for button to be enabled
+                    max_wait = 30  # Wait up to 30 seconds
+                    for i in range(max_wait):
+                        if not publish_btn.is_disabled():
                             break
-                        except:
-                            continue
+                        logger.info(f"Publish button is disabled, waiting... ({i+1}/{max_wait}s)")
+                        self.page.wait_for_timeout(1000)
+
+                    # Click the button
+                    publish_btn.click()
+                    publish_clicked = True
+                    logger.info("Publish button clicked")
 
             except Exception as e:
                 logger.error(f"Error while trying to click publish: {e}")
@@ -462,3 +594,53 @@ class DouyinBot:
             logger.info("✅ User confirmed publish")
 
             return True
+
+    def publish_many(
+        self,
+        videos: list[tuple[Path, str, str, list[str]]],
+        skip_login_check: bool = False,
+        auto_publish: bool = False,
+        on_start: Optional[Callable[[int], None]] = None,
+        on_result: Optional[Callable[[int, bool], None]] = None
+    ) -> list[bool]:
+        """
+        Publishes several videos in one browser session.
+
+        Login is checked once; every video reuses the same page, so Chromium
+        startup and session loading are paid only once per batch.
+
+        Args:
+            videos: List of (video_path, title, description, tags)
+            skip_login_check: Skip the login check (caller already verified it)
+            auto_publish: Auto-click publish button for each video
+            on_start: Called with the video's index before it is published
+            on_result: Called with the video's index and success flag after it
+
+        Returns:
+            One success flag per video, in input order
+        """
+        if not skip_login_check and not self.is_logged_in():
+            logger.error("Not logged into Douyin. Run 'apd douyin-login' first.")
+            return [False] * len(videos)
+
+        results = []
+        for idx, (video_path, title, description, tags) in enumerate(videos, 1):
+            logger.info(f"Publishing video {idx}/{len(videos)}: {video_path}")
+            if on_start:
+                on_start(idx - 1)
+            try:
+                ok = self.publish_video(
+                    video_path=video_path,
+                    title=title,
+                    description=description,
+                    tags=tags,
+                    skip_login_check=True,
+                    auto_publish=auto_publish
+                )
+            except Exception as e:
+                logger.error(f"Failed to publish {video_path}: {e}")
+                ok = False
+            results.append(bool(ok))
+            if on_result:
+                on_result(idx - 1, bool(ok))
+        return results
@@ -0,0 +1,29 @@
+"""
+Embedding model loader for Auto Paper Digest.
+
+Shares one in-memory Sentence-BERT model per model name between the
+deduplicator and the recommender.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=2)
+def get_embedding_model(name: str):
+    """
+    Load a SentenceTransformer model once per process.
+
+    sentence_transformers is imported here so commands that never embed
+    do not pay the torch import cost.
+
+    Args:
+        name: Model name (e.g., "all-MiniLM-L6-v2")
+
+    Returns:
+        SentenceTransformer instance
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(name)
@@ -7,11 +7,16 @@ GitHub Trending 热门项目获取模块
 - 支持按编程语言过滤
 """
 
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 
 from .config import (
     GITHUB_TRENDING_URL,
@@ -20,11 +25,34 @@ from .config import (
     REQUEST_TIMEOUT,
     USER_AGENT,
 )
-from .db import upsert_paper
+from .db import upsert_paper, upsert_papers_bulk
+from .http_cache import cached_get
 from .utils import get_logger
 
 logger = get_logger()
 
+_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml",
+}
+
+# 计数文本，如 "1,234"、"1.2k"、"12 stars today"
+_NUM_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([kKmM]?)')
+_NUM_MULTIPLIERS = {'': 1, 'k': 1000, 'K': 1000, 'm': 1_000_000, 'M': 1_000_000}
+
+# 只解析 Trending 列表中的项目条目，其余页面结构直接跳过
+_ARTICLE_STRAINER = SoupStrainer('article', class_='Box-row')
+
+# 一次 select 取出项目条目中需要的全部节点（按文档顺序返回）
+_PROJECT_FIELDS_SELECTOR = ', '.join([
+    'h2.h3',
+    'p.col-9',
+    'span[itemprop="programmingLanguage"]',
+    'a.Link--muted[href*="/stargazers"]',
+    'a.Link--muted[href*="/forks"]',
+    'span.d-inline-block',
+])
+
 
 def fetch_daily_github_trending(
     date: str,
@@ -58,8 +86,8 @@ def fetch_daily_github_trending(
     # 获取项目列表
     projects = _fetch_github_trending(max_projects, language, since)
 
-    # 存入数据库
-    saved_count = 0
+    # 存入数据库（整批一次事务写入）
+    records = []
     for project in projects:
         try:
             # 评估质量
@@ -70,7 +98,7 @@ def fetch_daily_github_trending(
                 description=project.get('description')
             )
 
-            upsert_paper(
+            records.append(dict(
                 paper_id=project['id'],
                 week_id=date,  # 使用日期作为 week_id
                 title=project['name'],
@@ -89,10 +117,22 @@ def fetch_daily_github_trending(
                 filtered_out=0 if score.passed else 1,
                 filter_reason=None if score.passed else "质量评分低于阈值",
                 evaluated_at=now_iso()
-            )
-            saved_count += 1
+            ))
         except Exception as e:
-            logger.error(f"Failed to save project {project['name']}: {e}")
+            logger.error(f"Failed to evaluate project {project.get('name')}: {e}")
+
+    saved_count = 0
+    try:
+        saved_count = upsert_papers_bulk(records)
+    except Exception as e:
+        # 整批失败时逐条写入，只丢弃真正出错的记录
+        logger.warning(f"Batch save failed ({e}), falling back to per-project upsert")
+        for record in records:
+            try:
+                upsert_paper(**record)
+                saved_count += 1
+            except Exception as e:
+                logger.error(f"Failed to save project {record['title']}: {e}")
 
     logger.info(f"Saved {saved_count}/{len(projects)} projects to database")
     return projects
@@ -121,10 +161,93 @@ def fetch_weekly_github_trending(
     return fetch_daily_github_trending(current_date, max_projects, language, since="weekly")
 
 
+def fetch_trending_batch(
+    combos: List[Tuple[Optional[str], str]],
+    max_projects: int = 50
+) -> Dict[Tuple[Optional[str], str], List[dict]]:
+    """
+    并发获取多个 (语言, 时间范围) 组合的 GitHub Trending 项目（不写数据库）
+
+    安装了 httpx 时用一个 AsyncClient 并发请求（有 h2 时走 HTTP/2 多路复用），
+    否则用线程池并发调用 requests；总耗时约为最慢一次请求而非所有请求之和。
+
+    Args:
+        combos: [(language, since), ...]，language 为 None 表示全部语言
+        max_projects: 每个组合的最大项目数量
+
+    Returns:
+        {(language, since): 项目列表}；单个组合失败时对应空列表
+    """
+    combos = list(dict.fromkeys(combos))
+    if not combos:
+        return {}
+
+    try:
+        import httpx
+    except ImportError:
+        httpx = None
+
+    if httpx is None:
+        with ThreadPoolExecutor(max_workers=min(8, len(combos))) as executor:
+            results = executor.map(
+                lambda combo: _fetch_github_trending(max_projects, combo[0], combo[1]), combos
+            )
+            return dict(zip(combos, results))
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    async def fetch_one(client, language: Optional[str], since: str) -> List[dict]:
+        url = _trending_url(language)
+        try:
+            logger.info(f"Fetching from: {url} (since={since})")
+            response = await client.get(url, params={"since": since})
+            response.raise_for_status()
+            return _parse_trending_html(response.text, max_projects)
+        except Exception as e:
+            logger.error(f"Failed to fetch GitHub Trending ({language}, {since}): {e}")
+            return []
+
+    async def fetch_all() -> List[List[dict]]:
+        async with httpx.AsyncClient(
+            http2=http2, headers=_HEADERS, timeout=REQUEST_TIMEOUT, follow_redirects=True
+        ) as client:
+            return await asyncio.gather(
+                *(fetch_one(client, language, since) for language, since in combos)
+            )
+
+    return dict(zip(combos, asyncio.run(fetch_all())))
+
+
 # ============================================================================
 # GitHub Trending 爬虫
 # ============================================================================
 
+# Trending 页面短时间内不会变化，重复请求直接命中磁盘页面缓存（apd.http_cache）
+HTTP_CACHE_TTL_SECONDS = 300
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
+    """获取模块级 HTTP 会话（复用 TCP/TLS 连接）"""
+    session = requests.Session()
+    session.headers.update(_HEADERS)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _trending_url(language: Optional[str]) -> str:
+    """构建 Trending 页面 URL"""
+    if language:
+        return GITHUB_TRENDING_LANGUAGE_URL.format(language=language)
+    return GITHUB_TRENDING_URL
+
+
 def _fetch_github_trending(
     max_projects: int,
     language: Optional[str] = None,
@@ -141,38 +264,14 @@ def _fetch_github_trending(
     Returns:
         项目列表，每个项目包含: id, name, url, description, stars, stars_today, language, forks
     """
-    # 构建 URL
-    if language:
-        url = GITHUB_TRENDING_LANGUAGE_URL.format(language=language)
-    else:
-        url = GITHUB_TRENDING_URL
-
-    params = {"since": since}
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept": "text/html,application/xhtml+xml",
-    }
+    url = _trending_url(language)
 
     try:
         logger.info(f"Fetching from: {url} (since={since})")
-        response = requests.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # 页面缓存按完整 URL 建键，since 需写进 URL 而不是作为 params 传入
+        html, _ = cached_get(f"{url}?since={since}", HTTP_CACHE_TTL_SECONDS, _get_session())
 
-        projects = []
-
-        # GitHub Trending 使用 article 标签包裹每个项目
-        articles = soup.find_all('article', class_='Box-row')
-
-        for idx, article in enumerate(articles[:max_projects], 1):
-            try:
-                project_data = _parse_github_project(article, idx)
-                if project_data:
-                    projects.append(project_data)
-            except Exception as e:
-                logger.warning(f"Failed to parse GitHub project: {e}")
-                continue
+        projects = _parse_trending_html(html.decode("utf-8", errors="replace"), max_projects)
 
         logger.info(f"Fetched {len(projects)} GitHub projects")
         return projects
@@ -182,92 +281,170 @@ def _fetch_github_trending(
         return []
 
 
-def _parse_github_project(article, rank: int) -> Optional[dict]:
+def _parse_trending_html(html: str, max_projects: int) -> List[dict]:
+    """
+    解析 Trending 页面 HTML
+
+    优先使用 C 实现的 selectolax（可选依赖），未安装时回退到 BeautifulSoup + lxml。
+
+    Args:
+        html: 页面 HTML
+        max_projects: 最大项目数量
+
+    Returns:
+        项目列表
+    """
+    try:
+        from selectolax.parser import HTMLParser
+    except ImportError:
+        HTMLParser = None
+
+    if HTMLParser is not None:
+        articles = HTMLParser(html).css('article.Box-row')
+        collect = _collect_project_fields_lax
+    else:
+        # GitHub Trending 使用 article 标签包裹每个项目；lxml + SoupStrainer 只构建这些节点
+        soup = BeautifulSoup(html, 'lxml', parse_only=_ARTICLE_STRAINER)
+        articles = soup.find_all('article', class_='Box-row')
+        collect = _collect_project_fields
+
+    projects = []
+    for idx, article in enumerate(articles[:max_projects], 1):
+        try:
+            project_data = _build_project(collect(article), idx)
+            if project_data:
+                projects.append(project_data)
+        except Exception as e:
+            logger.warning(f"Failed to parse GitHub project: {e}")
+            continue
+
+    return projects
+
+
+def _collect_project_fields(article) -> dict:
     """
-    解析单个 GitHub 项目的 HTML
+    用一次 CSS select 收集项目条目的各字段文本（BeautifulSoup）
+
+    每个字段取文档顺序中的第一个匹配（与逐个 find 的结果一致）。
 
     Args:
         article: BeautifulSoup article 元素
+
+    Returns:
+        {字段名: 文本}，键为 href/description/language/stars/forks/stars_today，缺失为 None
+    """
+    nodes = {}
+    for node in article.select(_PROJECT_FIELDS_SELECTOR):
+        classes = node.get('class') or []
+        if node.name == 'h2':
+            key = 'name'
+        elif node.name == 'p':
+            key = 'description'
+        elif node.name == 'a':
+            key = 'stars' if '/stargazers' in node.get('href', '') else 'forks'
+        elif node.get('itemprop') == 'programmingLanguage':
+            key = 'language'
+        else:
+            key = None
+        if key:
+            nodes.setdefault(key, node)
+        # span 可能同时是语言节点和 d-inline-block（互不排斥）
+        if node.name == 'span' and 'd-inline-block' in classes:
+            nodes.setdefault('stars_today', node)
+
+    h2 = nodes.pop('name', None)
+    link = h2.find('a') if h2 else None
+    fields = {key: node.text for key, node in nodes.items()}
+    fields['href'] = link.get('href', '') if link else None
+    return fields
+
+
+def _collect_project_fields_lax(article) -> dict:
+    """
+    收集项目条目的各字段文本（selectolax 节点，字段含义同 _collect_project_fields）
+    """
+    def text_of(selector: str) -> Optional[str]:
+        node = article.css_first(selector)
+        return node.text() if node is not None else None
+
+    link = article.css_first('h2.h3 a')
+    return {
+        'href': (link.attributes.get('href') or '') if link is not None else None,
+        'description': text_of('p.col-9'),
+        'language': text_of('span[itemprop="programmingLanguage"]'),
+        'stars': text_of('a.Link--muted[href*="/stargazers"]'),
+        'forks': text_of('a.Link--muted[href*="/forks"]'),
+        'stars_today': text_of('span.d-inline-block'),
+    }
+
+
+def _to_int(text: Optional[str]) -> int:
+    """解析计数文本（支持千分位逗号与 k/M 后缀），无法解析时返回 0"""
+    match = _NUM_RE.search(text or '')
+    if not match:
+        return 0
+    return int(float(match.group(1).replace(',', '')) * _NUM_MULTIPLIERS[match.group(2)])
+
+
+def _build_project(fields: dict, rank: int) -> Optional[dict]:
+    """
+    由字段文本构建项目信息
+
+    Args:
+        fields: _collect_project_fields / _collect_project_fields_lax 的结果
         rank: 排名
 
     Returns:
-        项目信息字典
+        项目信息字典；缺少项目链接时返回 None
     """
-    try:
-        # 1. 提取项目名称和 URL
-        h2 = article.find('h2', class_='h3')
-        if not h2:
-            return None
-
-        link = h2.find('a')
-        if not link:
-            return None
-
-        # 项目完整路径，如 "owner/repo"
-        repo_path = link.get('href', '').strip('/')
-        if not repo_path:
-            return None
-
-        # 项目名称
-        repo_name = repo_path.split('/')[-1]
-
-        # 完整 URL
-        repo_url = f"https://github.com/{repo_path}"
-
-        # 生成唯一 ID
-        project_id = f"github-{repo_path.replace('/', '-')}"
-
-        # 2. 提取描述
-        description_elem = article.find('p', class_='col-9')
-        description = description_elem.text.strip() if description_elem else ""
-
-        # 3. 提取编程语言
-        language_elem = article.find('span', itemprop='programmingLanguage')
-        language = language_elem.text.strip() if language_elem else None
-
-        # 4. 提取星标数（总数）
-        stars = 0
-        star_link = article.find('a', class_='Link--muted', href=lambda x: x and '/stargazers' in x)
-        if star_link:
-            stars_text = star_link.text.strip().replace(',', '').replace('k', '000')
-            try:
-                stars = int(float(stars_text))
-            except:
-                pass
-
-        # 5. 提取今日新增星标
-        stars_today = 0
-        stars_today_span = article.find('span', class_='d-inline-block')
-        if stars_today_span and '今日' not in stars_today_span.text and 'today' in stars_today_span.text.lower():
-            stars_today_text = stars_today_span.text.strip().split()[0].replace(',', '')
-            try:
-                stars_today = int(stars_today_text)
-            except:
-                pass
-
-        # 6. 提取 Forks 数
-        forks = 0
-        fork_link = article.find('a', class_='Link--muted', href=lambda x: x and '/forks' in x)
-        if fork_link:
-            forks_text = fork_link.text.strip().replace(',', '')
-            try:
-                forks = int(forks_text)
-            except:
-                pass
-
-        return {
-            'id': project_id,
-            'name': repo_name,
-            'full_name': repo_path,
-            'url': repo_url,
-            'description': description,
-            'language': language,
-            'stars': stars,
-            'stars_today': stars_today,
-            'forks': forks,
-            'rank': rank,
-        }
+    # 1. 提取项目名称和 URL
+    href = fields.get('href')
+    if href is None:
+        return None
 
-    except Exception as e:
-        logger.error(f"Error parsing GitHub project: {e}")
+    # 项目完整路径，如 "owner/repo"
+    repo_path = href.strip('/')
+    if not repo_path:
         return None
+
+    # 项目名称
+    repo_name = repo_path.split('/')[-1]
+
+    # 完整 URL
+    repo_url = f"https://github.com/{repo_path}"
+
+    # 生成唯一 ID
+    project_id = f"github-{repo_path.replace('/', '-')}"
+
+    # 2. 提取描述
+    description_text = fields.get('description')
+    description = description_text.strip() if description_text is not None else ""
+
+    # 3. 提取编程语言
+    language_text = fields.get('language')
+    language = language_text.strip() if language_text is not None else None
+
+    # 4. 提取星标数（总数）
+    stars = _to_int(fields.get('stars'))
+
+    # 5. 提取今日新增星标
+    stars_today = 0
+    stars_today_text = fields.get('stars_today')
+    if stars_today_text and '今日' not in stars_today_text and 'today' in stars_today_text.lower():
+        stars_today = _to_int(stars_today_text)
+
+    # 6. 提取 Forks 数
+    forks = _to_int(fields.get('forks'))
+
+    return {
+        'id': project_id,
+        'name': repo_name,
+        'full_name': repo_path,
+        'url': repo_url,
+        'description': description,
+        'language': language,
+        'stars': stars,
+        'stars_today': stars_today,
+        'forks': forks,
+        'rank': rank,
+    }
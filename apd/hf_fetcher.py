@@ -4,12 +4,19 @@ Hugging Face papers fetcher module.
 Scrapes weekly papers from Hugging Face and stores them in the database.
 """
 
+import json
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
 
 from .config import (
     ARXIV_PDF_URL,
@@ -17,24 +24,61 @@ from .config import (
     HF_PAPERS_DATE_URL,
     HF_PAPERS_URL,
     HF_PAPERS_WEEK_URL,
-    REQUEST_TIMEOUT,
     USER_AGENT,
 )
-from .db import get_paper, upsert_paper
-from .utils import get_logger, parse_week_id
+from .db import get_papers_bulk, upsert_papers_bulk
+from .http_cache import cached_get
+from .quality_filter import QualityFilter
+from .utils import get_logger, now_iso, parse_week_id
 
 logger = get_logger()
 
+# HF paper URLs are like: /papers/2601.03252
+_PAPER_HREF_RE = re.compile(r"^/papers/(\d{4}\.\d{4,5})$")
+# Date page URL after redirects: /papers/date/YYYY-MM-DD
+_DATE_URL_MARKER = "/papers/date/"
+_ABSTRACT_RE = re.compile(r"Abstract", re.I)
+# Listing pages: paper anchors (the XPath form of CSS a[href^="/papers/"],
+# evaluated in C without a cssselect dependency), and the first heading
+# of an anchor's enclosing block
+_PAPER_LINKS_XPATH = etree.XPath("//a[starts-with(@href, '/papers/')]")
+_PARENT_HEADING_XPATH = etree.XPath(
+    "(ancestor::*[self::article or self::div][1]//*[self::h3 or self::h2 or self::h1])[1]"
+)
+# ARXIV_PDF_URL split around {paper_id}, so URLs are built with one f-string
+_PDF_URL_HEAD, _, _PDF_URL_TAIL = ARXIV_PDF_URL.partition("{paper_id}")
+# 直接解析原始字节；HF 页面均为 UTF-8，显式指定以免无 meta charset 时按 latin-1 解码
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# 模块级会话：复用到 huggingface.co 的 TCP/TLS 连接（周回退路径有 7 个并发请求）
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=3))
+
+# 磁盘页面缓存 TTL（过期后用 ETag 重新验证）：包含今天的页面仍在变化，过去的日期基本不变
+PAGE_TTL_RECENT_SECONDS = 10 * 60
+PAGE_TTL_PAST_SECONDS = 24 * 3600
+
+
+def _page_ttl(dates) -> int:
+    """Disk-cache TTL for a page covering the given YYYY-MM-DD dates."""
+    if max(dates) >= datetime.now().strftime("%Y-%m-%d"):
+        return PAGE_TTL_RECENT_SECONDS
+    return PAGE_TTL_PAST_SECONDS
+
 
-def get_dates_for_week(week_id: str) -> list[str]:
+@lru_cache(maxsize=256)
+def get_dates_for_week(week_id: str) -> tuple[str, ...]:
     """
     Get all dates (YYYY-MM-DD) for a given week.
     
+    Results are cached, so the tuple is shared between callers.
+    
     Args:
         week_id: Week identifier (e.g., "2026-01")
         
     Returns:
-        List of date strings for that week (Monday to Sunday)
+        Tuple of date strings for that week (Monday to Sunday)
     """
     year, week = parse_week_id(week_id)
     
@@ -45,14 +89,17 @@ def get_dates_for_week(week_id: str) -> list[str]:
     monday = start_of_week1 + timedelta(weeks=week - 1)
     
     # Generate all 7 days of the week
-    dates = []
-    for i in range(7):
-        day = monday + timedelta(days=i)
-        dates.append(day.strftime("%Y-%m-%d"))
-    
-    return dates
+    try:
+        import numpy as np
+    except ImportError:
+        return tuple((monday + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7))
 
+    # datetime64[D] 的字符串形式即 YYYY-MM-DD，7 天一次在 C 层生成
+    days = np.datetime64(monday.date(), "D") + np.arange(7)
+    return tuple(days.astype(str).tolist())
 
+
+@lru_cache(maxsize=256)
 def week_id_to_iso_week(week_id: str) -> str:
     """
     Convert week_id format (e.g., "2026-01") to ISO week format (e.g., "2026-W01").
@@ -67,75 +114,107 @@ def week_id_to_iso_week(week_id: str) -> str:
     return f"{year}-W{week:02d}"
 
 
-def fetch_papers_for_week_url(week_id: str, max_papers: Optional[int] = None) -> list[dict]:
+def _paper_title_from_parent(link) -> str:
+    """Find a paper title in the article/div enclosing a link (h3/h2/h1)."""
+    headings = _PARENT_HEADING_XPATH(link)
+    return _stripped_text(headings[0]) if headings else ""
+
+
+def _stripped_text(element) -> str:
+    """Concatenate an element's text pieces, each stripped (like get_text(strip=True))."""
+    return "".join(piece.strip() for piece in element.itertext())
+
+
+def _parse_paper_links(html: bytes, max_papers: Optional[int] = None) -> list[dict]:
     """
-    Fetch papers from HF using the week URL format.
+    Extract unique paper entries from an HF listing page.
     
-    Uses https://huggingface.co/papers/week/YYYY-WXX
+    Shared by all listing fetchers (week, date and date-page URLs).
+    Parses with lxml directly and selects /papers/ anchors with a
+    precompiled XPath; titles come from the link text, or from the
+    enclosing article/div heading when the link text is too short.
     
     Args:
-        week_id: Week identifier (e.g., "2026-01")
-        max_papers: Maximum papers to fetch (None for all)
+        html: Raw listing page bytes
+        max_papers: Maximum papers to return (None for all)
         
     Returns:
         List of paper dicts with keys: paper_id, title, hf_url, pdf_url
     """
-    iso_week = week_id_to_iso_week(week_id)
-    url = HF_PAPERS_WEEK_URL.format(week=iso_week)
-    logger.info(f"Fetching papers from week URL: {url}")
-    
-    headers = {"User-Agent": USER_AGENT}
-    
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-    except requests.RequestException as e:
-        logger.error(f"Failed to fetch papers for week {iso_week}: {e}")
+        tree = lxml.html.fromstring(html, parser=_HTML_PARSER)
+    except (etree.ParserError, ValueError):
         return []
-    
-    soup = BeautifulSoup(response.text, "lxml")
     papers = []
+    seen: set[str] = set()
+    # None/0 表示不限；入口处归一化为整数上限，循环内只做一次整数比较
+    cap = max_papers or sys.maxsize
+    n = 0
     
-    # Find paper links - they're in article elements or links matching the pattern
-    # HF paper URLs are like: /papers/2601.03252
-    paper_pattern = re.compile(r"^/papers/(\d{4}\.\d{4,5})$")
+    # 有上限时惰性遍历锚点，凑够即停；否则一次 XPath 在 C 层完成筛选
+    links = tree.iter("a") if max_papers else _PAPER_LINKS_XPATH(tree)
     
-    # Look for article elements with paper links
-    for link in soup.find_all("a", href=paper_pattern):
+    for link in links:
         href = link.get("href", "")
-        match = paper_pattern.match(href)
+        # 惰性路径未经 XPath 预筛：先用 str.startswith 挡掉非论文链接，正则只做 ID 校验
+        if not href.startswith("/papers/"):
+            continue
+        match = _PAPER_HREF_RE.match(href)
         if not match:
             continue
             
         paper_id = match.group(1)
         
         # Avoid duplicates
-        if any(p["paper_id"] == paper_id for p in papers):
+        if paper_id in seen:
             continue
+        seen.add(paper_id)
         
         # Try to get the title from the link text or parent
-        title = link.get_text(strip=True)
+        title = _stripped_text(link)
         if not title or len(title) < 5:
             # Try to find title in parent elements
-            parent = link.find_parent(["article", "div"])
-            if parent:
-                h3 = parent.find(["h3", "h2", "h1"])
-                if h3:
-                    title = h3.get_text(strip=True)
-        
-        hf_url = f"{HF_PAPERS_URL}/{paper_id}"
-        pdf_url = ARXIV_PDF_URL.format(paper_id=paper_id)
+            title = _paper_title_from_parent(link) or title
         
         papers.append({
             "paper_id": paper_id,
             "title": title or f"Paper {paper_id}",
-            "hf_url": hf_url,
-            "pdf_url": pdf_url,
+            "hf_url": f"{HF_PAPERS_URL}/{paper_id}",
+            "pdf_url": f"{_PDF_URL_HEAD}{paper_id}{_PDF_URL_TAIL}",
         })
         
-        if max_papers and len(papers) >= max_papers:
+        n += 1
+        if n >= cap:
             break
     
+    return papers
+
+
+def fetch_papers_for_week_url(week_id: str, max_papers: Optional[int] = None) -> list[dict]:
+    """
+    Fetch papers from HF using the week URL format.
+    
+    Uses https://huggingface.co/papers/week/YYYY-WXX
+    
+    Args:
+        week_id: Week identifier (e.g., "2026-01")
+        max_papers: Maximum papers to fetch (None for all)
+        
+    Returns:
+        List of paper dicts with keys: paper_id, title, hf_url, pdf_url
+    """
+    iso_week = week_id_to_iso_week(week_id)
+    url = HF_PAPERS_WEEK_URL.format(week=iso_week)
+    logger.info(f"Fetching papers from week URL: {url}")
+    
+    try:
+        html, _ = cached_get(url, _page_ttl(get_dates_for_week(week_id)), _SESSION)
+    except requests.RequestException as e:
+        logger.error(f"Failed to fetch papers for week {iso_week}: {e}")
+        return []
+    
+    papers = _parse_paper_links(html, max_papers)
+    
     logger.info(f"Found {len(papers)} papers for week {iso_week}")
     return papers
 
@@ -154,57 +233,13 @@ def fetch_papers_for_date(date: str, max_papers: Optional[int] = None) -> list[d
     url = HF_PAPERS_DATE_URL.format(date=date)
     logger.debug(f"Fetching papers from: {url}")
     
-    headers = {"User-Agent": USER_AGENT}
-    
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
+        html, _ = cached_get(url, _page_ttl((date,)), _SESSION)
     except requests.RequestException as e:
         logger.error(f"Failed to fetch papers for {date}: {e}")
         return []
     
-    soup = BeautifulSoup(response.text, "lxml")
-    papers = []
-    
-    # Find paper links - they're in article elements or links matching the pattern
-    # HF paper URLs are like: /papers/2601.03252
-    paper_pattern = re.compile(r"^/papers/(\d{4}\.\d{4,5})$")
-    
-    # Look for article elements with paper links
-    for link in soup.find_all("a", href=paper_pattern):
-        href = link.get("href", "")
-        match = paper_pattern.match(href)
-        if not match:
-            continue
-            
-        paper_id = match.group(1)
-        
-        # Avoid duplicates
-        if any(p["paper_id"] == paper_id for p in papers):
-            continue
-        
-        # Try to get the title from the link text or parent
-        title = link.get_text(strip=True)
-        if not title or len(title) < 5:
-            # Try to find title in parent elements
-            parent = link.find_parent(["article", "div"])
-            if parent:
-                h3 = parent.find(["h3", "h2", "h1"])
-                if h3:
-                    title = h3.get_text(strip=True)
-        
-        hf_url = f"{HF_PAPERS_URL}/{paper_id}"
-        pdf_url = ARXIV_PDF_URL.format(paper_id=paper_id)
-        
-        papers.append({
-            "paper_id": paper_id,
-            "title": title or f"Paper {paper_id}",
-            "hf_url": hf_url,
-            "pdf_url": pdf_url,
-        })
-        
-        if max_papers and len(papers) >= max_papers:
-            break
+    papers = _parse_paper_links(html, max_papers)
     
     logger.info(f"Found {len(papers)} papers for date {date}")
     return papers
@@ -234,23 +269,22 @@ def fetch_papers_for_date_page(date: str, max_papers: Optional[int] = None) -> t
     url = HF_PAPERS_DATE_PAGE_URL.format(date=date)
     logger.info(f"Fetching papers from date page: {url}")
     
-    headers = {"User-Agent": USER_AGENT}
-    
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-        response.raise_for_status()
+        html, final_url = cached_get(url, _page_ttl((date,)), _SESSION, allow_redirects=True)
     except requests.RequestException as e:
         logger.error(f"Failed to fetch papers for {date}: {e}")
         return [], date
     
     # Check if we were redirected (date has no papers)
-    final_url = response.url
     actual_date = date
     
     # Extract date from response URL, format: /papers/date/YYYY-MM-DD
-    date_match = re.search(r"/papers/date/(\d{4}-\d{2}-\d{2})", final_url)
-    if date_match:
-        actual_date = date_match.group(1)
+    idx = final_url.rfind(_DATE_URL_MARKER)
+    if idx != -1:
+        start = idx + len(_DATE_URL_MARKER)
+        candidate = final_url[start:start + 10]
+        if len(candidate) == 10 and candidate[4] == "-" and candidate[7] == "-":
+            actual_date = candidate
     
     if actual_date != date:
         # Redirect occurred - this means the requested date has no papers
@@ -259,48 +293,98 @@ def fetch_papers_for_date_page(date: str, max_papers: Optional[int] = None) -> t
             f"HuggingFace redirected to {actual_date}."
         )
     
-    soup = BeautifulSoup(response.text, "lxml")
-    papers = []
-    
-    # Find paper links - they're in article elements or links matching the pattern
-    paper_pattern = re.compile(r"^/papers/(\d{4}\.\d{4,5})$")
+    papers = _parse_paper_links(html, max_papers)
     
-    for link in soup.find_all("a", href=paper_pattern):
-        href = link.get("href", "")
-        match = paper_pattern.match(href)
-        if not match:
-            continue
-            
-        paper_id = match.group(1)
-        
-        # Avoid duplicates
-        if any(p["paper_id"] == paper_id for p in papers):
+    logger.info(f"Found {len(papers)} papers for date {actual_date}")
+    return papers, actual_date
+
+
+def _store_papers(papers: list[dict], period_id: str) -> None:
+    """
+    Store fetched papers under period_id with two DB round-trips.
+
+    Existing papers only get their week_id moved to period_id; new papers
+    are quality-scored and inserted with their scores. One lookup query
+    finds which is which and one transaction writes all rows.
+
+    Args:
+        papers: Unique paper dicts from the listing pages
+        period_id: Week or date identifier to store them under
+    """
+    if not papers:
+        return
+
+    existing = get_papers_bulk([p["paper_id"] for p in papers])
+    quality_filter = None
+    rows = []
+
+    for paper in papers:
+        paper_id = paper["paper_id"]
+
+        if paper_id in existing:
+            # Paper exists - check if it's for a different date/week
+            stored_week_id = existing[paper_id]
+            if stored_week_id != period_id:
+                logger.info(f"Paper {paper_id} exists with week_id {stored_week_id}, updating to {period_id}")
+                # Update the week_id so download can find it
+                rows.append({"paper_id": paper_id, "week_id": period_id})
+            else:
+                logger.debug(f"Paper {paper_id} already in database for {period_id}")
             continue
-        
-        # Try to get the title from the link text or parent
-        title = link.get_text(strip=True)
-        if not title or len(title) < 5:
-            parent = link.find_parent(["article", "div"])
-            if parent:
-                h3 = parent.find(["h3", "h2", "h1"])
-                if h3:
-                    title = h3.get_text(strip=True)
-        
-        hf_url = f"{HF_PAPERS_URL}/{paper_id}"
-        pdf_url = ARXIV_PDF_URL.format(paper_id=paper_id)
-        
-        papers.append({
+
+        if quality_filter is None:
+            quality_filter = QualityFilter()
+
+        # 评估质量
+        score = quality_filter.evaluate_paper(
+            title=paper.get("title", ""),
+            pdf_url=paper.get("pdf_url"),
+            hf_url=paper.get("hf_url")
+        )
+
+        # Insert new paper with quality scores
+        rows.append({
             "paper_id": paper_id,
-            "title": title or f"Paper {paper_id}",
-            "hf_url": hf_url,
-            "pdf_url": pdf_url,
+            "week_id": period_id,
+            "title": paper["title"],
+            "hf_url": paper["hf_url"],
+            "pdf_url": paper["pdf_url"],
+            # 质量评分字段
+            "quality_score": score.total_score,
+            "citation_score": score.citation_score,
+            "venue_score": score.venue_score,
+            "recency_score": score.recency_score,
+            "quality_reasons": json.dumps(score.reasons, ensure_ascii=False),
+            "filtered_out": 0 if score.passed else 1,
+            "filter_reason": None if score.passed else "质量评分低于阈值",
+            "evaluated_at": now_iso(),
         })
-        
-        if max_papers and len(papers) >= max_papers:
+        logger.info(f"Added paper: {paper_id} - {paper['title'][:50]}...")
+
+    upsert_papers_bulk(rows)
+
+
+def _unique_papers(
+    papers: list[dict],
+    seen_ids: set[str],
+    limit: Optional[int] = None
+) -> list[dict]:
+    """Return papers whose ids are not in seen_ids (updated in place), up to limit."""
+    unique = []
+    if limit is not None and limit <= 0:
+        return unique
+    cap = sys.maxsize if limit is None else limit
+    n = 0
+    for paper in papers:
+        paper_id = paper["paper_id"]
+        if paper_id in seen_ids:
+            continue
+        seen_ids.add(paper_id)
+        unique.append(paper)
+        n += 1
+        if n >= cap:
             break
-    
-    logger.info(f"Found {len(papers)} papers for date {actual_date}")
-    return papers, actual_date
+    return unique
 
 
 def fetch_daily_papers(
@@ -324,71 +408,11 @@ def fetch_daily_papers(
     """
     logger.info(f"Fetching papers for date {date_id}")
 
-    # 导入质量过滤器
-    from .quality_filter import QualityFilter
-    from .utils import now_iso
-    import json
-
-    quality_filter = QualityFilter()
-
     # Fetch papers from date page (this will raise ValueError if redirected)
     papers_from_date, actual_date = fetch_papers_for_date_page(date_id, max_papers=max_papers)
 
-    all_papers = []
-    seen_ids = set()
-
-    for paper in papers_from_date:
-        paper_id = paper["paper_id"]
-
-        if paper_id in seen_ids:
-            continue
-        seen_ids.add(paper_id)
-
-        # Check if paper already exists in DB
-        existing = get_paper(paper_id)
-        if existing:
-            # Paper exists - check if it's for a different date/week
-            if existing.week_id != date_id:
-                logger.info(f"Paper {paper_id} exists with week_id {existing.week_id}, updating to {date_id}")
-                # Update the week_id to match current date so download can find it
-                upsert_paper(
-                    paper_id=paper_id,
-                    week_id=date_id,
-                )
-            else:
-                logger.debug(f"Paper {paper_id} already in database for this date")
-            all_papers.append(paper)
-            continue
-
-        # 评估质量
-        score = quality_filter.evaluate_paper(
-            title=paper.get("title", ""),
-            pdf_url=paper.get("pdf_url"),
-            hf_url=paper.get("hf_url")
-        )
-
-        # Insert new paper with date_id as the week_id
-        upsert_paper(
-            paper_id=paper_id,
-            week_id=date_id,  # Using date_id in the week_id field
-            title=paper["title"],
-            hf_url=paper["hf_url"],
-            pdf_url=paper["pdf_url"],
-            # 质量评分字段
-            quality_score=score.total_score,
-            citation_score=score.citation_score,
-            venue_score=score.venue_score,
-            recency_score=score.recency_score,
-            quality_reasons=json.dumps(score.reasons, ensure_ascii=False),
-            filtered_out=0 if score.passed else 1,
-            filter_reason=None if score.passed else "质量评分低于阈值",
-            evaluated_at=now_iso()
-        )
-        logger.info(f"Added paper: {paper_id} - {paper['title'][:50]}...")
-        all_papers.append(paper)
-        
-        if max_papers and len(all_papers) >= max_papers:
-            break
+    all_papers = _unique_papers(papers_from_date, set(), max_papers or None)
+    _store_papers(all_papers, date_id)
     
     logger.info(f"Total papers fetched for date {date_id}: {len(all_papers)}")
     return all_papers
@@ -413,13 +437,6 @@ def fetch_weekly_papers(
     """
     logger.info(f"Fetching papers for week {week_id}")
 
-    # 导入质量过滤器
-    from .quality_filter import QualityFilter
-    from .utils import now_iso
-    import json
-
-    quality_filter = QualityFilter()
-
     all_papers = []
     seen_ids = set()
 
@@ -427,125 +444,30 @@ def fetch_weekly_papers(
     papers_from_week = fetch_papers_for_week_url(week_id, max_papers=max_papers)
     
     if papers_from_week:
-        # Process papers from week URL
-        for paper in papers_from_week:
-            paper_id = paper["paper_id"]
-            
-            if paper_id in seen_ids:
-                continue
-            seen_ids.add(paper_id)
-            
-            # Check if paper already exists in DB
-            existing = get_paper(paper_id)
-            if existing:
-                # Paper exists - check if it's for a different week
-                if existing.week_id != week_id:
-                    logger.info(f"Paper {paper_id} exists with week_id {existing.week_id}, updating to {week_id}")
-                    upsert_paper(
-                        paper_id=paper_id,
-                        week_id=week_id,
-                    )
-                else:
-                    logger.debug(f"Paper {paper_id} already in database for this week")
-                all_papers.append(paper)
-                continue
-
-            # 评估质量
-            score = quality_filter.evaluate_paper(
-                title=paper.get("title", ""),
-                pdf_url=paper.get("pdf_url"),
-                hf_url=paper.get("hf_url")
-            )
-
-            # Insert new paper with quality scores
-            upsert_paper(
-                paper_id=paper_id,
-                week_id=week_id,
-                title=paper["title"],
-                hf_url=paper["hf_url"],
-                pdf_url=paper["pdf_url"],
-                # 质量评分字段
-                quality_score=score.total_score,
-                citation_score=score.citation_score,
-                venue_score=score.venue_score,
-                recency_score=score.recency_score,
-                quality_reasons=json.dumps(score.reasons, ensure_ascii=False),
-                filtered_out=0 if score.passed else 1,
-                filter_reason=None if score.passed else "质量评分低于阈值",
-                evaluated_at=now_iso()
-            )
-            logger.info(f"Added paper: {paper_id} - {paper['title'][:50]}...")
-            all_papers.append(paper)
-            
-            if max_papers and len(all_papers) >= max_papers:
-                break
+        all_papers = _unique_papers(papers_from_week, seen_ids, max_papers or None)
     else:
         # Fallback: fetch by date if week URL returned no results
         logger.info("Week URL returned no results, falling back to date-by-date fetching")
         dates = get_dates_for_week(week_id)
-        
-        for date in dates:
+
+        # 7 个日期页面互不依赖，并发请求；结果按日期顺序合并
+        with ThreadPoolExecutor(max_workers=len(dates)) as executor:
+            results = list(executor.map(
+                lambda date: fetch_papers_for_date(date, max_papers=max_papers),
+                dates,
+            ))
+
+        for papers in results:
             # Check if we've hit the limit
             remaining = None
             if max_papers:
                 remaining = max_papers - len(all_papers)
                 if remaining <= 0:
                     break
-            
-            papers = fetch_papers_for_date(date, max_papers=remaining)
-            
-            for paper in papers:
-                paper_id = paper["paper_id"]
-                
-                # Skip if we've already seen this paper
-                if paper_id in seen_ids:
-                    continue
-                seen_ids.add(paper_id)
-                
-                # Check if paper already exists in DB
-                existing = get_paper(paper_id)
-                if existing:
-                    # Paper exists - check if it's for a different week
-                    if existing.week_id != week_id:
-                        logger.info(f"Paper {paper_id} exists with week_id {existing.week_id}, updating to {week_id}")
-                        upsert_paper(
-                            paper_id=paper_id,
-                            week_id=week_id,
-                        )
-                    else:
-                        logger.debug(f"Paper {paper_id} already in database for this week")
-                    all_papers.append(paper)
-                    continue
-
-                # 评估质量
-                score = quality_filter.evaluate_paper(
-                    title=paper.get("title", ""),
-                    pdf_url=paper.get("pdf_url"),
-                    hf_url=paper.get("hf_url")
-                )
-
-                # Insert new paper with quality scores
-                upsert_paper(
-                    paper_id=paper_id,
-                    week_id=week_id,
-                    title=paper["title"],
-                    hf_url=paper["hf_url"],
-                    pdf_url=paper["pdf_url"],
-                    # 质量评分字段
-                    quality_score=score.total_score,
-                    citation_score=score.citation_score,
-                    venue_score=score.venue_score,
-                    recency_score=score.recency_score,
-                    quality_reasons=json.dumps(score.reasons, ensure_ascii=False),
-                    filtered_out=0 if score.passed else 1,
-                    filter_reason=None if score.passed else "质量评分低于阈值",
-                    evaluated_at=now_iso()
-                )
-                logger.info(f"Added paper: {paper_id} - {paper['title'][:50]}...")
-                all_papers.append(paper)
-                
-                if max_papers and len(all_papers) >= max_papers:
-                    break
+
+            all_papers.extend(_unique_papers(papers, seen_ids, remaining))
+
+    _store_papers(all_papers, week_id)
     
     logger.info(f"Total papers fetched for week {week_id}: {len(all_papers)}")
     return all_papers
@@ -562,16 +484,14 @@ def get_paper_details(paper_id: str) -> Optional[dict]:
         Paper details dict or None if not found
     """
     url = f"{HF_PAPERS_URL}/{paper_id}"
-    headers = {"User-Agent": USER_AGENT}
     
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
+        html, _ = cached_get(url, PAGE_TTL_PAST_SECONDS, _SESSION)
     except requests.RequestException as e:
         logger.error(f"Failed to fetch paper details for {paper_id}: {e}")
         return None
     
-    soup = BeautifulSoup(response.text, "lxml")
+    soup = BeautifulSoup(html, "lxml")
     
     # Extract title from h1
     title_elem = soup.find("h1")
@@ -579,7 +499,7 @@ def get_paper_details(paper_id: str) -> Optional[dict]:
     
     # Extract abstract
     abstract = ""
-    abstract_section = soup.find("h2", string=re.compile(r"Abstract", re.I))
+    abstract_section = soup.find("h2", string=_ABSTRACT_RE)
     if abstract_section:
         next_elem = abstract_section.find_next_sibling()
         if next_elem:
@@ -590,5 +510,26 @@ def get_paper_details(paper_id: str) -> Optional[dict]:
         "title": title,
         "abstract": abstract,
         "hf_url": url,
-        "pdf_url": ARXIV_PDF_URL.format(paper_id=paper_id),
+        "pdf_url": f"{_PDF_URL_HEAD}{paper_id}{_PDF_URL_TAIL}",
     }
+
+
+def get_paper_details_bulk(paper_ids: list[str], max_workers: int = 16) -> list[Optional[dict]]:
+    """
+    Fetch details for many papers concurrently.
+    
+    Requests fan out over a thread pool sharing the module Session's
+    connection pool (16 connections, hence the default worker count).
+    
+    Args:
+        paper_ids: arXiv paper IDs
+        max_workers: Maximum concurrent requests
+        
+    Returns:
+        Details dicts (or None if not found) in the same order as paper_ids
+    """
+    if not paper_ids:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paper_ids))) as executor:
+        return list(executor.map(get_paper_details, paper_ids))
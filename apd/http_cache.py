@@ -0,0 +1,195 @@
+"""
+On-disk HTTP page cache for Auto Paper Digest.
+
+Keeps gzipped response bodies under data/page_cache with an mtime-based
+TTL, so reruns and retries within a short window skip the network. Stale
+entries are revalidated with their ETag / Last-Modified validators, and
+entries left untouched for PAGE_CACHE_MAX_AGE_SECONDS are pruned.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import requests
+
+from .config import PAGE_CACHE_DIR, REQUEST_TIMEOUT
+from .utils import get_logger
+
+logger = get_logger()
+
+# 超过这个时间没有命中或重新验证的条目会被删除
+PAGE_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+_prune_lock = threading.Lock()
+_pruned = False
+
+
+def _cache_path(url: str) -> Path:
+    """Cache file for a URL (blake2b-128 of the URL)."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return PAGE_CACHE_DIR / f"{digest}.gz"
+
+
+def _read(path: Path) -> Optional[tuple[dict, bytes]]:
+    """Read a cache entry as (metadata, body), or None if missing/corrupt."""
+    try:
+        data = gzip.decompress(path.read_bytes())
+        # 文件格式：一行 JSON 元数据（最终 URL、ETag、Last-Modified）+ "\n" + 正文
+        header, _, body = data.partition(b"\n")
+        meta = json.loads(header)
+    except (OSError, EOFError, gzip.BadGzipFile, ValueError):
+        return None
+    if not isinstance(meta, dict) or "url" not in meta:
+        return None
+    return meta, body
+
+
+def _age(path: Path) -> float:
+    """Seconds since the entry was written or last revalidated."""
+    try:
+        return time.time() - path.stat().st_mtime
+    except OSError:
+        return float("inf")
+
+
+def store(
+    url: str,
+    body: bytes,
+    final_url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None
+) -> None:
+    """
+    Save a page body, its final URL and validators for url.
+
+    Written to a temp file and renamed, so concurrent readers never see a
+    partial entry. The first store of a process also prunes old entries.
+    Failures are logged and ignored.
+
+    Args:
+        url: Requested URL
+        body: Raw response body
+        final_url: URL after redirects
+        etag: ETag response header
+        last_modified: Last-Modified response header
+    """
+    path = _cache_path(url)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    header = json.dumps({"url": final_url, "etag": etag, "last_modified": last_modified})
+    try:
+        PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(gzip.compress(header.encode("utf-8") + b"\n" + body, compresslevel=6))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Failed to cache {url}: {e}")
+        tmp.unlink(missing_ok=True)
+
+    _prune_once()
+
+
+def prune(max_age_seconds: float = PAGE_CACHE_MAX_AGE_SECONDS) -> int:
+    """
+    Delete cache entries (and stray temp files) older than max_age_seconds.
+
+    Args:
+        max_age_seconds: Age after which an entry is removed
+
+    Returns:
+        Number of files deleted
+    """
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    try:
+        entries = list(os.scandir(PAGE_CACHE_DIR))
+    except OSError:
+        return 0
+
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+                removed += 1
+        except OSError:
+            continue
+
+    if removed:
+        logger.debug(f"Pruned {removed} old page cache entries")
+    return removed
+
+
+def _prune_once() -> None:
+    """Run prune() at most once per process."""
+    global _pruned
+    with _prune_lock:
+        if _pruned:
+            return
+        _pruned = True
+    prune()
+
+
+def cached_get(
+    url: str,
+    ttl_seconds: float,
+    session: requests.Session,
+    **kwargs
+) -> tuple[bytes, str]:
+    """
+    GET a URL, serving it from the disk cache while the entry is fresh.
+
+    A stale entry is revalidated with If-None-Match / If-Modified-Since:
+    on 304 Not Modified the stored body is reused and its TTL restarts,
+    on 200 the entry is replaced.
+
+    Args:
+        url: Page URL
+        ttl_seconds: How long a cached body is served without revalidation
+        session: Session used for the request
+        **kwargs: Extra arguments for session.get
+
+    Returns:
+        Tuple of (body bytes, final URL after redirects)
+
+    Raises:
+        requests.RequestException: On network or HTTP errors
+    """
+    path = _cache_path(url)
+    fresh = _age(path) <= ttl_seconds
+    entry = _read(path)
+    if entry is not None and fresh:
+        logger.debug(f"Page cache hit: {url}")
+        return entry[1], entry[0]["url"]
+
+    headers = {}
+    if entry is not None:
+        meta = entry[0]
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    response = session.get(url, headers=headers, **kwargs)
+
+    if response.status_code == 304 and entry is not None:
+        logger.debug(f"Not modified, using cached body: {url}")
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry[1], entry[0]["url"]
+
+    response.raise_for_status()
+    store(
+        url,
+        response.content,
+        response.url,
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+    )
+    return response.content, response.url
@@ -9,21 +9,43 @@ Uses Playwright with persistent context to automate:
 - Video download
 """
 
+import gzip
+import hashlib
+import itertools
+import json
+import os
+import re
+import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional, Sequence, TypeVar
 
+import requests
 from playwright.sync_api import (
     Browser,
     BrowserContext,
+    Locator,
     Page,
     Playwright,
+    Route,
+    Error as PlaywrightError,
     TimeoutError as PlaywrightTimeout,
     sync_playwright,
 )
 
 from .config import (
+    ASSET_CACHE_DIR,
     DEFAULT_PROFILE,
+    NOTEBOOKLM_ASSET_CACHE,
+    NOTEBOOKLM_BLOCK_RESOURCES,
+    NOTEBOOKLM_CDP_ENDPOINT,
+    NOTEBOOKLM_CONCURRENCY,
+    NOTEBOOKLM_DEBUG,
     NOTEBOOKLM_URL,
     PLAYWRIGHT_NAVIGATION_TIMEOUT,
     PLAYWRIGHT_TIMEOUT,
@@ -33,11 +55,356 @@ from .config import (
     Status,
     VIDEO_DIR,
 )
-from .db import get_paper, update_status, upsert_paper
+from .db import Paper, get_paper, update_status, upsert_paper
 from .utils import ensure_dir, get_logger, get_period_subdir, sanitize_filename
 
 logger = get_logger()
 
+BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    # The week loops keep several papers open in background tabs; without
+    # these Chromium throttles their timers and in-page polling
+    "--disable-renderer-backgrounding",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+]
+VIEWPORT = {"width": 1280, "height": 900}
+# Nobody watches headless runs: a smaller viewport and no GPU compositing
+# cut the cost of every layout/paint.
+# Width stays at 1280: narrower, NotebookLM folds the sources/chat/Studio
+# columns into tabs
+HEADLESS_VIEWPORT = {"width": 1280, "height": 720}
+HEADLESS_BROWSER_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-features=TranslateUI,BackForwardCache",
+]
+# Complements the route filter: the renderer does not decode images at all
+NO_IMAGES_ARG = "--blink-settings=imagesEnabled=false"
+IGNORED_DEFAULT_ARGS = ["--enable-automation"]
+
+# Resource types the automation never needs (avatars, web fonts, icon fonts, media)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+# Login pages (including captcha images) always load in full
+UNBLOCKED_URL_MARKERS = ("accounts.google.com", "/recaptcha/")
+
+# Static asset cache: only GETs to these hosts (versioned URLs, immutable content)
+# Only gstatic build outputs with a content hash (rs=) are cached; the
+# fonts.googleapis.com CSS is unversioned and varies by user agent
+ASSET_CACHE_URL_RE = re.compile(r"^https://www\.gstatic\.com/(?:.*/)?_/.*/rs=")
+ASSET_CACHE_TTL_SECONDS = 7 * 86400
+# Headers dropped on replay: the body is stored decompressed and Playwright
+# recomputes the length
+ASSET_SKIPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# Accessible name of the home page "new notebook" button (Chinese or English UI),
+# looked up by role instead of scanning all text
+NEW_NOTEBOOK_NAME_RE = re.compile(r"新建|New notebook|Create", re.IGNORECASE)
+# Other signs of the logged-in home page: headings and notebook cards
+HOME_MARKER_SELECTOR = ", ".join([
+    ':text-is("我的笔记本")',
+    ':text-is("My notebooks")',
+    ':text-is("精选笔记本")',
+    "mat-card",
+])
+
+# upload_pdf: links/buttons/drop zones that open a file chooser (a hidden
+# input[type=file] is tried first, separately)
+FILE_INPUT_SELECTOR = 'input[type="file"]'
+UPLOAD_TRIGGER_SELECTOR = ", ".join([
+    ':text("选择文件")',
+    ':text("Select file")',
+    ':text("Choose file")',
+    'a:has-text("选择")',
+    'button:has-text("选择")',
+    '[class*="upload"] a',
+    '[class*="upload"] button',
+    ':text("Upload")',
+    ':text("上传")',
+    '[class*="dropzone"] a',
+    # The drop zone itself
+    '[class*="dropzone"]',
+    '[class*="drop-zone"]',
+    '[class*="upload-area"]',
+    ':text("拖放或")',
+    ':text("Drag")',
+    '[role="dialog"] [class*="upload"]',
+    '[class*="source"] [class*="upload"]',
+])
+
+# _wait_for_ingestion step 1: the uploaded source is registered, shown by the
+# source counter in either UI language ("1 个来源" / "1 source", "2 sources")
+SOURCE_COUNT_JS_RE = r"/[1-9]\d* 个来源|\b[1-9]\d* sources?\b/i"
+SOURCE_ADDED_JS = """() => {
+    const text = document.body ? document.body.innerText : "";
+    return %s.test(text);
+}""" % SOURCE_COUNT_JS_RE
+# Step 2: any sign the PDF has been processed, returning the reason (polled in
+# the page). Only the chat area counts (the chat element with the most text);
+# text in the source list and the Studio panel is ignored
+INGESTION_READY_JS = """() => {
+    let text = "";
+    for (const el of document.querySelectorAll('[class*="chat"]')) {
+        const t = el.innerText || "";
+        if (t.length > text.length) text = t;
+    }
+    // Sample questions appear once processing is done
+    const questions = text.match(/如何|什么|为什么|哪些/g);
+    if (questions && questions.length >= 2) return "questions visible";
+    // The chat area shows a long text (the paper summary)
+    if (text.length > 200) return "content loaded";
+    // The input box at the bottom is ready and the source count is shown
+    if ((text.includes("开始输入") || text.includes("Start typing"))
+        && %s.test(text)) return "ready for input";
+    return false;
+}""" % SOURCE_COUNT_JS_RE
+
+# generate_video_overview: the Video Overview card in the Studio panel
+VIDEO_CARD_SELECTOR = ", ".join([
+    ':text-is("视频概览")',
+    ':text-is("Video Overview")',
+    '[aria-label*="视频概览"]',
+    '[aria-label*="Video Overview"]',
+])
+
+# wait_for_video_ready: generating -> not ready; an item with a timestamp -> done;
+# "失败" (failed) -> raise
+GENERATING_TEXT = "正在生成"
+# Signs the Studio panel has loaded: generated items, timestamps, a play button
+# or "正在生成" (generating)
+STUDIO_SETTLED_SELECTOR = ", ".join([
+    '.artifact-button-content',
+    'button[class*="artifact"]',
+    '[aria-label="播放"]',
+    ':text-matches("\\d+ 分钟|\\d+ 小时|刚刚")',
+    f':text("{GENERATING_TEXT}")',
+])
+VIDEO_READY_JS = """() => {
+    const text = document.body ? document.body.innerText : "";
+    if (text.includes("正在生成")) return false;
+    if (/\\d+ 分钟|刚刚/.test(text)) return true;
+    if (text.includes("失败")) throw new Error("video generation failed");
+    return false;
+}"""
+
+
+# extract_summary: reply blocks in the chat area
+SUMMARY_BLOCK_SELECTOR = '[class*="response"], [class*="message"], [class*="chat"] p'
+
+# The generated item's "更多" (More) menu
+MENU_SELECTOR = '[role="menu"]'
+ARTIFACT_MORE_SELECTOR = ", ".join([
+    'button.artifact-more-button[aria-label="更多"]',
+    '[class*="artifact"] [aria-label="更多"]',
+    '[class*="artifact"] [aria-label="More options"]',
+    '[class*="artifact"] button:has(mat-icon:text("more_vert"))',
+])
+# Fallback: not scoped to the item, take the last match (the Studio panel comes
+# after the source list)
+MORE_BUTTON_FALLBACK_SELECTOR = ", ".join([
+    'button:has(mat-icon:text("more_vert"))',
+    '[aria-label="更多"]',
+    '[aria-label="More options"]',
+])
+DOWNLOAD_MENU_ITEM_SELECTOR = ", ".join([
+    '[role="menuitem"]:has-text("下载")',
+    '[role="menuitem"]:has-text("Download")',
+    '.mat-mdc-menu-item:has-text("下载")',
+    '[role="menu"] button:has-text("下载")',
+])
+
+def _is_notebooklm_url(url: str) -> bool:
+    """True once the page is on NotebookLM itself (the login page's continue= param also names it)."""
+    return "notebooklm.google" in url and "accounts.google" not in url
+
+
+@dataclass(slots=True)
+class _SharedContext:
+    """A browser context shared by all bots on one profile."""
+    playwright: Playwright
+    context: BrowserContext
+    refs: int = 0
+    # storage_state mode only: the separately launched browser, and the file the
+    # login state is written back to on close
+    browser: Optional[Browser] = None
+    state_path: Optional[Path] = None
+
+
+# A profile directory can only be opened by one Chromium: bots in this process
+# share one persistent context per profile, and the browser closes when the
+# reference count drops to zero. Sync Playwright objects are bound to the
+# thread that created them, so sharing only works within one thread.
+_shared_contexts: dict[str, _SharedContext] = {}
+_shared_lock = threading.Lock()
+
+# Debug screenshots are written to disk on a background thread so they do not
+# block the browser
+_screenshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nblm-screenshot")
+# Screenshots/traces taken within the same second are told apart by a sequence
+# number instead of overwriting each other
+_debug_file_seq = itertools.count()
+
+
+@lru_cache(maxsize=None)
+def _debug_dir(name: str) -> Path:
+    """Screenshot/trace directory under PROFILE_DIR, created once per process."""
+    return ensure_dir(PROFILE_DIR / name)
+
+
+def _debug_path(kind: str, name: str, suffix: str) -> Path:
+    """Unique debug artifact path, e.g. screenshots/upload_failed_1767225600_3.jpg."""
+    return _debug_dir(kind) / f"{name}_{int(time.time())}_{next(_debug_file_seq)}{suffix}"
+
+
+def _block_heavy_resources(route: Route) -> None:
+    """Abort image/font/media requests; let everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES and not any(
+        marker in request.url for marker in UNBLOCKED_URL_MARKERS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _asset_cache_path(url: str) -> Path:
+    """Cache file for a static asset URL (blake2b-128 of the URL)."""
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return ASSET_CACHE_DIR / f"{digest}.gz"
+
+
+def _prune_asset_cache() -> None:
+    """Delete cached assets (and stray temp files) older than ASSET_CACHE_TTL_SECONDS."""
+    cutoff = time.time() - ASSET_CACHE_TTL_SECONDS
+    try:
+        entries = list(os.scandir(ASSET_CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            continue
+
+
+def _cache_static_asset(route: Route) -> None:
+    """
+    Serve versioned static assets from disk, fetching and storing them on a miss.
+    
+    Entries are gzip(JSON headers + "\n" + body) so content-type/CORS headers
+    are replayed with the body. Requests the resource filter would drop
+    (images, fonts...) fall back to the other route handlers.
+    """
+    request = route.request
+    if request.method != "GET" or request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.fallback()
+        return
+    
+    path = _asset_cache_path(request.url)
+    try:
+        if time.time() - path.stat().st_mtime <= ASSET_CACHE_TTL_SECONDS:
+            raw_headers, _, body = gzip.decompress(path.read_bytes()).partition(b"\n")
+            route.fulfill(status=200, headers=json.loads(raw_headers), body=body)
+            return
+    except (OSError, EOFError, ValueError):
+        pass
+    
+    try:
+        response = route.fetch()
+        body = response.body()
+    except PlaywrightError as e:
+        # Network failure or the tab closed mid-request: let the next handler
+        # resolve the route, and cache nothing
+        logger.debug(f"Failed to fetch asset {request.url}: {e}")
+        try:
+            route.fallback()
+        except PlaywrightError:
+            pass
+        return
+    
+    if response.status == 200:
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name not in ASSET_SKIPPED_HEADERS
+        }
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            ASSET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(gzip.compress(json.dumps(headers).encode("utf-8") + b"\n" + body))
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Failed to cache asset {request.url}: {e}")
+            tmp.unlink(missing_ok=True)
+    try:
+        route.fulfill(response=response, body=body)
+    except PlaywrightError:
+        pass  # Tab closed while the asset was being fetched
+
+
+def launch_cdp_server(
+    profile_name: str = DEFAULT_PROFILE,
+    port: int = 9222,
+    headless: bool = False,
+    startup_timeout: float = 15.0
+) -> str:
+    """
+    Start a long-lived Chromium with remote debugging on the given profile.
+    
+    Bots created with cdp_endpoint attach to it instead of launching their
+    own browser. Returns immediately if something already listens on the port.
+    
+    Args:
+        profile_name: Browser profile directory (holds the Google login)
+        port: Remote debugging port
+        headless: Start Chromium headless
+        startup_timeout: Seconds to wait for the endpoint to come up
+        
+    Returns:
+        CDP endpoint URL (e.g., "http://127.0.0.1:9222")
+        
+    Raises:
+        RuntimeError: If the endpoint does not come up in time
+    """
+    endpoint = f"http://127.0.0.1:{port}"
+    
+    def is_up() -> bool:
+        try:
+            return requests.get(f"{endpoint}/json/version", timeout=1).ok
+        except requests.RequestException:
+            return False
+    
+    if is_up():
+        logger.info(f"Reusing running browser at {endpoint}")
+        return endpoint
+    
+    with sync_playwright() as p:
+        executable = p.chromium.executable_path
+    
+    args = [
+        executable,
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={ensure_dir(PROFILE_DIR / profile_name)}",
+        "--no-first-run",
+        "--no-default-browser-check",
+        *BROWSER_ARGS,
+    ]
+    if headless:
+        args.extend(HEADLESS_BROWSER_ARGS)
+        args.append("--headless=new")
+    
+    logger.info(f"Launching browser with remote debugging on port {port}")
+    subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if is_up():
+            return endpoint
+        time.sleep(0.25)
+    
+    raise RuntimeError(f"Browser did not expose {endpoint} within {startup_timeout:.0f}s")
+
 
 class NotebookLMBot:
     """
@@ -45,13 +412,21 @@ class NotebookLMBot:
     
     Uses Playwright persistent context to maintain Google login session
     across runs. First run must be headful for manual login/2FA.
+    
+    With a CDP endpoint the bot attaches to an already running browser
+    (see launch_cdp_server) and only opens a tab, so batches skip the
+    browser launch entirely.
     """
     
     def __init__(
         self,
         headless: bool = True,
         profile_name: str = DEFAULT_PROFILE,
-        slow_mo: int = 0
+        slow_mo: int = 0,
+        cdp_endpoint: Optional[str] = NOTEBOOKLM_CDP_ENDPOINT,
+        debug: bool = NOTEBOOKLM_DEBUG,
+        block_resources: bool = NOTEBOOKLM_BLOCK_RESOURCES,
+        asset_cache: bool = NOTEBOOKLM_ASSET_CACHE
     ):
         """
         Initialize the NotebookLM bot.
@@ -60,14 +435,30 @@ class NotebookLMBot:
             headless: Run browser in headless mode (False for first-time login)
             profile_name: Name of the browser profile directory
             slow_mo: Slow down operations by this many ms (for debugging)
+            cdp_endpoint: Attach to a running browser at this CDP URL instead
+                of launching one (defaults to NOTEBOOKLM_CDP_ENDPOINT)
+            debug: Save screenshots/traces on failures (defaults to NOTEBOOKLM_DEBUG)
+            block_resources: Skip loading images, fonts and media
+                (defaults to NOTEBOOKLM_BLOCK_RESOURCES)
+            asset_cache: Serve static JS/CSS from a disk cache across runs
+                (defaults to NOTEBOOKLM_ASSET_CACHE)
         """
         self.headless = headless
         self.profile_path = ensure_dir(PROFILE_DIR / profile_name)
+        # Login state snapshot (cookies + localStorage); when present, the persistent
+        # profile directory is skipped
+        self.storage_state_path = self.profile_path / "state.json"
         self.slow_mo = slow_mo
+        self.cdp_endpoint = cdp_endpoint
+        self.debug = debug
+        self.block_resources = block_resources
+        self.asset_cache = asset_cache
         
         self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        self._shared_key: Optional[str] = None
     
     def __enter__(self) -> "NotebookLMBot":
         """Start the browser context."""
@@ -79,47 +470,214 @@ class NotebookLMBot:
         self.stop()
     
     def start(self) -> None:
-        """Start the Playwright browser with persistent context."""
-        logger.info(f"Starting browser (headless={self.headless})")
-        
-        self._playwright = sync_playwright().start()
-        
-        # Use persistent context for login persistence
-        self._context = self._playwright.chromium.launch_persistent_context(
-            user_data_dir=str(self.profile_path),
-            headless=self.headless,
-            slow_mo=self.slow_mo,
-            viewport={"width": 1280, "height": 900},
-            accept_downloads=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-            ],
-        )
+        """Start the browser (or attach to a running one) and open a page."""
+        if self.cdp_endpoint:
+            logger.info(f"Connecting to browser at {self.cdp_endpoint}")
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+            # The default context carries the server profile's login; each bot only opens
+            # a new tab
+            if self._browser.contexts:
+                self._context = self._browser.contexts[0]
+            else:
+                self._context = self._browser.new_context(accept_downloads=True, viewport=self.viewport)
+            self._install_routes(self._context)
+            self._start_tracing(self._context)
+            self._page = self._context.new_page()
+        else:
+            self._context = self._acquire_shared_context()
+            # The first user takes the page the browser started with; later bots each
+            # open a new tab
+            if len(self._context.pages) == 1 and _shared_contexts[self._shared_key].refs == 1:
+                self._page = self._context.pages[0]
+            else:
+                self._page = self._context.new_page()
         
         # Set default timeouts
         self._context.set_default_timeout(PLAYWRIGHT_TIMEOUT)
         self._context.set_default_navigation_timeout(PLAYWRIGHT_NAVIGATION_TIMEOUT)
         
-        # Get or create main page
-        if self._context.pages:
-            self._page = self._context.pages[0]
-        else:
-            self._page = self._context.new_page()
-        
         logger.debug("Browser started successfully")
     
+    @property
+    def viewport(self) -> dict:
+        """Page viewport: smaller when nobody watches the window."""
+        return HEADLESS_VIEWPORT if self.headless else VIEWPORT
+    
+    def _launch_options(self) -> dict:
+        """Chromium launch options shared by launch() and launch_persistent_context()."""
+        args = list(BROWSER_ARGS)
+        if self.headless:
+            args.extend(HEADLESS_BROWSER_ARGS)
+            if self.block_resources:
+                args.append(NO_IMAGES_ARG)
+        return {
+            "headless": self.headless,
+            "slow_mo": self.slow_mo,
+            "args": args,
+            "ignore_default_args": IGNORED_DEFAULT_ARGS,
+        }
+    
+    def _install_routes(self, context: BrowserContext) -> None:
+        """Register the resource filter and static asset cache on a context."""
+        if self.block_resources:
+            context.route("**/*", _block_heavy_resources)
+        # Routes registered later match first: static assets hit the cache, then
+        # images/fonts go through the filter above
+        if self.asset_cache:
+            _prune_asset_cache()
+            context.route(ASSET_CACHE_URL_RE, _cache_static_asset)
+    
+    def _start_tracing(self, context: BrowserContext) -> None:
+        """
+        Start Playwright tracing, in debug mode only.
+        
+        Tracing records every action with DOM snapshots and screenshots,
+        which is real per-action overhead, so normal runs never enable it.
+        """
+        if not self.debug:
+            return
+        try:
+            context.tracing.start(screenshots=True, snapshots=True, sources=False)
+        except Exception as e:
+            logger.debug(f"Failed to start tracing: {e}")
+    
+    def _acquire_shared_context(self) -> BrowserContext:
+        """
+        Get the browser context for this profile, launching it on first use.
+        
+        With a saved storage_state (state.json) a plain browser is launched
+        and the login cookies are loaded into a fresh context, which starts
+        much faster than opening the full user-data-dir. Without one (first
+        login) the persistent profile is used.
+        """
+        key = str(self.profile_path)
+        with _shared_lock:
+            shared = _shared_contexts.get(key)
+            if shared is None:
+                logger.info(f"Starting browser (headless={self.headless})")
+                playwright = sync_playwright().start()
+                if self.storage_state_path.exists():
+                    browser = playwright.chromium.launch(**self._launch_options())
+                    context = browser.new_context(
+                        storage_state=str(self.storage_state_path),
+                        viewport=self.viewport,
+                        accept_downloads=True,
+                    )
+                    shared = _SharedContext(
+                        playwright, context,
+                        browser=browser, state_path=self.storage_state_path,
+                    )
+                else:
+                    # Use persistent context for login persistence
+                    context = playwright.chromium.launch_persistent_context(
+                        user_data_dir=key,
+                        viewport=self.viewport,
+                        accept_downloads=True,
+                        **self._launch_options(),
+                    )
+                    shared = _SharedContext(playwright, context)
+                # The routes live on the shared context and are registered only once
+                self._install_routes(context)
+                self._start_tracing(context)
+                _shared_contexts[key] = shared
+            shared.refs += 1
+            self._shared_key = key
+            return shared.context
+    
     def stop(self) -> None:
-        """Stop the browser and clean up."""
-        if self._context:
-            self._context.close()
-            self._context = None
+        """Close this bot's page and release the browser."""
+        if self._browser:
+            # Only drop the CDP connection; the browser keeps serving later jobs
+            try:
+                if self._page:
+                    self._page.close()
+            except Exception:
+                pass
+            self._browser.close()
+            self._browser = None
+        elif self._shared_key:
+            with _shared_lock:
+                shared = _shared_contexts[self._shared_key]
+                shared.refs -= 1
+                if shared.refs <= 0:
+                    del _shared_contexts[self._shared_key]
+                    if shared.state_path:
+                        # Write back the rotated cookies so the next start has the latest login
+                        try:
+                            shared.context.storage_state(path=str(shared.state_path))
+                        except Exception as e:
+                            logger.debug(f"Failed to refresh storage state: {e}")
+                    shared.context.close()
+                    if shared.browser:
+                        shared.browser.close()
+                    shared.playwright.stop()
+                elif self._page:
+                    try:
+                        self._page.close()
+                    except Exception:
+                        pass
+            self._shared_key = None
         if self._playwright:
             self._playwright.stop()
             self._playwright = None
+        self._context = None
         self._page = None
         logger.debug("Browser stopped")
     
+    @contextmanager
+    def new_paper_page(self) -> Iterator[Page]:
+        """
+        Work on one paper in a fresh tab of the already running browser.
+        
+        The tab becomes the bot's current page for the duration of the
+        block and is closed afterwards, so each paper starts from a clean
+        page without relaunching Chromium or reopening the profile.
+        
+        Yields:
+            The new page
+        """
+        page = self.open_page()
+        # One trace chunk per paper: earlier records are dropped, so save_trace on a
+        # failure only keeps this paper
+        if self.debug:
+            self._next_trace_chunk()
+        try:
+            with self.use_page(page):
+                yield page
+        finally:
+            try:
+                page.close()
+            except Exception:
+                pass
+    
+    def open_page(self) -> Page:
+        """Open a new tab in the running browser (the caller closes it)."""
+        if not self._context:
+            raise RuntimeError("Browser not started. Call start() first.")
+        return self._context.new_page()
+    
+    @contextmanager
+    def use_page(self, page: Page) -> Iterator[Page]:
+        """
+        Make page the bot's current page for the duration of the block.
+        
+        Lets one bot drive several open tabs in turn, e.g. to let NotebookLM
+        process a batch of papers while each tab is revisited later.
+        
+        Yields:
+            The page
+        """
+        previous = self._page
+        self._page = page
+        # Browsers attached over CDP keep their own flags, so also make the
+        # tab the visible one rather than relying on the launch arguments
+        page.bring_to_front()
+        try:
+            yield page
+        finally:
+            self._page = previous
+    
     @property
     def page(self) -> Page:
         """Get the current page, raising if not started."""
@@ -127,32 +685,138 @@ class NotebookLMBot:
             raise RuntimeError("Browser not started. Call start() first.")
         return self._page
     
-    def take_screenshot(self, name: str) -> Path:
+    def save_storage_state(self) -> None:
+        """Snapshot the logged-in cookies/localStorage to state.json for faster startup."""
+        try:
+            self.page.context.storage_state(path=str(self.storage_state_path))
+            logger.debug(f"Saved storage state: {self.storage_state_path}")
+        except Exception as e:
+            logger.warning(f"Failed to save storage state: {e}")
+    
+    def _home_ui(self) -> Locator:
+        """
+        First visible marker of the logged-in NotebookLM home page.
+        
+        All markers form one OR locator filtered to visible elements, so a
+        single wait_for resolves on whichever renders first; a hidden match
+        earlier in the DOM (e.g. an off-screen mat-card) cannot stall it.
         """
-        Take a screenshot for debugging.
+        return (
+            self.page.get_by_role("button", name=NEW_NOTEBOOK_NAME_RE)
+            .or_(self.page.get_by_role("tab", name="全部", exact=True))
+            .or_(self.page.locator(HOME_MARKER_SELECTOR))
+            .locator("visible=true")
+            .first
+        )
+    
+    def _opened_notebook(self, timeout_ms: int = 10000) -> bool:
+        """Wait until the page is on a notebook (/notebook/<id>), not the home list."""
+        try:
+            self.page.wait_for_url(
+                lambda url: "/notebook/" in url,
+                wait_until="domcontentloaded",
+                timeout=timeout_ms,
+            )
+            return True
+        except PlaywrightTimeout:
+            return False
+    
+    def _visible(self, selector: str, timeout_ms: int = 1500) -> Optional[Locator]:
+        """
+        Wait briefly for the first visible element matching selector.
+        
+        One wait_for instead of a count() + is_visible() pair: half the CDP
+        round-trips and no race between the two calls.
+        
+        Args:
+            selector: Playwright selector
+            timeout_ms: How long to wait
+            
+        Returns:
+            The visible locator, or None on timeout
+        """
+        # visible=true drops hidden matches first, so a hidden first match in the DOM
+        # does not stall the wait
+        locator = self.page.locator(selector).locator("visible=true").first
+        try:
+            locator.wait_for(state="visible", timeout=timeout_ms)
+        except PlaywrightTimeout:
+            return None
+        return locator
+    
+    @contextmanager
+    def _expect_generation_started(self, timeout_ms: int = 10000) -> Iterator[None]:
+        """
+        Wait for the generate clicks in the block to show up in the Studio panel.
+        
+        The request behind the click must reach NotebookLM before the tab is
+        closed. Its batchexecute RPC id is not known, and routine polling uses
+        the same endpoint, so the confirmation is a new "正在生成" item: the
+        labels already on the page (e.g. a video still generating when the
+        slides are started) are counted first and one more must appear.
+        A missing label is only logged; errors raised inside the block
+        propagate unchanged.
+        """
+        generating = self.page.locator(f':text("{GENERATING_TEXT}")')
+        before = generating.count()
+        yield
+        try:
+            generating.nth(before).wait_for(state="attached", timeout=timeout_ms)
+        except PlaywrightTimeout:
+            logger.debug("No new generating item after click")
+    
+    def take_screenshot(self, name: str) -> Optional[Path]:
+        """
+        Take a screenshot for debugging (only when debug is enabled).
+        
+        Captures a viewport JPEG, which encodes much faster than a full PNG,
+        and writes it from a background thread.
         
         Args:
             name: Screenshot filename (without extension)
             
         Returns:
-            Path to the saved screenshot
+            Path the screenshot is written to, or None when debug is off
         """
-        screenshot_dir = ensure_dir(PROFILE_DIR / "screenshots")
-        path = screenshot_dir / f"{name}_{int(time.time())}.png"
-        self.page.screenshot(path=str(path))
+        if not self.debug:
+            return None
+        
+        path = _debug_path("screenshots", name, ".jpg")
+        try:
+            data = self.page.screenshot(type="jpeg", quality=60, full_page=False)
+        except Exception as e:
+            logger.warning(f"Failed to take screenshot: {e}")
+            return None
+        
+        _screenshot_writer.submit(path.write_bytes, data)
         logger.debug(f"Screenshot saved: {path}")
         return path
     
-    def save_trace(self, name: str) -> None:
-        """Save a trace for debugging (if tracing is enabled)."""
+    def _next_trace_chunk(self, path: Optional[Path] = None) -> bool:
+        """
+        Close the current trace chunk (saving it to path, or discarding it)
+        and start a new one, leaving tracing itself running.
+        
+        Returns:
+            True if the chunk was rotated
+        """
+        if not self._context:
+            return False
         try:
-            trace_dir = ensure_dir(PROFILE_DIR / "traces")
-            path = trace_dir / f"{name}_{int(time.time())}.zip"
-            if self._context:
-                self._context.tracing.stop(path=str(path))
-                logger.debug(f"Trace saved: {path}")
+            self._context.tracing.stop_chunk(path=str(path) if path else None)
+            self._context.tracing.start_chunk()
+            return True
         except Exception as e:
-            logger.warning(f"Failed to save trace: {e}")
+            logger.debug(f"Trace chunk not rotated: {e}")
+            return False
+    
+    def save_trace(self, name: str) -> None:
+        """Save the trace of the current paper for debugging (debug mode only)."""
+        if not self.debug:
+            return
+        path = _debug_path("traces", name, ".zip")
+        if self._next_trace_chunk(path):
+            logger.debug(f"Trace saved: {path}")
     
     def navigate_to_notebooklm(self) -> bool:
         """
@@ -165,64 +829,69 @@ class NotebookLMBot:
             RuntimeError: If login is required but running in headless mode
         """
         logger.info("Navigating to NotebookLM...")
-        self.page.goto(NOTEBOOKLM_URL, timeout=30000)
-        
-        # Wait a moment for page to load
-        time.sleep(2)
+        self.page.goto(NOTEBOOKLM_URL, wait_until="domcontentloaded", timeout=30000)
         
         # Check if we landed on the app or need to login
-        current_url = self.page.url
+        if "accounts.google.com" in self.page.url:
+            return self._login_required()
         
+        # Check for logged-in state: any home UI element ("我的笔记本", "新建",
+        # "My notebooks"), resolved by one wait as soon as it paints
+        try:
+            self._home_ui().wait_for(state="visible", timeout=8000)
+            logger.info("Successfully loaded NotebookLM")
+            self._ensure_storage_state()
+            return True
+        except PlaywrightTimeout:
+            current_url = self.page.url
+        
+        # Client-side redirect to the login page after the document loaded
         if "accounts.google.com" in current_url:
-            if self.headless:
-                # In headless mode, we cannot complete login - fail fast with clear message
-                error_msg = (
-                    "Google login required but running in headless mode.\n"
-                    "Please run 'apd login' first to authenticate, or use '--headful' flag."
-                )
-                logger.error(error_msg)
-                raise RuntimeError(error_msg)
-            else:
-                logger.warning("Google login required. Please login manually in the browser window.")
-                return False
+            return self._login_required()
         
-        # Check for logged-in state by looking for UI elements
-        try:
-            # Look for "我的笔记本" or "新建" button (Chinese UI)
-            my_notebooks = self.page.get_by_text("我的笔记本", exact=True)
-            new_btn = self.page.get_by_text("新建", exact=False)
-            
-            if (my_notebooks.count() > 0 and my_notebooks.first.is_visible()) or \
-               (new_btn.count() > 0 and new_btn.first.is_visible()):
-                logger.info("Successfully loaded NotebookLM")
-                return True
-            
-            # Try English UI
-            my_notebooks_en = self.page.get_by_text("My notebooks", exact=True)
-            if my_notebooks_en.count() > 0 and my_notebooks_en.first.is_visible():
-                logger.info("Successfully loaded NotebookLM")
-                return True
-            
-            # Fallback: Just check if we're on notebooklm.google.com
-            if "notebooklm.google.com" in current_url:
-                logger.info("Successfully loaded NotebookLM (URL check)")
-                return True
-                
-            logger.warning("NotebookLM UI not detected - may need login")
-            return False
+        # Fallback: Just check if we're on notebooklm.google.com
+        if "notebooklm.google.com" in current_url:
+            logger.info("Successfully loaded NotebookLM (URL check)")
+            self._ensure_storage_state()
+            return True
+        
+        logger.warning("NotebookLM UI not detected - may need login")
+        return False
+    
+    def _ensure_storage_state(self) -> None:
+        """Create state.json once for profiles that logged in before it existed."""
+        if not self.cdp_endpoint and not self.storage_state_path.exists():
+            self.save_storage_state()
+    
+    def _login_required(self) -> bool:
+        """
+        Handle landing on the Google login page.
+        
+        Returns:
+            False (login must be completed manually)
             
-        except Exception as e:
-            logger.debug(f"Error checking login state: {e}")
-            # If we're on notebooklm.google.com, assume success
-            if "notebooklm.google.com" in self.page.url:
-                logger.info("Successfully loaded NotebookLM (fallback)")
-                return True
-            return False
+        Raises:
+            RuntimeError: If running in headless mode
+        """
+        if self.headless:
+            # In headless mode, we cannot complete login - fail fast with clear message
+            error_msg = (
+                "Google login required but running in headless mode.\n"
+                "Please run 'apd login' first to authenticate, or use '--headful' flag."
+            )
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+        
+        logger.warning("Google login required. Please login manually in the browser window.")
+        return False
     
     def wait_for_login(self, timeout: int = 300) -> bool:
         """
         Wait for user to complete manual login.
         
+        Blocks on Playwright's navigation and element waiters instead of
+        polling, so login is detected as soon as the home UI renders.
+        
         Args:
             timeout: Maximum seconds to wait
             
@@ -230,76 +899,21 @@ class NotebookLMBot:
             True if login successful
         """
         logger.info(f"Waiting for manual login (timeout: {timeout}s)...")
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         
-        while time.time() - start_time < timeout:
-            current_url = self.page.url
-            
-            # Check if we're now on NotebookLM (not on login page)
-            if "notebooklm.google" in current_url and "accounts.google" not in current_url:
-                logger.info("Login detected, waiting for UI...")
-                try:
-                    # Wait for page to fully load
-                    self.page.wait_for_load_state("networkidle", timeout=10000)
-                    
-                    # Use multiple detection strategies for robustness
-                    ui_loaded = False
-                    
-                    # Strategy 1: Look for notebook list/create button text in any language
-                    for text_pattern in ["我的笔记本", "My notebooks", "新建笔记本", "新建", 
-                                        "Create", "New notebook", "精选笔记本"]:
-                        try:
-                            elem = self.page.get_by_text(text_pattern, exact=False).first
-                            if elem.is_visible(timeout=2000):
-                                ui_loaded = True
-                                logger.debug(f"Found UI element with text: {text_pattern}")
-                                break
-                        except Exception:
-                            continue
-                    
-                    # Strategy 2: Check for notebook cards (mat-card elements)
-                    if not ui_loaded:
-                        try:
-                            cards = self.page.locator('mat-card').count()
-                            if cards > 0:
-                                ui_loaded = True
-                                logger.debug(f"Found {cards} notebook card(s)")
-                        except Exception:
-                            pass
-                    
-                    # Strategy 3: Check for any notebook-related buttons
-                    if not ui_loaded:
-                        try:
-                            buttons = self.page.locator('button').count()
-                            if buttons > 5:  # Page has multiple interactive elements
-                                ui_loaded = True
-                                logger.debug(f"Found {buttons} buttons")
-                        except Exception:
-                            pass
-                    
-                    # Strategy 4: Check for "全部" (All) tab which is on the home page
-                    if not ui_loaded:
-                        try:
-                            tab = self.page.get_by_text("全部", exact=True)
-                            if tab.count() > 0 and tab.first.is_visible():
-                                ui_loaded = True
-                                logger.debug("Found '全部' tab")
-                        except Exception:
-                            pass
-                    
-                    if ui_loaded:
-                        logger.info("Login successful!")
-                        return True
-                        
-                except PlaywrightTimeout:
-                    logger.debug("Timeout waiting for UI elements, continuing to poll...")
-                except Exception as e:
-                    logger.debug(f"Error checking login status: {e}")
+        try:
+            self.page.wait_for_url(_is_notebooklm_url, timeout=timeout * 1000, wait_until="commit")
+            logger.info("Login detected, waiting for UI...")
             
-            time.sleep(2)
+            remaining_ms = max(deadline - time.monotonic(), 1) * 1000
+            self._home_ui().wait_for(state="visible", timeout=remaining_ms)
+        except PlaywrightTimeout:
+            logger.error("Login timeout - please try again")
+            return False
         
-        logger.error("Login timeout - please try again")
-        return False
+        logger.info("Login successful!")
+        self.save_storage_state()
+        return True
     
     def create_notebook(self, name: str) -> bool:
         """
@@ -315,19 +929,12 @@ class NotebookLMBot:
         
         try:
             # Click "New notebook" or "+" button (English and Chinese)
-            new_btn = self.page.locator(
-                'button:has-text("New notebook"), '
-                'button:has-text("Create"), '
-                'button:has-text("新建笔记本"), '
-                'button:has-text("新建"), '
-                '[aria-label*="new notebook" i], '
-                '[aria-label*="create" i], '
-                '[aria-label*="新建" i]'
-            ).first
+            new_btn = self.page.get_by_role("button", name=NEW_NOTEBOOK_NAME_RE).first
             new_btn.click()
             
-            # Wait for notebook creation dialog or new notebook to open
-            time.sleep(2)
+            # Wait for the new notebook to open (its URL is /notebook/<id>)
+            if not self._opened_notebook():
+                logger.debug("Notebook URL did not change, continuing")
             
             logger.info("Notebook creation initiated")
             return True
@@ -337,12 +944,14 @@ class NotebookLMBot:
             self.take_screenshot("create_notebook_failed")
             return False
     
-    def upload_pdf(self, pdf_path: Path) -> bool:
+    def upload_pdf(self, pdf_path: Path, wait_for_ingestion: bool = True) -> bool:
         """
         Upload a PDF to the current notebook.
         
         Args:
             pdf_path: Path to the PDF file
+            wait_for_ingestion: Block until NotebookLM has processed the PDF;
+                pass False to do other work first and call _wait_for_ingestion()
             
         Returns:
             True if upload successful
@@ -354,89 +963,31 @@ class NotebookLMBot:
             return False
         
         try:
-            # Wait a moment for the page to stabilize
-            time.sleep(1)
-            
             # Strategy 1: Direct file input (may be hidden but still works)
             # This is the most reliable method - set files on hidden input
-            file_inputs = self.page.locator('input[type="file"]')
-            if file_inputs.count() > 0:
-                logger.debug(f"Found {file_inputs.count()} file input(s)")
-                # Set files on the first file input (even if hidden)
-                file_inputs.first.set_input_files(str(pdf_path))
+            file_input = self.page.locator(FILE_INPUT_SELECTOR).first
+            try:
+                file_input.wait_for(state="attached", timeout=500)
+                file_input.set_input_files(str(pdf_path))
                 logger.info("PDF uploaded via file input")
-            else:
-                # Strategy 2: Need to trigger the file dialog first
-                # Look for "选择文件" (Select file) link or upload button
-                select_file_selectors = [
-                    'text=选择文件',  # Chinese: Select file (link in upload dialog)
-                    'a:text("选择文件")',  # Link format
-                    'text=Select file',
-                    'text=Choose file', 
-                    'a:has-text("选择")',
-                    'button:has-text("选择")',
-                    '[class*="upload"] a',
-                    '[class*="upload"] button',
-                    'text=Upload',
-                    'text=上传',
-                    # New patterns for upload dialog
-                    'text=上传来源',  # Upload source
-                    '[class*="dropzone"] a',
-                    '[role="dialog"] a:text("选择")',
-                    '[role="dialog"] text=选择文件',
-                ]
-                
-                clicked = False
-                for selector in select_file_selectors:
-                    try:
-                        elem = self.page.locator(selector).first
-                        if elem.count() > 0 and elem.is_visible():
-                            # Use file chooser handler
-                            with self.page.expect_file_chooser() as fc_info:
-                                elem.click()
-                            file_chooser = fc_info.value
-                            file_chooser.set_files(str(pdf_path))
-                            clicked = True
-                            logger.info(f"PDF uploaded via file chooser (selector: {selector})")
-                            break
-                    except Exception as e:
-                        logger.debug(f"Selector {selector} failed: {e}")
-                        continue
-                
-                if not clicked:
-                    # Strategy 3: Click on the upload zone area
-                    upload_zone_selectors = [
-                        '[class*="dropzone"]',
-                        '[class*="drop-zone"]', 
-                        '[class*="upload-area"]',
-                        'text=拖放或',  # Chinese: Drag and drop or
-                        'text=Drag',
-                        # New patterns for dialog upload zone
-                        'text=上传来源',  # Upload source icon/text
-                        '[role="dialog"] [class*="upload"]',
-                        # The upload icon area
-                        '[class*="source"] [class*="upload"]',
-                    ]
-                    
-                    for selector in upload_zone_selectors:
-                        try:
-                            elem = self.page.locator(selector).first
-                            if elem.count() > 0 and elem.is_visible():
-                                with self.page.expect_file_chooser() as fc_info:
-                                    elem.click()
-                                file_chooser = fc_info.value
-                                file_chooser.set_files(str(pdf_path))
-                                clicked = True
-                                logger.info(f"PDF uploaded via drop zone click")
-                                break
-                        except Exception:
-                            continue
-                
-                if not clicked:
+            except PlaywrightTimeout:
+                # Strategy 2: Click the first visible upload link/button/drop zone
+                # and answer the file chooser it must open
+                trigger = self.page.locator(UPLOAD_TRIGGER_SELECTOR).locator("visible=true").first
+                try:
+                    with self.page.expect_file_chooser(timeout=5000) as fc_info:
+                        trigger.click(timeout=5000)
+                    fc_info.value.set_files(str(pdf_path))
+                    logger.info("PDF uploaded via file chooser")
+                except PlaywrightTimeout:
                     logger.error("Could not find a way to upload the PDF")
                     self.take_screenshot("upload_pdf_no_input")
                     return False
             
+            if not wait_for_ingestion:
+                logger.info("PDF upload started")
+                return True
+            
             # Wait for upload and ingestion to complete
             logger.info("Waiting for PDF ingestion...")
             self._wait_for_ingestion()
@@ -449,12 +1000,55 @@ class NotebookLMBot:
             self.take_screenshot("upload_pdf_failed")
             return False
     
+    def _wait_for_page_condition(
+        self,
+        js: str,
+        timeout: float,
+        polling_ms: int,
+        label: str,
+        log_interval: float = 30
+    ):
+        """
+        Wait for an in-page predicate, logging progress every log_interval seconds.
+        
+        The browser polls the predicate itself; Python only wakes once per
+        interval (one CDP call) to log how long it has been waiting.
+        
+        Args:
+            js: Predicate for page.wait_for_function
+            timeout: Maximum seconds to wait
+            polling_ms: In-page polling interval
+            label: What is being waited for (for the log)
+            log_interval: Seconds between progress logs
+            
+        Returns:
+            The predicate's JSHandle, or None on timeout
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                return self.page.wait_for_function(
+                    js,
+                    timeout=max(min(remaining, log_interval), 0.001) * 1000,
+                    polling=polling_ms,
+                )
+            except PlaywrightTimeout:
+                now = time.monotonic()
+                if now >= deadline:
+                    return None
+                logger.debug(f"Still waiting for {label}... ({int(now - start)}s elapsed)")
+    
     def _wait_for_ingestion(self, timeout: int = 120) -> bool:
         """
         Wait for PDF ingestion to complete.
         
         NotebookLM needs time to process the PDF and extract content.
-        We wait for the main content area to show paper content.
+        We first wait for the uploaded source to be registered, then for
+        the chat panel to show paper content, so an empty notebook never
+        passes. Both checks run in the page (SOURCE_ADDED_JS,
+        INGESTION_READY_JS), polled by the browser itself rather than over CDP.
         
         Args:
             timeout: Maximum seconds to wait
@@ -463,66 +1057,27 @@ class NotebookLMBot:
             True if ingestion completed
         """
         logger.debug("Starting ingestion wait...")
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         
-        # Wait for initial upload to start
-        time.sleep(5)
+        if self._wait_for_page_condition(
+            SOURCE_ADDED_JS, timeout, polling_ms=500,
+            label="uploaded source", log_interval=15,
+        ) is None:
+            logger.warning("Uploaded source did not appear")
+            self.take_screenshot("ingestion_timeout")
+            return False
         
-        while time.time() - start_time < timeout:
-            try:
-                # Check for content loaded in main area
-                # When PDF is processed, the main area shows paper content with questions
-                
-                # Method 1: Look for "对话" header with actual content below it
-                # The paper summary or questions appear after processing
-                try:
-                    # Check for sample questions that appear after ingestion
-                    # These are like "Avatar Forcing 如何通过扩散..." in Chinese
-                    questions = self.page.locator('text=/如何|什么|为什么|哪些/')
-                    if questions.count() >= 2:  # At least 2 questions visible
-                        logger.info("PDF ingestion complete (questions visible)")
-                        return True
-                except Exception:
-                    pass
-                
-                # Method 2: Check for paper title or summary in main content
-                # After processing, the paper title appears in the main area
-                try:
-                    # Look for content with substantial text (paper summary)
-                    main_content = self.page.locator('[class*="chat"], [class*="content"]')
-                    if main_content.count() > 0:
-                        text_content = main_content.first.text_content()
-                        if text_content and len(text_content) > 200:  # Has substantial content
-                            logger.info("PDF ingestion complete (content loaded)")
-                            return True
-                except Exception:
-                    pass
-                
-                # Method 3: Check for the "开始输入" (Start typing) text at bottom
-                # This only appears when content is ready
-                try:
-                    start_input = self.page.get_by_text("开始输入", exact=False)
-                    if start_input.count() > 0 and start_input.first.is_visible():
-                        # Also verify source count shows in main area (not just sidebar)
-                        source_in_main = self.page.locator('text=/\\d+ 个来源/')
-                        if source_in_main.count() > 0:
-                            logger.info("PDF ingestion complete (ready for input)")
-                            return True
-                except Exception:
-                    pass
-                
-            except Exception as e:
-                logger.debug(f"Error during ingestion check: {e}")
-            
-            elapsed = int(time.time() - start_time)
-            if elapsed > 0 and elapsed % 15 == 0:
-                logger.debug(f"Still waiting for PDF processing... ({elapsed}s)")
-            
-            time.sleep(3)
+        handle = self._wait_for_page_condition(
+            INGESTION_READY_JS, max(deadline - time.monotonic(), 0), polling_ms=500,
+            label="PDF ingestion", log_interval=15,
+        )
+        if handle is None:
+            logger.warning("Ingestion wait timeout")
+            self.take_screenshot("ingestion_timeout")
+            return False
         
-        logger.warning("Ingestion wait timeout")
-        self.take_screenshot("ingestion_timeout")
-        return False
+        logger.info(f"PDF ingestion complete ({handle.json_value()})")
+        return True
     
     def extract_summary(self) -> Optional[str]:
         """
@@ -537,8 +1092,8 @@ class NotebookLMBot:
         logger.info("Extracting summary from NotebookLM...")
         
         try:
-            # Wait a moment for content to be fully rendered
-            time.sleep(2)
+            # Wait for the first dialogue block to render
+            self._visible(SUMMARY_BLOCK_SELECTOR, timeout_ms=5000)
             
             # The summary is the first response in the dialogue area
             # It's usually in a highlighted/colored block
@@ -546,7 +1101,7 @@ class NotebookLMBot:
             # Method 1: Look for the summary block with yellow/highlighted background
             try:
                 # The summary appears in a div with specific styling
-                summary_blocks = self.page.locator('[class*="response"], [class*="message"], [class*="chat"] p')
+                summary_blocks = self.page.locator(SUMMARY_BLOCK_SELECTOR)
                 if summary_blocks.count() > 0:
                     # Get all text from the first substantial block
                     for i in range(min(summary_blocks.count(), 5)):
@@ -608,26 +1163,19 @@ class NotebookLMBot:
         logger.info("Checking Studio panel availability...")
         
         try:
-            # Give page a moment to render
-            time.sleep(2)
-            
-            # Check for Studio panel elements
-            # Method 1: Look for "Studio" text
-            try:
-                studio = self.page.get_by_text("Studio", exact=True)
-                if studio.count() > 0 and studio.first.is_visible():
-                    logger.info("Studio panel found")
-                    return True
-            except Exception:
-                pass
-            
-            # Method 2: Look for video/audio overview cards
+            # Check for Studio panel elements: the "Studio" header or the
+            # video overview card, whichever renders first
+            studio = (
+                self.page.get_by_text("Studio", exact=True)
+                .or_(self.page.locator(VIDEO_CARD_SELECTOR))
+                .locator("visible=true")
+                .first
+            )
             try:
-                video_card = self.page.get_by_text("视频概览", exact=True)
-                if video_card.count() > 0 and video_card.first.is_visible():
-                    logger.info("Studio panel found (视频概览 visible)")
-                    return True
-            except Exception:
+                studio.wait_for(state="visible", timeout=3000)
+                logger.info("Studio panel found")
+                return True
+            except PlaywrightTimeout:
                 pass
             
             # If we got here, Studio panel was not found but we'll try to continue anyway
@@ -654,58 +1202,29 @@ class NotebookLMBot:
         logger.info("Starting Video Overview generation...")
         
         try:
-            # Wait for page to stabilize
-            time.sleep(2)
-            
-            # Method 1: Click on the "视频概览" (Video Overview) card
-            # This directly triggers generation in the new UI
+            # Click the "视频概览" (Video Overview) card, by Chinese/English
+            # text or aria-label; this directly triggers generation in the new UI
+            video_card = self.page.locator(VIDEO_CARD_SELECTOR).locator("visible=true").first
             try:
-                video_card = self.page.get_by_text("视频概览", exact=True)
-                if video_card.count() > 0 and video_card.first.is_visible():
-                    video_card.first.click()
-                    time.sleep(1)
-                    logger.info("Clicked on 视频概览 card")
-                    
-                    # Check if a dialog appeared asking for customization
-                    # If so, click the generate button
-                    try:
-                        generate_btn = self.page.get_by_role("button", name="生成")
-                        if generate_btn.count() > 0 and generate_btn.first.is_visible():
-                            generate_btn.first.click()
-                            logger.info("Clicked 生成 button in dialog")
-                    except Exception:
-                        pass  # No dialog, generation started directly
-                    
-                    logger.info("Video Overview generation started")
-                    return True
-            except Exception as e:
-                logger.debug(f"Failed to click 视频概览: {e}")
-            
-            # Method 2: Try English text
-            try:
-                video_card_en = self.page.get_by_text("Video Overview", exact=True)
-                if video_card_en.count() > 0 and video_card_en.first.is_visible():
-                    video_card_en.first.click()
-                    time.sleep(1)
-                    logger.info("Video Overview generation started (English)")
-                    return True
-            except Exception:
-                pass
-            
-            # Method 3: Try by aria-label
-            try:
-                video_elem = self.page.locator('[aria-label*="视频概览"], [aria-label*="Video Overview"]').first
-                if video_elem.count() > 0 and video_elem.is_visible():
-                    video_elem.click()
-                    time.sleep(1)
-                    logger.info("Video Overview generation started (aria-label)")
-                    return True
-            except Exception:
-                pass
+                video_card.wait_for(state="visible", timeout=10000)
+            except PlaywrightTimeout:
+                logger.error("Could not find Video Overview card to click")
+                self.take_screenshot("video_card_not_found")
+                return False
             
-            logger.error("Could not find Video Overview card to click")
-            self.take_screenshot("video_card_not_found")
-            return False
+            with self._expect_generation_started():
+                video_card.click()
+                logger.info("Clicked on 视频概览 card")
+                
+                # Check if a dialog appeared asking for customization
+                # If so, click the generate button
+                generate_btn = self._visible('role=button[name="生成"]')
+                if generate_btn:
+                    generate_btn.click()
+                    logger.info("Clicked 生成 button in dialog")
+            
+            logger.info("Video Overview generation started")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to start video generation: {e}")
@@ -725,25 +1244,19 @@ class NotebookLMBot:
         logger.info("Starting Slides/Presentation generation...")
         
         try:
-            # Wait for page to stabilize
-            time.sleep(2)
-            
             # Method 1: Click on the "演示文稿" (Slides) card
             try:
-                slides_card = self.page.get_by_text("演示文稿", exact=True)
-                if slides_card.count() > 0 and slides_card.first.is_visible():
-                    slides_card.first.click()
-                    time.sleep(1)
-                    logger.info("Clicked on 演示文稿 card")
-                    
-                    # Check if a dialog appeared asking for customization
-                    try:
-                        generate_btn = self.page.get_by_role("button", name="生成")
-                        if generate_btn.count() > 0 and generate_btn.first.is_visible():
-                            generate_btn.first.click()
+                slides_card = self._visible(':text-is("演示文稿")', timeout_ms=3000)
+                if slides_card:
+                    with self._expect_generation_started():
+                        slides_card.click()
+                        logger.info("Clicked on 演示文稿 card")
+                        
+                        # Check if a dialog appeared asking for customization
+                        generate_btn = self._visible('role=button[name="生成"]')
+                        if generate_btn:
+                            generate_btn.click()
                             logger.info("Clicked 生成 button in dialog")
-                    except Exception:
-                        pass  # No dialog, generation started directly
                     
                     logger.info("Slides generation started")
                     return True
@@ -751,26 +1264,20 @@ class NotebookLMBot:
                 logger.debug(f"Failed to click 演示文稿: {e}")
             
             # Method 2: Try English text
-            try:
-                slides_card_en = self.page.get_by_text("Slides", exact=True)
-                if slides_card_en.count() > 0 and slides_card_en.first.is_visible():
-                    slides_card_en.first.click()
-                    time.sleep(1)
-                    logger.info("Slides generation started (English)")
-                    return True
-            except Exception:
-                pass
+            slides_card_en = self._visible(':text-is("Slides")', timeout_ms=500)
+            if slides_card_en:
+                with self._expect_generation_started():
+                    slides_card_en.click()
+                logger.info("Slides generation started (English)")
+                return True
             
             # Method 3: Try "Presentation"
-            try:
-                pres_card = self.page.get_by_text("Presentation", exact=True)
-                if pres_card.count() > 0 and pres_card.first.is_visible():
-                    pres_card.first.click()
-                    time.sleep(1)
-                    logger.info("Presentation generation started")
-                    return True
-            except Exception:
-                pass
+            pres_card = self._visible(':text-is("Presentation")', timeout_ms=500)
+            if pres_card:
+                with self._expect_generation_started():
+                    pres_card.click()
+                logger.info("Presentation generation started")
+                return True
             
             logger.error("Could not find Slides/演示文稿 card to click")
             self.take_screenshot("slides_card_not_found")
@@ -797,35 +1304,29 @@ class NotebookLMBot:
         logger.info(f"Renaming notebook to: {new_name}")
         
         try:
-            time.sleep(1)
-            
             # Find the title input - it's the first/main input at the top of the page
             # The title input contains the notebook name (auto-populated from PDF)
             title_input = self.page.locator('input').first
-            
-            if title_input.count() > 0 and title_input.is_visible():
-                # Click to focus
-                title_input.click()
-                time.sleep(0.3)
-                
-                # Select all (Cmd+A on Mac)
-                self.page.keyboard.press("Meta+a")
-                time.sleep(0.2)
-                
-                # Type new name (this replaces selected text)
-                self.page.keyboard.type(new_name)
-                time.sleep(0.3)
-                
-                # Press Enter to confirm
-                self.page.keyboard.press("Enter")
-                time.sleep(1)
-                
-                logger.info(f"Notebook renamed to: {new_name}")
-                return True
-            else:
+            try:
+                title_input.wait_for(state="visible", timeout=5000)
+            except PlaywrightTimeout:
                 logger.warning("Title input not found")
                 return False
             
+            # fill writes the whole text in one call and fires the input event;
+            # only non-text inputs fall back to select-all + typing
+            try:
+                title_input.fill(new_name)
+            except PlaywrightError:
+                title_input.select_text()
+                self.page.keyboard.type(new_name)
+            
+            # Press Enter to confirm
+            title_input.press("Enter")
+            
+            logger.info(f"Notebook renamed to: {new_name}")
+            return True
+            
         except Exception as e:
             logger.error(f"Failed to rename notebook: {e}")
             return False
@@ -841,61 +1342,29 @@ class NotebookLMBot:
             True if video is ready
         """
         logger.info(f"Waiting for video generation (timeout: {timeout}s)...")
-        start_time = time.time()
-        
-        # First, wait a bit for generation to actually start
-        time.sleep(5)
         
-        # Track if we've seen the "generating" state
-        seen_generating = False
+        # Wait for "正在生成" (generating) first (up to 5 s), so an older item's
+        # timestamp is not mistaken for completion
+        try:
+            self.page.get_by_text(GENERATING_TEXT).first.wait_for(timeout=5000)
+        except PlaywrightTimeout:
+            pass
         
-        while time.time() - start_time < timeout:
-            try:
-                # Check if generation is in progress
-                try:
-                    generating_text = self.page.get_by_text("正在生成", exact=False)
-                    if generating_text.count() > 0 and generating_text.first.is_visible():
-                        seen_generating = True
-                        elapsed = int(time.time() - start_time)
-                        if elapsed % 30 == 0 and elapsed > 0:
-                            logger.debug(f"Still generating video... ({elapsed}s elapsed)")
-                        time.sleep(5)
-                        continue
-                except Exception:
-                    pass
-                
-                # If we've seen generating and now it's gone, generation is complete
-                if seen_generating:
-                    # Wait a moment for UI to update
-                    time.sleep(2)
-                    logger.info("Video generation complete! (generating text disappeared)")
-                    return True
-                
-                # Alternative: Check for generated video title in the Studio output area
-                # Generated videos appear in the list below the cards
-                try:
-                    # Look for video items that have a timestamp (indicates generated content)
-                    video_items = self.page.locator('text=/\\d+ 分钟|刚刚/')
-                    if video_items.count() > 0:
-                        logger.info("Video generation complete! (found generated item with timestamp)")
-                        return True
-                except Exception:
-                    pass
-                
-                # Check for error state
-                try:
-                    error_text = self.page.get_by_text("失败", exact=False)
-                    if error_text.count() > 0 and error_text.first.is_visible():
-                        logger.error("Video generation failed")
-                        self.take_screenshot("video_generation_error")
-                        return False
-                except Exception:
-                    pass
-                    
-            except Exception as e:
-                logger.debug(f"Error checking video status: {e}")
-            
-            time.sleep(5)
+        # All state checks run in the page (VIDEO_READY_JS), polled by the browser;
+        # Python only wakes every 30 s to log progress
+        try:
+            if self._wait_for_page_condition(
+                VIDEO_READY_JS, timeout, polling_ms=2000,
+                label="video generation", log_interval=30,
+            ):
+                logger.info("Video generation complete!")
+                return True
+        except PlaywrightError as e:
+            if "video generation failed" not in str(e):
+                raise
+            logger.error("Video generation failed")
+            self.take_screenshot("video_generation_error")
+            return False
         
         logger.error("Video generation timeout")
         self.take_screenshot("video_timeout")
@@ -969,121 +1438,32 @@ class NotebookLMBot:
             # First, scroll the Studio panel to reveal generated items
             try:
                 studio_panel = self.page.locator('[class*="studio"], [class*="right-panel"]').first
-                if studio_panel.count() > 0:
-                    studio_panel.evaluate("el => el.scrollTop = el.scrollHeight")
-                    time.sleep(1)
-            except Exception:
-                pass
-            
-            # Find the generated video item and click its "更多" (More) button
-            # The artifact items in Studio panel have a more options button (three dots)
-            # The button has class "artifact-more-button" and aria-label="更多"
-            more_clicked = False
-            
-            # Method 1: Use the specific artifact-more-button class (most reliable)
-            try:
-                more_btn = self.page.locator('button.artifact-more-button[aria-label="更多"]')
-                if more_btn.count() > 0 and more_btn.first.is_visible():
-                    more_btn.first.click()
-                    time.sleep(1)
-                    more_clicked = True
-                    logger.debug("Clicked artifact-more-button")
-            except Exception as e:
-                logger.debug(f"Method 1 (artifact-more-button) failed: {e}")
-            
-            # Method 2: Find all more_vert buttons and click the one in Studio panel
-            if not more_clicked:
-                try:
-                    # Look for buttons containing the more_vert icon
-                    more_buttons = self.page.locator('mat-icon:text("more_vert")')
-                    if more_buttons.count() > 0:
-                        # Click the last one (usually the one in Studio panel for generated items)
-                        # or iterate through them
-                        for i in range(more_buttons.count()):
-                            btn = more_buttons.nth(i)
-                            if btn.is_visible():
-                                # Click the parent button element
-                                parent_btn = btn.locator('xpath=ancestor::button')
-                                if parent_btn.count() > 0:
-                                    parent_btn.first.click()
-                                else:
-                                    btn.click()
-                                time.sleep(1)
-                                # Check if menu appeared
-                                menu = self.page.locator('[role="menu"]')
-                                if menu.count() > 0 and menu.first.is_visible():
-                                    more_clicked = True
-                                    logger.debug(f"Clicked more_vert button #{i}")
-                                    break
-                except Exception as e:
-                    logger.debug(f"Method 2 failed: {e}")
-            
-            # Method 3: Direct aria-label search
-            if not more_clicked:
-                try:
-                    more_btn = self.page.locator('[aria-label="更多"], [aria-label="More options"]').last
-                    if more_btn.count() > 0 and more_btn.is_visible():
-                        more_btn.click()
-                        time.sleep(1)
-                        more_clicked = True
-                        logger.debug("Clicked more button by aria-label")
-                except Exception as e:
-                    logger.debug(f"Method 3 failed: {e}")
+                if studio_panel.count() > 0:
+                    studio_panel.evaluate("el => el.scrollTop = el.scrollHeight")
+            except Exception:
+                pass
             
-            if not more_clicked:
+            # Click the generated item's "更多" (More) button, then "下载" (Download).
+            # One union locator each instead of a ladder of fallback queries
+            more_btn = self._visible(ARTIFACT_MORE_SELECTOR, timeout_ms=5000)
+            if not more_btn:
+                fallback = self.page.locator(MORE_BUTTON_FALLBACK_SELECTOR).locator("visible=true")
+                if fallback.count() > 0:
+                    more_btn = fallback.last
+            if not more_btn:
                 logger.error("Could not find or click 更多 button")
                 self.take_screenshot("more_button_not_found")
                 return None
+            more_btn.click()
+            
+            download_item = self._visible(DOWNLOAD_MENU_ITEM_SELECTOR, timeout_ms=5000)
+            if not download_item:
+                logger.error("Could not find download menu item")
+                self.take_screenshot("download_menu_not_found")
+                return None
             
-            # Click the "下载" (Download) menu item
             with self.page.expect_download(timeout=120000) as download_info:
-                try:
-                    time.sleep(0.5)  # Wait for menu to fully appear
-                    
-                    # Method 1: Look for Download menu item by role
-                    download_item = self.page.get_by_role("menuitem", name="下载")
-                    if download_item.count() > 0 and download_item.first.is_visible():
-                        download_item.first.click()
-                        logger.debug("Clicked 下载 menu item by role")
-                    else:
-                        # Method 2: Find by CSS class (mat-mdc-menu-item) and text
-                        download_item = self.page.locator('.mat-mdc-menu-item:has-text("下载")')
-                        if download_item.count() > 0 and download_item.first.is_visible():
-                            download_item.first.click()
-                            logger.debug("Clicked 下载 menu item by CSS class")
-                        else:
-                            # Method 3: Find button with role=menuitem containing span with text
-                            download_item = self.page.locator('button[role="menuitem"] span:text("下载")')
-                            if download_item.count() > 0:
-                                # Click the parent button
-                                download_item.first.locator('xpath=ancestor::button').click()
-                                logger.debug("Clicked 下载 menu item via span text")
-                            else:
-                                # Method 4: Try English
-                                download_item_en = self.page.get_by_role("menuitem", name="Download")
-                                if download_item_en.count() > 0:
-                                    download_item_en.first.click()
-                                    logger.debug("Clicked Download menu item (English)")
-                                else:
-                                    # Method 5: Find by text in menu
-                                    menu = self.page.locator('[role="menu"]')
-                                    if menu.count() > 0:
-                                        download_in_menu = menu.locator('button:has-text("下载")')
-                                        if download_in_menu.count() > 0:
-                                            download_in_menu.first.click()
-                                            logger.debug("Clicked 下载 in menu via text search")
-                                        else:
-                                            logger.error("Could not find download menu item")
-                                            self.take_screenshot("download_menu_not_found")
-                                            return None
-                                    else:
-                                        logger.error("Menu not visible after clicking more button")
-                                        self.take_screenshot("menu_not_visible")
-                                        return None
-                except Exception as e:
-                    logger.error(f"Failed to click download: {e}")
-                    self.take_screenshot("download_click_failed")
-                    return None
+                download_item.click()
             
             download = download_info.value
             download.save_as(str(save_path))
@@ -1122,7 +1502,6 @@ class NotebookLMBot:
                 studio_panel = self.page.locator('[class*="studio"], [class*="right-panel"]').first
                 if studio_panel.count() > 0:
                     studio_panel.evaluate("el => el.scrollTop = el.scrollHeight")
-                    time.sleep(1)
             except Exception:
                 pass
             
@@ -1141,7 +1520,7 @@ class NotebookLMBot:
                     more_btn = artifact.locator('button[aria-label="更多"], button.artifact-more-button')
                     if more_btn.count() > 0 and more_btn.first.is_visible():
                         more_btn.first.click()
-                        time.sleep(1)
+                        self.page.locator(MENU_SELECTOR).first.wait_for(state="visible", timeout=3000)
                         more_clicked = True
                         logger.debug("Clicked more button on slides artifact")
             except Exception as e:
@@ -1157,11 +1536,10 @@ class NotebookLMBot:
                         btn = more_buttons.nth(i)
                         if btn.is_visible():
                             btn.click()
-                            time.sleep(0.5)
                             # Check if this menu has PDF or slides related text
-                            menu = self.page.locator('[role="menu"]')
-                            if menu.count() > 0:
-                                menu_text = menu.first.text_content() or ""
+                            menu = self._visible(MENU_SELECTOR, timeout_ms=3000)
+                            if menu:
+                                menu_text = menu.text_content() or ""
                                 # If this is not the video menu (no .mp4), could be slides
                                 if "下载" in menu_text and i > 0:  # Second or later artifact
                                     more_clicked = True
@@ -1170,7 +1548,7 @@ class NotebookLMBot:
                                 else:
                                     # Close this menu and try next
                                     self.page.keyboard.press("Escape")
-                                    time.sleep(0.3)
+                                    menu.wait_for(state="hidden", timeout=3000)
                 except Exception as e:
                     logger.debug(f"Failed to find slides artifact: {e}")
             
@@ -1181,12 +1559,12 @@ class NotebookLMBot:
             # Click the "下载" (Download) menu item
             with self.page.expect_download(timeout=120000) as download_info:
                 try:
-                    time.sleep(0.5)
-                    download_item = self.page.get_by_role("menuitem", name="下载")
-                    if download_item.count() > 0 and download_item.first.is_visible():
-                        download_item.first.click()
+                    download_item = self.page.get_by_role("menuitem", name="下载").first
+                    try:
+                        download_item.wait_for(state="visible", timeout=3000)
+                        download_item.click()
                         logger.debug("Clicked 下载 menu item for slides")
-                    else:
+                    except PlaywrightTimeout:
                         download_item = self.page.locator('.mat-mdc-menu-item:has-text("下载")')
                         if download_item.count() > 0:
                             download_item.first.click()
@@ -1229,6 +1607,36 @@ class NotebookLMBot:
         Returns:
             True if successful
         """
+        started = self.start_paper(paper_id, pdf_path, week_id, steering_prompt, force)
+        if started is None:
+            return True  # Already VIDEO_OK
+        return started and self.finish_paper(paper_id, week_id)
+    
+    def start_paper(
+        self,
+        paper_id: str,
+        pdf_path: Path,
+        week_id: str,
+        steering_prompt: Optional[str] = None,
+        force: bool = False
+    ) -> Optional[bool]:
+        """
+        First half of process_paper: create notebook, upload PDF, start the video.
+        
+        Returns once NotebookLM is generating, so callers can start other
+        papers in other tabs before calling finish_paper for this one.
+        
+        Args:
+            paper_id: The paper ID
+            pdf_path: Path to the PDF file
+            week_id: Week identifier
+            steering_prompt: Optional steering prompt for video
+            force: Force reprocessing even if already done
+            
+        Returns:
+            True if generation started, False on failure,
+            None if the paper is already VIDEO_OK (nothing to do)
+        """
         logger.info(f"Processing paper: {paper_id}")
         
         # Check current status
@@ -1239,7 +1647,7 @@ class NotebookLMBot:
         
         if paper.status == Status.VIDEO_OK and not force:
             logger.info(f"Paper {paper_id} already has VIDEO_OK status, skipping")
-            return True
+            return None
         
         try:
             # Navigate to NotebookLM
@@ -1277,6 +1685,26 @@ class NotebookLMBot:
                 update_status(paper_id, Status.ERROR, "Failed to start video generation")
                 return False
             
+            return True
+            
+        except Exception as e:
+            self._record_paper_error(paper_id, e)
+            return False
+    
+    def finish_paper(self, paper_id: str, week_id: str) -> bool:
+        """
+        Second half of process_paper: wait for the video and download it.
+        
+        Must run on the page start_paper used for this paper.
+        
+        Args:
+            paper_id: The paper ID
+            week_id: Week identifier
+            
+        Returns:
+            True if the video was downloaded
+        """
+        try:
             # Wait for video
             if not self.wait_for_video_ready():
                 update_status(paper_id, Status.ERROR, "Video generation timeout")
@@ -1302,11 +1730,183 @@ class NotebookLMBot:
             return True
             
         except Exception as e:
-            error_msg = f"Error processing paper {paper_id}: {e}"
-            logger.error(error_msg)
-            self.take_screenshot(f"error_{paper_id}")
-            update_status(paper_id, Status.ERROR, error=error_msg, increment_retry=True)
+            self._record_paper_error(paper_id, e)
+            return False
+    
+    def _record_paper_error(self, paper_id: str, e: Exception) -> None:
+        """Log an unexpected processing error, capture debug artifacts, mark ERROR."""
+        error_msg = f"Error processing paper {paper_id}: {e}"
+        logger.error(error_msg)
+        self.take_screenshot(f"error_{paper_id}")
+        self.save_trace(f"error_{paper_id}")
+        update_status(paper_id, Status.ERROR, error=error_msg, increment_retry=True)
+
+_Item = TypeVar("_Item")
+
+
+def _papers_with_pdf(papers: list[Paper]) -> Iterator[tuple[Paper, Path]]:
+    """Yield (paper, pdf_path) for papers whose PDF exists, logging the rest."""
+    for paper in papers:
+        if not paper.pdf_path:
+            logger.warning(f"Paper {paper.paper_id} has no PDF path")
+            continue
+        
+        pdf_path = Path(paper.pdf_path)
+        if not pdf_path.exists():
+            logger.warning(f"PDF not found for {paper.paper_id}: {pdf_path}")
+            continue
+        
+        yield paper, pdf_path
+
+
+def _run_in_tab_batches(
+    bot: NotebookLMBot,
+    items: Sequence[_Item],
+    concurrency: int,
+    start: Callable[[_Item], Optional[bool]],
+    finish: Callable[[_Item], bool]
+) -> tuple[int, int]:
+    """
+    Run a two-step job over items, up to `concurrency` at a time, one tab each.
+    
+    start(item) runs for every item of a batch first (each in a new tab),
+    kicking off the slow server-side work; finish(item) then revisits the
+    tabs in order. While finish waits on the first paper, NotebookLM is
+    already working on the others, so waits overlap instead of adding up.
+    Both steps record their own errors; their exceptions are not expected.
+    
+    Args:
+        bot: Started bot
+        items: Work items
+        concurrency: Items in flight at once
+        start: Returns True to continue with finish, False on failure,
+            None when there is nothing to do (counted as success)
+        finish: Returns True on success
+        
+    Returns:
+        Tuple of (success_count, failure_count)
+    """
+    success = 0
+    failure = 0
+    batch_size = max(1, concurrency)
+    
+    for offset in range(0, len(items), batch_size):
+        # One trace chunk per batch, so save_trace on a failure only keeps this batch
+        if bot.debug:
+            bot._next_trace_chunk()
+        started = []
+        for item in items[offset:offset + batch_size]:
+            page = bot.open_page()
+            with bot.use_page(page):
+                result = start(item)
+            if result:
+                started.append((item, page))
+                continue
+            if result is None:
+                success += 1
+            else:
+                failure += 1
+            page.close()
+        
+        for item, page in started:
+            try:
+                with bot.use_page(page):
+                    ok = finish(item)
+            finally:
+                page.close()
+            if ok:
+                success += 1
+            else:
+                failure += 1
+    
+    return success, failure
+
+
+def _start_upload(bot: NotebookLMBot, paper_id: str, pdf_path: Path, week_id: str) -> bool:
+    """
+    Upload step 1: create the notebook and upload the PDF.
+    
+    Returns without waiting for ingestion, which NotebookLM does server-side.
+    """
+    try:
+        logger.info(f"Processing paper: {paper_id}")
+        
+        # Navigate to NotebookLM
+        if not bot.navigate_to_notebooklm():
+            if not bot.wait_for_login():
+                update_status(paper_id, Status.ERROR, "Login failed")
+                return False
+        
+        # Create notebook with week prefix
+        notebook_name = f"{week_id}_{paper_id}"
+        if not bot.create_notebook(notebook_name):
+            update_status(paper_id, Status.ERROR, "Failed to create notebook")
+            return False
+        
+        # Upload PDF
+        if not bot.upload_pdf(pdf_path, wait_for_ingestion=False):
+            update_status(paper_id, Status.ERROR, "Failed to upload PDF")
             return False
+        
+        return True
+    
+    except Exception as e:
+        _record_upload_error(bot, paper_id, e)
+        return False
+
+
+def _finish_upload(bot: NotebookLMBot, paper_id: str, week_id: str) -> bool:
+    """Upload step 2: wait for ingestion, rename, save the summary, trigger video + slides."""
+    try:
+        bot._wait_for_ingestion()
+        
+        # Rename notebook only after ingestion: NotebookLM fills the title in
+        # from the PDF and would overwrite an earlier rename, and
+        # download_videos_for_week finds the notebook by this name
+        notebook_name = f"{week_id}_{paper_id}"
+        if not bot.rename_notebook(notebook_name):
+            logger.warning(f"Could not rename notebook to {notebook_name}")
+        
+        # Extract summary from the auto-generated dialogue
+        summary = bot.extract_summary()
+        if summary:
+            logger.info(f"Extracted summary for {paper_id}: {summary[:100]}...")
+        
+        # Navigate to Studio and trigger video generation
+        if not bot.navigate_to_studio():
+            logger.warning(f"Could not navigate to Studio for {paper_id}")
+        
+        if not bot.generate_video_overview():
+            logger.warning(f"Could not trigger video generation for {paper_id}")
+        
+        # Also trigger slides/presentation generation
+        if not bot.generate_slides():
+            logger.warning(f"Could not trigger slides generation for {paper_id}")
+        
+        # Update status to UPLOADED (video and slides are generating)
+        upsert_paper(
+            paper_id=paper_id,
+            week_id=week_id,
+            notebooklm_note_name=notebook_name,
+            summary=summary,  # Save extracted summary
+            status=Status.NBLM_OK  # Use NBLM_OK to indicate uploaded
+        )
+        
+        logger.info(f"Successfully uploaded and triggered video+slides for: {paper_id}")
+        return True
+    
+    except Exception as e:
+        _record_upload_error(bot, paper_id, e)
+        return False
+
+
+def _record_upload_error(bot: NotebookLMBot, paper_id: str, e: Exception) -> None:
+    """Log an upload error, capture debug artifacts and mark the paper ERROR."""
+    error_msg = f"Error uploading paper {paper_id}: {e}"
+    logger.error(error_msg)
+    bot.take_screenshot(f"upload_error_{paper_id}")
+    bot.save_trace(f"upload_error_{paper_id}")
+    update_status(paper_id, Status.ERROR, error=error_msg, increment_retry=True)
 
 
 def process_papers_for_week(
@@ -1314,17 +1914,22 @@ def process_papers_for_week(
     headless: bool = True,
     max_papers: Optional[int] = None,
     force: bool = False,
-    steering_prompt: Optional[str] = None
+    steering_prompt: Optional[str] = None,
+    concurrency: int = NOTEBOOKLM_CONCURRENCY
 ) -> tuple[int, int]:
     """
     Process all papers for a week through NotebookLM.
     
+    Up to `concurrency` papers are started in their own tabs before the
+    first video is awaited, so their generation runs in parallel.
+    
     Args:
         week_id: Week identifier
         headless: Run browser in headless mode
         max_papers: Maximum papers to process
         force: Force reprocessing
         steering_prompt: Optional steering prompt for videos
+        concurrency: Papers in flight at once (one tab each)
         
     Returns:
         Tuple of (success_count, failure_count)
@@ -1340,34 +1945,22 @@ def process_papers_for_week(
         logger.info(f"No papers ready for NotebookLM processing in week {week_id}")
         return 0, 0
     
-    success = 0
-    failure = 0
-    
     with NotebookLMBot(headless=headless) as bot:
-        for paper in papers:
-            if not paper.pdf_path:
-                logger.warning(f"Paper {paper.paper_id} has no PDF path")
-                failure += 1
-                continue
-            
-            pdf_path = Path(paper.pdf_path)
-            if not pdf_path.exists():
-                logger.warning(f"PDF not found for {paper.paper_id}: {pdf_path}")
-                failure += 1
-                continue
-            
-            result = bot.process_paper(
-                paper_id=paper.paper_id,
-                pdf_path=pdf_path,
+        ready = list(_papers_with_pdf(papers))
+        failure = len(papers) - len(ready)
+        
+        success, batch_failure = _run_in_tab_batches(
+            bot, ready, concurrency,
+            start=lambda item: bot.start_paper(
+                paper_id=item[0].paper_id,
+                pdf_path=item[1],
                 week_id=week_id,
                 steering_prompt=steering_prompt,
                 force=force
-            )
-            
-            if result:
-                success += 1
-            else:
-                failure += 1
+            ),
+            finish=lambda item: bot.finish_paper(item[0].paper_id, week_id),
+        )
+        failure += batch_failure
     
     logger.info(f"NotebookLM processing complete for week {week_id}: {success} success, {failure} failed")
     return success, failure
@@ -1378,6 +1971,7 @@ def upload_papers_for_week(
     headless: bool = True,
     max_papers: Optional[int] = None,
     force: bool = False,
+    concurrency: int = NOTEBOOKLM_CONCURRENCY,
 ) -> tuple[int, int]:
     """
     Upload all PDFs for a week to NotebookLM and trigger video generation.
@@ -1388,11 +1982,15 @@ def upload_papers_for_week(
     3. Trigger video generation (don't wait for completion)
     4. Move to next paper
     
+    Up to `concurrency` PDFs are uploaded in their own tabs before the
+    first ingestion is awaited, so NotebookLM parses them in parallel.
+    
     Args:
         week_id: Week identifier (e.g., "2026-02")
         headless: Run browser in headless mode
         max_papers: Maximum papers to process
         force: Force re-upload even if already done (process PDF_OK, NBLM_OK, VIDEO_OK)
+        concurrency: Papers in flight at once (one tab each)
         
     Returns:
         Tuple of (success_count, failure_count)
@@ -1416,82 +2014,15 @@ def upload_papers_for_week(
         logger.info(f"No papers ready for upload in week {week_id}")
         return 0, 0
     
-    success = 0
-    failure = 0
-    
     with NotebookLMBot(headless=headless) as bot:
-        for paper in papers:
-            if not paper.pdf_path:
-                logger.warning(f"Paper {paper.paper_id} has no PDF path")
-                failure += 1
-                continue
-            
-            pdf_path = Path(paper.pdf_path)
-            if not pdf_path.exists():
-                logger.warning(f"PDF not found for {paper.paper_id}: {pdf_path}")
-                failure += 1
-                continue
-            
-            try:
-                logger.info(f"Processing paper: {paper.paper_id}")
-                
-                # Navigate to NotebookLM
-                if not bot.navigate_to_notebooklm():
-                    if not bot.wait_for_login():
-                        update_status(paper.paper_id, Status.ERROR, "Login failed")
-                        failure += 1
-                        continue
-                
-                # Create notebook with week prefix
-                notebook_name = f"{week_id}_{paper.paper_id}"
-                if not bot.create_notebook(notebook_name):
-                    update_status(paper.paper_id, Status.ERROR, "Failed to create notebook")
-                    failure += 1
-                    continue
-                
-                # Upload PDF
-                if not bot.upload_pdf(pdf_path):
-                    update_status(paper.paper_id, Status.ERROR, "Failed to upload PDF")
-                    failure += 1
-                    continue
-                
-                # Rename notebook (in case it was created with default name)
-                bot.rename_notebook(notebook_name)
-                
-                # Extract summary from the auto-generated dialogue
-                summary = bot.extract_summary()
-                if summary:
-                    logger.info(f"Extracted summary for {paper.paper_id}: {summary[:100]}...")
-                
-                # Navigate to Studio and trigger video generation
-                if not bot.navigate_to_studio():
-                    logger.warning(f"Could not navigate to Studio for {paper.paper_id}")
-                
-                if not bot.generate_video_overview():
-                    logger.warning(f"Could not trigger video generation for {paper.paper_id}")
-                
-                # Also trigger slides/presentation generation
-                if not bot.generate_slides():
-                    logger.warning(f"Could not trigger slides generation for {paper.paper_id}")
-                
-                # Update status to UPLOADED (video and slides are generating)
-                upsert_paper(
-                    paper_id=paper.paper_id,
-                    week_id=week_id,
-                    notebooklm_note_name=notebook_name,
-                    summary=summary,  # Save extracted summary
-                    status=Status.NBLM_OK  # Use NBLM_OK to indicate uploaded
-                )
-                
-                logger.info(f"Successfully uploaded and triggered video+slides for: {paper.paper_id}")
-                success += 1
-                
-            except Exception as e:
-                error_msg = f"Error uploading paper {paper.paper_id}: {e}"
-                logger.error(error_msg)
-                bot.take_screenshot(f"upload_error_{paper.paper_id}")
-                update_status(paper.paper_id, Status.ERROR, error=error_msg, increment_retry=True)
-                failure += 1
+        ready = list(_papers_with_pdf(papers))
+        failure = len(papers) - len(ready)
+        success, batch_failure = _run_in_tab_batches(
+            bot, ready, concurrency,
+            start=lambda item: _start_upload(bot, item[0].paper_id, item[1], week_id),
+            finish=lambda item: _finish_upload(bot, item[0].paper_id, week_id),
+        )
+        failure += batch_failure
     
     logger.info(f"Upload complete for week {week_id}: {success} success, {failure} failed")
     return success, failure
@@ -1567,165 +2098,175 @@ def download_videos_for_week(
                 else:
                     logger.warning(f"Video file for {paper.paper_id} is too small ({file_size} bytes), will re-download")
             
-            try:
-                logger.info(f"Downloading video for: {paper.paper_id}")
-                
-                # Navigate to NotebookLM home
-                if not bot.navigate_to_notebooklm():
-                    if not bot.wait_for_login():
-                        update_status(paper.paper_id, Status.ERROR, "Login failed")
-                        failure += 1
-                        continue
-                
-                # Find and click on the notebook by name
-                # NotebookLM uses mat-card elements with a button.primary-action-button inside
-                time.sleep(3)  # Wait for notebooks to load
-                
-                notebook_found = False
-                
+            with bot.new_paper_page():
                 try:
-                    # Method 1: Find mat-card containing the notebook name and click its action button
-                    card = bot.page.locator(f'mat-card:has-text("{notebook_name}")')
-                    if card.count() > 0:
-                        # Click the primary action button inside the card
-                        action_btn = card.first.locator('button.primary-action-button')
-                        if action_btn.count() > 0:
-                            action_btn.first.click()
-                            time.sleep(3)
-                            if "notebook" in bot.page.url:
-                                logger.info(f"Opened notebook: {notebook_name}")
-                                notebook_found = True
-                except Exception as e:
-                    logger.debug(f"mat-card click failed: {e}")
-                
-                if not notebook_found:
+                    logger.info(f"Downloading video for: {paper.paper_id}")
+                    
+                    # Navigate to NotebookLM home
+                    if not bot.navigate_to_notebooklm():
+                        if not bot.wait_for_login():
+                            update_status(paper.paper_id, Status.ERROR, "Login failed")
+                            failure += 1
+                            continue
+                    
+                    # Find and click on the notebook by name
+                    # NotebookLM uses mat-card elements with a button.primary-action-button inside
                     try:
-                        # Method 2: Try clicking anywhere on the mat-card
+                        # Wait for the notebook list to render this card
+                        bot.page.locator(f'mat-card:has-text("{notebook_name}")').first.wait_for(
+                            state="visible", timeout=10000
+                        )
+                    except PlaywrightTimeout:
+                        logger.debug(f"Notebook card not visible yet: {notebook_name}")
+                    
+                    notebook_found = False
+                    
+                    try:
+                        # Method 1: Find mat-card containing the notebook name and click its action button
                         card = bot.page.locator(f'mat-card:has-text("{notebook_name}")')
                         if card.count() > 0:
-                            card.first.click()
-                            time.sleep(3)
-                            if "notebook" in bot.page.url:
-                                logger.info(f"Opened notebook via card click: {notebook_name}")
-                                notebook_found = True
+                            # Click the primary action button inside the card
+                            action_btn = card.first.locator('button.primary-action-button')
+                            if action_btn.count() > 0:
+                                action_btn.first.click()
+                                if bot._opened_notebook():
+                                    logger.info(f"Opened notebook: {notebook_name}")
+                                    notebook_found = True
                     except Exception as e:
-                        logger.debug(f"Card direct click failed: {e}")
-                
-                if not notebook_found:
+                        logger.debug(f"mat-card click failed: {e}")
+                    
+                    if not notebook_found:
+                        try:
+                            # Method 2: Try clicking anywhere on the mat-card
+                            card = bot.page.locator(f'mat-card:has-text("{notebook_name}")')
+                            if card.count() > 0:
+                                card.first.click()
+                                if bot._opened_notebook():
+                                    logger.info(f"Opened notebook via card click: {notebook_name}")
+                                    notebook_found = True
+                        except Exception as e:
+                            logger.debug(f"Card direct click failed: {e}")
+                    
+                    if not notebook_found:
+                        try:
+                            # Method 3: Fallback - find by text and force click
+                            text_elem = bot.page.get_by_text(notebook_name, exact=True)
+                            if text_elem.count() > 0:
+                                text_elem.first.click(force=True)
+                                if bot._opened_notebook():
+                                    logger.info(f"Opened notebook via text click: {notebook_name}")
+                                    notebook_found = True
+                        except Exception as e:
+                            logger.debug(f"Text click failed: {e}")
+                    
+                    if not notebook_found:
+                        logger.warning(f"Notebook not found or could not click: {notebook_name}")
+                        bot.take_screenshot(f"notebook_not_found_{paper.paper_id}")
+                        failure += 1
+                        continue
+                    
+                    # Check if video is ready
+                    # Videos appear in Studio panel, below the creation buttons
+                    # May need to scroll down the Studio panel to see them
                     try:
-                        # Method 3: Fallback - find by text and force click
-                        text_elem = bot.page.get_by_text(notebook_name, exact=True)
-                        if text_elem.count() > 0:
-                            text_elem.first.click(force=True)
-                            time.sleep(3)
-                            if "notebook" in bot.page.url:
-                                logger.info(f"Opened notebook via text click: {notebook_name}")
-                                notebook_found = True
-                    except Exception as e:
-                        logger.debug(f"Text click failed: {e}")
-                
-                if not notebook_found:
-                    logger.warning(f"Notebook not found or could not click: {notebook_name}")
-                    bot.take_screenshot(f"notebook_not_found_{paper.paper_id}")
-                    failure += 1
-                    continue
-                
-                # Check if video is ready
-                # Videos appear in Studio panel, below the creation buttons
-                # May need to scroll down the Studio panel to see them
-                time.sleep(2)  # Wait for page to load
-                
-                video_ready = False
-                
-                # Try scrolling the Studio panel to reveal generated items
-                try:
-                    studio_panel = bot.page.locator('[class*="studio"], [class*="right-panel"]').first
-                    if studio_panel.count() > 0:
-                        # Scroll down to see generated items
-                        studio_panel.evaluate("el => el.scrollTop = el.scrollHeight")
-                        time.sleep(1)
-                except Exception:
-                    pass
-                
-                # Method 1: Look for artifact buttons (generated items have this class)
-                try:
-                    artifacts = bot.page.locator('.artifact-button-content, button[class*="artifact"]')
-                    if artifacts.count() > 0:
-                        video_ready = True
-                        logger.info("Video is ready for download (artifact found)")
-                except Exception:
-                    pass
-                
-                # Method 2: Look for timestamps (分钟, 小时, 刚刚)
-                if not video_ready:
+                        # Wait for the Studio panel to show items (or a generating state)
+                        bot.page.locator(STUDIO_SETTLED_SELECTOR).first.wait_for(
+                            state="attached", timeout=15000
+                        )
+                    except PlaywrightTimeout:
+                        logger.debug("Studio panel shows no generated items yet")
+                    
+                    video_ready = False
+                    
+                    # Try scrolling the Studio panel to reveal generated items
                     try:
-                        video_items = bot.page.locator('text=/\\d+ 分钟|\\d+ 小时|刚刚/')
-                        if video_items.count() > 0:
-                            video_ready = True
-                            logger.info("Video is ready for download (timestamp found)")
+                        studio_panel = bot.page.locator('[class*="studio"], [class*="right-panel"]').first
+                        if studio_panel.count() > 0:
+                            # Scroll down to see generated items
+                            studio_panel.evaluate("el => el.scrollTop = el.scrollHeight")
                     except Exception:
                         pass
-                
-                # Method 3: Look for play button in Studio area
-                if not video_ready:
+                    
+                    # Method 1: Look for artifact buttons (generated items have this class)
                     try:
-                        play_btn = bot.page.locator('[aria-label="播放"]')
-                        if play_btn.count() > 0 and play_btn.first.is_visible():
+                        artifacts = bot.page.locator('.artifact-button-content, button[class*="artifact"]')
+                        if artifacts.count() > 0:
                             video_ready = True
-                            logger.info("Video is ready for download (play button found)")
-                    except Exception:
-                        pass
-                
-                if not video_ready:
-                    # Check if still generating
-                    try:
-                        generating = bot.page.get_by_text("正在生成", exact=False)
-                        if generating.count() > 0 and generating.first.is_visible():
-                            logger.info(f"Video still generating for {paper.paper_id}, will retry later")
-                            failure += 1
-                            continue
+                            logger.info("Video is ready for download (artifact found)")
                     except Exception:
                         pass
                     
-                    logger.warning(f"Video not found for {paper.paper_id}")
-                    bot.take_screenshot(f"video_not_found_{paper.paper_id}")
-                    failure += 1
-                    continue
-                
-                # Download video
-                video_dir = ensure_dir(VIDEO_DIR / get_period_subdir(week_id))
-                
-                result = bot.download_video(paper.paper_id, video_dir)
-                if not result:
-                    logger.error(f"Failed to download video for {paper.paper_id}")
+                    # Method 2: Look for timestamps (分钟, 小时, 刚刚)
+                    if not video_ready:
+                        try:
+                            video_items = bot.page.locator('text=/\\d+ 分钟|\\d+ 小时|刚刚/')
+                            if video_items.count() > 0:
+                                video_ready = True
+                                logger.info("Video is ready for download (timestamp found)")
+                        except Exception:
+                            pass
+                    
+                    # Method 3: Look for play button in Studio area
+                    if not video_ready:
+                        try:
+                            play_btn = bot.page.locator('[aria-label="播放"]')
+                            if play_btn.count() > 0 and play_btn.first.is_visible():
+                                video_ready = True
+                                logger.info("Video is ready for download (play button found)")
+                        except Exception:
+                            pass
+                    
+                    if not video_ready:
+                        # Check if still generating
+                        try:
+                            generating = bot.page.get_by_text("正在生成", exact=False)
+                            if generating.count() > 0 and generating.first.is_visible():
+                                logger.info(f"Video still generating for {paper.paper_id}, will retry later")
+                                failure += 1
+                                continue
+                        except Exception:
+                            pass
+                        
+                        logger.warning(f"Video not found for {paper.paper_id}")
+                        bot.take_screenshot(f"video_not_found_{paper.paper_id}")
+                        failure += 1
+                        continue
+                    
+                    # Download video
+                    video_dir = ensure_dir(VIDEO_DIR / get_period_subdir(week_id))
+                    
+                    result = bot.download_video(paper.paper_id, video_dir)
+                    if not result:
+                        logger.error(f"Failed to download video for {paper.paper_id}")
+                        failure += 1
+                        continue
+                    
+                    # Also try to download slides if available
+                    slides_dir = ensure_dir(SLIDES_DIR / get_period_subdir(week_id))
+                    slides_result = bot.download_slides(paper.paper_id, slides_dir)
+                    if slides_result:
+                        logger.info(f"Successfully downloaded slides for: {paper.paper_id}")
+                    else:
+                        logger.debug(f"No slides found for {paper.paper_id} (this is optional)")
+                    
+                    # Update status to VIDEO_OK with actual downloaded paths
+                    upsert_paper(
+                        paper_id=paper.paper_id,
+                        week_id=week_id,
+                        video_path=str(result),
+                        slides_path=str(slides_result) if slides_result else None,
+                        status=Status.VIDEO_OK
+                    )
+                    
+                    logger.info(f"Successfully downloaded video for: {paper.paper_id}")
+                    success += 1
+                    
+                except Exception as e:
+                    error_msg = f"Error downloading video for {paper.paper_id}: {e}"
+                    logger.error(error_msg)
+                    bot.take_screenshot(f"download_error_{paper.paper_id}")
+                    bot.save_trace(f"download_error_{paper.paper_id}")
                     failure += 1
-                    continue
-                
-                # Also try to download slides if available
-                slides_dir = ensure_dir(SLIDES_DIR / get_period_subdir(week_id))
-                slides_result = bot.download_slides(paper.paper_id, slides_dir)
-                if slides_result:
-                    logger.info(f"Successfully downloaded slides for: {paper.paper_id}")
-                else:
-                    logger.debug(f"No slides found for {paper.paper_id} (this is optional)")
-                
-                # Update status to VIDEO_OK with actual downloaded paths
-                upsert_paper(
-                    paper_id=paper.paper_id,
-                    week_id=week_id,
-                    video_path=str(result),
-                    slides_path=str(slides_result) if slides_result else None,
-                    status=Status.VIDEO_OK
-                )
-                
-                logger.info(f"Successfully downloaded video for: {paper.paper_id}")
-                success += 1
-                
-            except Exception as e:
-                error_msg = f"Error downloading video for {paper.paper_id}: {e}"
-                logger.error(error_msg)
-                bot.take_screenshot(f"download_error_{paper.paper_id}")
-                failure += 1
     
     logger.info(f"Download complete for week {week_id}: {success} success, {failure} failed, {skipped} skipped")
     return success, failure, skipped
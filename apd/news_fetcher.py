@@ -16,7 +16,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from .config import ContentType, NEWS_SOURCES, REQUEST_TIMEOUT, USER_AGENT
-from .db import upsert_paper
+from .db import upsert_paper, upsert_papers_bulk
 from .utils import get_logger
 
 logger = get_logger()
@@ -64,8 +64,8 @@ def fetch_daily_news(
         logger.error(f"Source {source} not implemented yet")
         return []
 
-    # 存入数据库
-    saved_count = 0
+    # 存入数据库（整批一次事务写入）
+    records = []
     for news in news_list:
         try:
             # 评估质量
@@ -76,7 +76,7 @@ def fetch_daily_news(
                 hot_value=news.get('hot_value')
             )
 
-            upsert_paper(
+            records.append(dict(
                 paper_id=news['id'],
                 week_id=date,  # 使用日期作为 week_id
                 title=news['title'],
@@ -94,10 +94,22 @@ def fetch_daily_news(
                 filtered_out=0 if score.passed else 1,
                 filter_reason=None if score.passed else "质量评分低于阈值",
                 evaluated_at=now_iso()
-            )
-            saved_count += 1
+            ))
         except Exception as e:
-            logger.error(f"Failed to save news {news['title']}: {e}")
+            logger.error(f"Failed to evaluate news {news.get('title')}: {e}")
+
+    saved_count = 0
+    try:
+        saved_count = upsert_papers_bulk(records)
+    except Exception as e:
+        # 整批失败时逐条写入，只丢弃真正出错的记录
+        logger.warning(f"Batch save failed ({e}), falling back to per-news upsert")
+        for record in records:
+            try:
+                upsert_paper(**record)
+                saved_count += 1
+            except Exception as e:
+                logger.error(f"Failed to save news {record['title']}: {e}")
 
     logger.info(f"Saved {saved_count}/{len(news_list)} news to database")
     return news_list
@@ -20,7 +20,7 @@ from .config import (
     USER_AGENT,
 )
 from .db import get_paper, update_status, upsert_paper
-from .utils import ensure_dir, get_logger, get_period_subdir, sha256_file
+from .utils import ensure_dir, get_logger, get_period_subdir, sha256_file_digest
 
 logger = get_logger()
 
@@ -53,7 +53,7 @@ def download_pdf(
     
     # Check for existing file
     if pdf_path.exists() and not force:
-        existing_sha = sha256_file(pdf_path)
+        existing_sha = sha256_file_digest(pdf_path)
         
         # If we have a record with matching SHA, skip
         if paper and paper.pdf_sha256 == existing_sha:
@@ -90,7 +90,7 @@ def download_pdf(
                     f.write(chunk)
         
         # Compute hash
-        pdf_sha256 = sha256_file(pdf_path)
+        pdf_sha256 = sha256_file_digest(pdf_path)
         
         # Update database
         upsert_paper(
@@ -132,12 +132,9 @@ def download_pdfs_for_week(
     Returns:
         Tuple of (success_count, failure_count)
     """
-    from .db import list_papers
+    from .db import iter_papers
     
-    papers = list_papers(week_id=week_id)
-    
-    if max_papers:
-        papers = papers[:max_papers]
+    papers = iter_papers(week_id=week_id, limit=max_papers)
     
     success = 0
     failure = 0
@@ -12,7 +12,7 @@ from datetime import datetime, timedelta
 import numpy as np
 
 from .config import RecommendationConfig
-from .db import get_connection, Paper
+from .db import get_connection, paper_converter, Paper, week_id_prefix_clause
 from .utils import now_iso
 
 logger = logging.getLogger(__name__)
@@ -41,9 +41,9 @@ class Recommender:
         """延迟加载Sentence-BERT模型"""
         if self.model is None:
             try:
-                from sentence_transformers import SentenceTransformer
+                from .embeddings import get_embedding_model
                 logger.info(f"Loading embedding model: {self.config.EMBEDDING_MODEL}")
-                self.model = SentenceTransformer(self.config.EMBEDDING_MODEL)
+                self.model = get_embedding_model(self.config.EMBEDDING_MODEL)
             except ImportError:
                 logger.warning("sentence-transformers not installed, semantic features disabled")
                 self.model = None
@@ -104,10 +104,11 @@ class Recommender:
 
             cursor.execute(query, params)
             rows = cursor.fetchall()
+            from_row = paper_converter(cursor)
 
         results = []
         for row in rows:
-            paper = Paper(**dict(row))
+            paper = from_row(row)
             score = (
                 (paper.quality_score or 0) * self.config.POPULAR_QUALITY_WEIGHT +
                 (paper.recency_score or 0) * self.config.POPULAR_RECENCY_WEIGHT +
@@ -139,8 +140,8 @@ class Recommender:
             # YYYY-WNN format
             return "week_id = ?", [week_id]
         else:
-            # YYYY-MM-DD format
-            return "week_id LIKE ?", [f"%{week_id}%"]
+            # YYYY-MM-DD / YYYY-MM 等前缀：GLOB 前缀匹配可走 week_id 索引（LIKE '%..%' 无法使用索引）
+            return week_id_prefix_clause(week_id)
 
     def recommend_similar(
         self,
@@ -167,7 +168,7 @@ class Recommender:
             if not row:
                 return []
 
-            target_paper = Paper(**dict(row))
+            target_paper = paper_converter(cursor)(row)
 
             # 获取候选论文
             cursor.execute("""
@@ -177,7 +178,8 @@ class Recommender:
                   AND title IS NOT NULL
                 LIMIT 100
             """, (paper_id,))
-            candidates = [Paper(**dict(row)) for row in cursor.fetchall()]
+            from_row = paper_converter(cursor)
+            candidates = [from_row(row) for row in cursor.fetchall()]
 
         if not candidates:
             return []
@@ -230,7 +232,7 @@ class Recommender:
             if not row:
                 return []
 
-            target_paper = Paper(**dict(row))
+            target_paper = paper_converter(cursor)(row)
 
             cursor.execute("""
                 SELECT * FROM papers
@@ -239,7 +241,8 @@ class Recommender:
                   AND title IS NOT NULL
                 LIMIT 50
             """, (paper_id,))
-            candidates = [Paper(**dict(row)) for row in cursor.fetchall()]
+            from_row = paper_converter(cursor)
+            candidates = [from_row(row) for row in cursor.fetchall()]
 
         dedup = Deduplicator()
         results = []
@@ -58,21 +58,21 @@ def get_logger() -> logging.Logger:
     return logger
 
 
-def sha256_file(file_path: Path) -> str:
+def sha256_file_digest(file_path: Path) -> bytes:
     """
-    Compute SHA256 hash of a file.
+    Compute the raw SHA256 digest of a file.
     
     Args:
         file_path: Path to the file
         
     Returns:
-        Hexadecimal SHA256 hash string
+        32-byte SHA256 digest
     """
     sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
         for chunk in iter(lambda: f.read(8192), b""):
             sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+    return sha256_hash.digest()
 
 
 def ensure_dir(path: Path) -> Path:
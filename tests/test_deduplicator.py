@@ -9,6 +9,9 @@ import io
 if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+import pytest
+
+from apd.config import DeduplicationConfig
 from apd.deduplicator import Deduplicator, DuplicateGroup
 
 
@@ -230,6 +233,55 @@ def test_deduplication_stats():
     print(f"  Deduplication rate: {stats['deduplication_rate']*100:.1f}%")
 
 
+def test_lsh_blocking_matches_exhaustive():
+    """测试LSH分桶与全量比较结果一致"""
+
+    class BlockingConfig(DeduplicationConfig):
+        LSH_MIN_PAPERS = 0
+
+    papers = [
+        {'paper_id': 'p1', 'title': 'Attention Is All You Need', 'pdf_url': '', 'abstract': ''},
+        {'paper_id': 'p2', 'title': 'Attention is all you need', 'pdf_url': '', 'abstract': ''},
+        {'paper_id': 'p3', 'title': 'Scaling Laws for Neural Language Models',
+         'pdf_url': 'https://arxiv.org/abs/2001.08361', 'abstract': ''},
+        {'paper_id': 'p4', 'title': 'Completely Different Title',
+         'pdf_url': 'https://arxiv.org/pdf/2001.08361.pdf', 'abstract': ''},
+        {'paper_id': 'p5', 'title': 'Deep Residual Learning', 'pdf_url': '', 'abstract': ''},
+    ]
+
+    exhaustive = Deduplicator().find_duplicates(papers, use_semantic=False)
+    blocked = Deduplicator(BlockingConfig).find_duplicates(papers, use_semantic=False)
+
+    assert blocked.duplicates_removed == exhaustive.duplicates_removed == 2
+    assert (
+        sorted(g.canonical_paper_id for g in blocked.duplicate_groups)
+        == sorted(g.canonical_paper_id for g in exhaustive.duplicate_groups)
+    )
+
+    print("✓ LSH blocking tests passed")
+
+
+def test_jaccard_matrix_numba_matches_pairwise():
+    """测试numba Jaccard矩阵与逐对计算结果一致"""
+    pytest.importorskip("numba")
+    dedup = Deduplicator()
+    titles = ['attention is all you need', 'attention is what you need', 'deep residual learning', '']
+    token_sets = [frozenset(t.split()) for t in titles]
+
+    matrix = dedup._build_jaccard_matrix(token_sets)
+    assert matrix is not None
+
+    for i, words1 in enumerate(token_sets):
+        for j, words2 in enumerate(token_sets):
+            if i == j or not words1 or not words2:
+                assert matrix[i, j] == 1.0
+            else:
+                expected = len(words1 & words2) / len(words1 | words2)
+                assert abs(matrix[i, j] - expected) < 1e-6
+
+    print("✓ Jaccard matrix tests passed")
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("去重系统单元测试")
@@ -242,6 +294,8 @@ if __name__ == "__main__":
     test_find_duplicates_title_similarity()
     test_no_duplicates()
     test_deduplication_stats()
+    test_lsh_blocking_matches_exhaustive()
+    test_jaccard_matrix_numba_matches_pairwise()
 
     print("\n" + "=" * 60)
     print("所有测试通过! ✅")
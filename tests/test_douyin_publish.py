@@ -0,0 +1,78 @@
+"""
+抖音批量发布（CLI）单元测试
+"""
+
+import sys
+import io
+
+# Fix encoding for Windows
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+from click.testing import CliRunner
+
+import apd.db
+import apd.douyin_bot
+from apd.cli import main
+from apd.db import Paper
+
+
+class FakeDouyinBot:
+    """记录 publish_many 调用的假浏览器会话"""
+    calls = []
+
+    def __init__(self, headless=True):
+        self.headless = headless
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def is_logged_in(self):
+        return True
+
+    def publish_many(self, videos, skip_login_check=False, auto_publish=False,
+                     on_start=None, on_result=None):
+        FakeDouyinBot.calls.append((videos, skip_login_check, auto_publish))
+        results = [True, False][:len(videos)]
+        for idx, ok in enumerate(results):
+            on_start(idx)
+            on_result(idx, ok)
+        return results
+
+
+def test_publish_douyin_batches_videos(tmp_path, monkeypatch):
+    """测试 publish-douyin 跳过无视频的论文，并在一个会话中批量发布"""
+    video_a = tmp_path / "a.mp4"
+    video_b = tmp_path / "b.mp4"
+    video_a.write_bytes(b"")
+    video_b.write_bytes(b"")
+    papers = [
+        Paper(paper_id="2601.00001", week_id="2026-03", title="Paper A", video_path=str(video_a)),
+        Paper(paper_id="2601.00002", week_id="2026-03", title="Paper B", video_path=None),
+        Paper(paper_id="2601.00003", week_id="2026-03", title="Paper C", video_path=str(video_b), summary="摘要"),
+    ]
+    monkeypatch.setattr(apd.db, "list_papers", lambda **kwargs: papers)
+    monkeypatch.setattr(apd.douyin_bot, "DouyinBot", FakeDouyinBot)
+    FakeDouyinBot.calls.clear()
+
+    result = CliRunner().invoke(main, ["publish-douyin", "--week", "2026-03", "--auto-publish"])
+
+    assert result.exit_code == 0, result.output
+    assert len(FakeDouyinBot.calls) == 1
+    videos, skip_login_check, auto_publish = FakeDouyinBot.calls[0]
+    assert [v[0] for v in videos] == [video_a, video_b]
+    assert videos[1][2].startswith("摘要")
+    assert skip_login_check is True and auto_publish is True
+    assert "Skipping 2601.00002" in result.output
+    assert "Processing video 2/2" in result.output
+    assert "Uploading 2601.00003: Paper C" in result.output
+    # 每个视频的结果紧跟在它的上传提示之后输出
+    assert result.output.index("Uploading 2601.00001") < result.output.index(
+        "Successfully published 2601.00001") < result.output.index("Uploading 2601.00003")
+    assert "Successfully published 2601.00001" in result.output
+    assert "Failed to publish 2601.00003" in result.output
+    assert "1/3 successful" in result.output
+    print("✓ publish-douyin batches videos through publish_many")
@@ -242,6 +242,34 @@ def test_save_recommendation():
     print("✓ Save recommendation test passed")
 
 
+def test_popular_week_prefix():
+    """测试非 W 格式的 week_id 按前缀匹配（2026-02 包含 2026-02-DD）"""
+    for paper_id, week_id in [
+        ("test_rec_prefix_1", "2031-02"),
+        ("test_rec_prefix_2", "2031-02-14"),
+        ("test_rec_prefix_3", "2031-03-01"),
+    ]:
+        upsert_paper(
+            paper_id=paper_id,
+            week_id=week_id,
+            title=f"Prefix matching paper {paper_id}",
+            quality_score=70.0,
+            filtered_out=0,
+        )
+
+    try:
+        recommender = Recommender(user_id="test_prefix")
+        results = recommender.recommend_popular(week_id="2031-02", limit=10)
+        paper_ids = {r.paper_id for r in results}
+
+        assert paper_ids == {"test_rec_prefix_1", "test_rec_prefix_2"}, paper_ids
+    finally:
+        with get_connection() as conn:
+            conn.execute("DELETE FROM papers WHERE paper_id LIKE 'test_rec_prefix_%'")
+
+    print("✓ Week prefix matching test passed")
+
+
 def cleanup_test_data():
     """清理测试数据"""
     print("\n" + "="*60)
@@ -289,6 +317,7 @@ if __name__ == "__main__":
         test_collaborative_filtering()
         test_hybrid_recommendation()
         test_save_recommendation()
+        test_popular_week_prefix()
 
     finally:
         # 清理测试数据